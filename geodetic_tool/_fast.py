@@ -0,0 +1,83 @@
+"""
+Fast Numeric Kernels
+
+Compiled versions of hot numeric loops. Numba is optional: without it the
+same functions are provided as vectorized NumPy code. numba is imported
+and the kernels compiled on the first call, not when this module loads.
+"""
+import numpy as np
+
+
+def _height_misclosures_numpy(observed_dh, heights, to_idx, from_idx):
+    """NumPy fallback for height_misclosures."""
+    return observed_dh - (heights[to_idx] - heights[from_idx])
+
+
+def _apply_height_corrections_numpy(heights, corrections):
+    """NumPy fallback for apply_height_corrections."""
+    heights[:corrections.size] += corrections
+    return float(np.abs(corrections).max()) if corrections.size else 0.0
+
+
+# Kernel implementations: None until first needed
+_kernels = None
+
+
+def _get_kernels():
+    """
+    Return the (height_misclosures, apply_height_corrections) implementations.
+
+    On the first call numba is imported and the kernels compiled (cached on
+    disk with cache=True), so importing this module, and the engine with it,
+    never pays numba's import or compile cost. Without numba the NumPy
+    fallbacks are used.
+    """
+    global _kernels
+    if _kernels is None:
+        try:
+            import numba
+        except ImportError:  # optional JIT compiler
+            _kernels = (_height_misclosures_numpy, _apply_height_corrections_numpy)
+        else:
+            @numba.njit('f8[:](f8[:], f8[:], intp[:], intp[:])', cache=True)
+            def misclosures_kernel(observed_dh, heights, to_idx, from_idx):
+                out = np.empty(observed_dh.size)
+                for i in range(observed_dh.size):
+                    out[i] = observed_dh[i] - (heights[to_idx[i]] - heights[from_idx[i]])
+                return out
+
+            @numba.njit('f8(f8[:], f8[:])', cache=True)
+            def corrections_kernel(heights, corrections):
+                max_correction = 0.0
+                for j in range(corrections.size):
+                    heights[j] += corrections[j]
+                    max_correction = max(max_correction, abs(corrections[j]))
+                return max_correction
+
+            _kernels = (misclosures_kernel, corrections_kernel)
+    return _kernels
+
+
+def height_misclosures(observed_dh, heights, to_idx, from_idx):
+    """
+    Observed minus computed height differences, L = dH - (H_to - H_from).
+
+    Args:
+        observed_dh: Observed height differences in meters
+        heights: Current heights of all points in meters
+        to_idx, from_idx: Index into heights of each observation's ends
+
+    Returns:
+        Array of misclosures in meters
+    """
+    return _get_kernels()[0](observed_dh, heights, to_idx, from_idx)
+
+
+def apply_height_corrections(heights, corrections):
+    """
+    Add corrections to the leading (unknown) entries of heights in place.
+
+    Returns:
+        Largest absolute correction, for the convergence test
+    """
+    return _get_kernels()[1](heights, corrections)
@@ -6,23 +6,19 @@ Command-line interface for the geodetic automation tool.
 import argparse
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ..parsers import create_parser, detect_file_format
-from ..parsers.base_parser import FileFormat
-from ..validators import validate_line, LevelingValidator, BatchValidator
-from ..engine import (
-    calculate_line_totals,
-    create_measurement_summary,
-    LeastSquaresAdjuster
-)
-from ..exporters import export_fa0, export_fa1, export_fteg, export_rez
-from ..config.models import LevelingLine, Benchmark, MeasurementSummary
-from ..config.settings import get_settings, is_benchmark
+from ..config.models import LevelingLine, Benchmark, LineStatus
+from ..config.settings import is_benchmark
+
+# Validators, engine and exporters (and NumPy behind them) are imported
+# inside the commands that use them, so `--help` and `info` start quickly.
 
 
 # Configure logging
@@ -33,41 +29,73 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def parse_files(filepaths: List[str]) -> List[LevelingLine]:
+# Below this many files the process pool start-up costs more than it saves
+_PARALLEL_PARSE_MIN_FILES = 4
+
+
+def _parse_one(path: Path) -> Optional[LevelingLine]:
+    """
+    Parse a single geodetic data file.
+    
+    Runs in a worker process when parse_files() uses a process pool.
+    
+    Args:
+        path: Path of an existing file to parse
+        
+    Returns:
+        LevelingLine object, or None if the file could not be parsed
+    """
+    # Detect format and create parser
+    parser = create_parser(path)
+    if parser is None:
+        logger.warning("Unknown format: %s", path)
+        return None
+    
+    try:
+        line = parser.parse(path)
+        logger.info(
+            "Parsed %s: %s → %s, %d setups, %.2fm",
+            path.name, line.start_point, line.end_point,
+            line.num_setups, line.total_distance
+        )
+        return line
+    except Exception as e:
+        logger.error("Failed to parse %s: %s", path, e)
+        return None
+
+
+def parse_files(
+    filepaths: List[Union[str, Path]],
+    max_workers: Optional[int] = None
+) -> List[LevelingLine]:
     """
     Parse multiple geodetic data files.
     
+    Files are parsed in parallel worker processes when there are enough of
+    them to amortize the pool start-up; results keep the input order.
+    
     Args:
         filepaths: List of file paths to parse
+        max_workers: Number of worker processes (default: CPU count)
         
     Returns:
         List of LevelingLine objects
     """
-    lines = []
+    # Convert and check existence once, up front; workers get Path objects
+    existing = []
+    for path in map(Path, filepaths):
+        if path.exists():
+            existing.append(path)
+        else:
+            logger.warning("File not found: %s", path)
     
-    for fp in filepaths:
-        path = Path(fp)
-        if not path.exists():
-            logger.warning(f"File not found: {fp}")
-            continue
-        
-        # Detect format and create parser
-        parser = create_parser(fp)
-        if parser is None:
-            logger.warning(f"Unknown format: {fp}")
-            continue
-        
-        try:
-            line = parser.parse(fp)
-            lines.append(line)
-            logger.info(
-                f"Parsed {path.name}: {line.start_point} → {line.end_point}, "
-                f"{line.num_setups} setups, {line.total_distance:.2f}m"
-            )
-        except Exception as e:
-            logger.error(f"Failed to parse {fp}: {e}")
-    
-    return lines
+    if len(existing) < _PARALLEL_PARSE_MIN_FILES:
+        results = [_parse_one(path) for path in existing]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_parse_one, existing))
+    
+    return [line for line in results if line is not None]
 
 
 def validate_files(lines: List[LevelingLine]) -> dict:
@@ -80,46 +108,180 @@ def validate_files(lines: List[LevelingLine]) -> dict:
     Returns:
         Validation summary dictionary
     """
+    from ..validators import BatchValidator
+    
     validator = BatchValidator()
     results = validator.validate_batch(lines)
-    summary = validator.get_summary(results)
+    summary = validator.get_summary([result for _, result in results])
     
     # Log issues
-    for line, result in zip(lines, results):
+    for line, result in results:
         if not result.is_valid:
             for error in result.errors:
-                logger.error(f"{line.filename}: {error}")
+                logger.error("%s: %s", line.filename, error)
         for warning in result.warnings:
-            logger.warning(f"{line.filename}: {warning}")
+            logger.warning("%s: %s", line.filename, warning)
     
     return summary
 
 
 def print_summary(lines: List[LevelingLine]):
     """Print summary of parsed lines."""
-    print("\n" + "=" * 80)
-    print("LEVELING LINES SUMMARY")
-    print("=" * 80)
-    
-    print(f"\n{'Filename':<25}{'Start':<12}{'End':<12}{'Setups':>8}{'Distance':>12}{'dH':>12}{'Status':<15}")
-    print("-" * 90)
+    rows = [
+        "",
+        "=" * 80,
+        "LEVELING LINES SUMMARY",
+        "=" * 80,
+        "",
+        f"{'Filename':<25}{'Start':<12}{'End':<12}{'Setups':>8}{'Distance':>12}{'dH':>12}{'Status':<15}",
+        "-" * 90,
+    ]
     
+    # Compare by value: parsers load config.models under a second module name,
+    # so their LineStatus members are not identical to ours.
+    valid_val = LineStatus.VALID.value
+    valid = 0
     for line in lines:
-        status_icon = "✓" if line.status.value == "valid" else "✗"
-        print(
+        status_val = line.status.value
+        is_valid = status_val == valid_val
+        valid += is_valid
+        status_icon = "✓" if is_valid else "✗"
+        rows.append(
             f"{line.filename:<25}"
             f"{line.start_point:<12}"
             f"{line.end_point:<12}"
             f"{line.num_setups:>8}"
             f"{line.total_distance:>12.2f}"
             f"{line.total_height_diff:>12.5f}"
-            f"  {status_icon} {line.status.value}"
+            f"  {status_icon} {status_val}"
         )
     
-    print("-" * 90)
-    print(f"Total files: {len(lines)}")
-    valid = sum(1 for l in lines if l.status.value == "valid")
-    print(f"Valid: {valid}, Invalid: {len(lines) - valid}")
+    rows.append("-" * 90)
+    rows.append(f"Total files: {len(lines)}")
+    rows.append(f"Valid: {valid}, Invalid: {len(lines) - valid}")
+    
+    # Emit the whole report with a single write
+    sys.stdout.write("\n".join(rows) + "\n")
+
+
+def cmd_parse(args) -> int:
+    """Parse files, validate them and print a summary."""
+    lines = parse_files(args.files)
+    validate_files(lines)
+    print_summary(lines)
+    return 0
+
+
+def cmd_validate(args) -> int:
+    """Validate files and report the pass rate."""
+    lines = parse_files(args.files)
+    summary = validate_files(lines)
+    print_summary(lines)
+    print(f"\nValidation Summary:")
+    print(f"  Pass rate: {summary['pass_rate']*100:.1f}%")
+    print(f"  Endpoint issues: {summary['endpoint_issues']}")
+    print(f"  Naming issues: {summary['naming_issues']}")
+    return 0 if summary['invalid'] == 0 else 1
+
+
+def cmd_export(args) -> int:
+    """Export parsed lines to REZ/FTEG/FA0."""
+    from ..engine.height_calculator import create_measurement_summary
+    from ..exporters import export_fa0, export_fteg, export_rez
+    
+    lines = parse_files(args.files)
+    
+    if not lines:
+        logger.error("No valid files to export")
+        return 1
+    
+    # Create observations from lines
+    observations = [
+        create_measurement_summary(line, bf_diff_mm=0, year_month="0000")
+        for line in lines
+    ]
+    
+    # Output path
+    output = args.output or f"{args.project}.{args.format}"
+    
+    if args.format in ['rez', 'all']:
+        out_path = output if args.format == 'rez' else f"{args.project}.rez"
+        export_rez(out_path, lines, args.project)
+        logger.info("Exported REZ to %s", out_path)
+    
+    if args.format in ['fteg', 'all']:
+        out_path = output if args.format == 'fteg' else f"{args.project}.fteg"
+        export_fteg(out_path, observations)
+        logger.info("Exported FTEG to %s", out_path)
+    
+    if args.format in ['fa0', 'all']:
+        out_path = output if args.format == 'fa0' else f"{args.project}.fa0"
+        # Need benchmarks - extract unique ones from lines (first seen wins)
+        bm_map: Dict[str, Benchmark] = {}
+        for line in lines:
+            for pt in (line.start_point, line.end_point):
+                if pt not in bm_map and is_benchmark(pt):
+                    bm_map[pt] = Benchmark(pt, 0.0)
+        unique_benchmarks = list(bm_map.values())
+        
+        export_fa0(out_path, unique_benchmarks, observations, args.project)
+        logger.info("Exported FA0 to %s", out_path)
+    
+    return 0
+
+
+def cmd_info(args) -> int:
+    """Show information about a single file."""
+    path = Path(args.file)
+    if not path.exists():
+        logger.error("File not found: %s", args.file)
+        return 1
+    
+    file_format = detect_file_format(args.file)
+    print(f"\nFile: {path.name}")
+    print(f"Format: {file_format.value}")
+    print(f"Size: {path.stat().st_size} bytes")
+    
+    parser = create_parser(args.file)
+    if parser:
+        line = parser.parse(args.file)
+        print(f"\nStart Point: {line.start_point}")
+        print(f"End Point: {line.end_point}")
+        print(f"Method: {line.method}")
+        print(f"Setups: {line.num_setups}")
+        print(f"Total Distance: {line.total_distance:.2f} m")
+        print(f"Height Difference: {line.total_height_diff:.5f} m")
+        print(f"Status: {line.status.value}")
+        
+        if line.validation_errors:
+            print("\nValidation Errors:")
+            for err in line.validation_errors:
+                print(f"  ✗ {err}")
+    
+    return 0
+
+
+def cmd_geojson(args) -> int:
+    """Export parsed lines to GeoJSON for GIS."""
+    from ..gis.geojson_export import export_network_to_geojson
+    
+    lines = parse_files(args.files)
+    
+    if not lines:
+        logger.error("No valid files to export")
+        return 1
+    
+    output_files = export_network_to_geojson(
+        lines,
+        args.output,
+        args.project
+    )
+    
+    print(f"\nExported GeoJSON files:")
+    for key, path in output_files.items():
+        print(f"  {key}: {path}")
+    
+    return 0
 
 
 def main():
@@ -179,121 +341,18 @@ Examples:
         parser.print_help()
         return 1
     
-    if args.command == 'parse':
-        lines = parse_files(args.files)
-        validate_files(lines)
-        print_summary(lines)
-        return 0
-    
-    elif args.command == 'validate':
-        lines = parse_files(args.files)
-        summary = validate_files(lines)
-        print_summary(lines)
-        print(f"\nValidation Summary:")
-        print(f"  Pass rate: {summary['pass_rate']*100:.1f}%")
-        print(f"  Endpoint issues: {summary['endpoint_issues']}")
-        print(f"  Naming issues: {summary['naming_issues']}")
-        return 0 if summary['invalid'] == 0 else 1
-    
-    elif args.command == 'export':
-        lines = parse_files(args.files)
-        
-        if not lines:
-            logger.error("No valid files to export")
-            return 1
-        
-        # Create observations from lines
-        observations = [
-            create_measurement_summary(line, bf_diff_mm=0, year_month="0000")
-            for line in lines
-        ]
-        
-        # Output path
-        output = args.output or f"{args.project}.{args.format}"
-        
-        if args.format in ['rez', 'all']:
-            out_path = output if args.format == 'rez' else f"{args.project}.rez"
-            export_rez(out_path, lines, args.project)
-            logger.info(f"Exported REZ to {out_path}")
-        
-        if args.format in ['fteg', 'all']:
-            out_path = output if args.format == 'fteg' else f"{args.project}.fteg"
-            export_fteg(out_path, observations)
-            logger.info(f"Exported FTEG to {out_path}")
-        
-        if args.format in ['fa0', 'all']:
-            out_path = output if args.format == 'fa0' else f"{args.project}.fa0"
-            # Need benchmarks - extract from lines
-            benchmarks = []
-            for line in lines:
-                if is_benchmark(line.start_point):
-                    benchmarks.append(Benchmark(line.start_point, 0.0))
-                if is_benchmark(line.end_point):
-                    benchmarks.append(Benchmark(line.end_point, 0.0))
-            # Remove duplicates
-            seen = set()
-            unique_benchmarks = []
-            for bm in benchmarks:
-                if bm.point_id not in seen:
-                    seen.add(bm.point_id)
-                    unique_benchmarks.append(bm)
-            
-            export_fa0(out_path, unique_benchmarks, observations, args.project)
-            logger.info(f"Exported FA0 to {out_path}")
-        
-        return 0
-    
-    elif args.command == 'info':
-        path = Path(args.file)
-        if not path.exists():
-            logger.error(f"File not found: {args.file}")
-            return 1
-        
-        file_format = detect_file_format(args.file)
-        print(f"\nFile: {path.name}")
-        print(f"Format: {file_format.value}")
-        print(f"Size: {path.stat().st_size} bytes")
-        
-        parser = create_parser(args.file)
-        if parser:
-            line = parser.parse(args.file)
-            print(f"\nStart Point: {line.start_point}")
-            print(f"End Point: {line.end_point}")
-            print(f"Method: {line.method}")
-            print(f"Setups: {line.num_setups}")
-            print(f"Total Distance: {line.total_distance:.2f} m")
-            print(f"Height Difference: {line.total_height_diff:.5f} m")
-            print(f"Status: {line.status.value}")
-            
-            if line.validation_errors:
-                print("\nValidation Errors:")
-                for err in line.validation_errors:
-                    print(f"  ✗ {err}")
-        
-        return 0
-    
-    elif args.command == 'geojson':
-        from ..gis.geojson_export import export_network_to_geojson
-        
-        lines = parse_files(args.files)
-        
-        if not lines:
-            logger.error("No valid files to export")
-            return 1
-        
-        output_files = export_network_to_geojson(
-            lines,
-            args.output,
-            args.project
-        )
-        
-        print(f"\nExported GeoJSON files:")
-        for key, path in output_files.items():
-            print(f"  {key}: {path}")
-        
-        return 0
-    
-    return 0
+    dispatch = {
+        'parse': cmd_parse,
+        'validate': cmd_validate,
+        'export': cmd_export,
+        'info': cmd_info,
+        'geojson': cmd_geojson,
+    }
+    handler = dispatch.get(args.command)
+    if handler is None:
+        parser.print_help()
+        return 1
+    return handler(args)
 
 
 if __name__ == '__main__':
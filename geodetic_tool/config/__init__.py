@@ -8,7 +8,9 @@ from .settings import (
     Settings,
     is_benchmark,
     is_turning_point,
+    clear_point_id_caches,
     calculate_tolerance,
+    calculate_tolerances,
     FileFormat,
     MeasurementMethod
 )
@@ -31,7 +33,9 @@ __all__ = [
     'Settings',
     'is_benchmark',
     'is_turning_point',
+    'clear_point_id_caches',
     'calculate_tolerance',
+    'calculate_tolerances',
     'FileFormat',
     'MeasurementMethod',
     
@@ -8,10 +8,15 @@ This module implements the official Israeli Survey regulations for
 orthometric height measurement using ground-based methods.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+import sys
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from math import sqrt
+from typing import Optional, Dict, Any, Union
 from enum import Enum
 
+import numpy as np
+
 
 class LevelingClass(Enum):
     """
@@ -38,11 +43,24 @@ class MeasurementType(Enum):
     TRIGONOMETRIC = "trigonometric"  # איזון טריגונומטרי - Using total station
 
 
-@dataclass
+# Index of each measurement type into ClassParameters._max_sight
+_MTYPE_IDX = {MeasurementType.GEOMETRIC: 0, MeasurementType.TRIGONOMETRIC: 1}
+
+# Shared result of a passing validate_* check
+_OK: tuple[bool, Optional[str]] = (True, None)
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ClassParameters:
     """
     Parameters for a specific leveling class.
     All measurements follow Survey of Israel Directive ג2.
+
+    Instances are immutable; use update_class_parameters() to change the
+    registered parameters of a class.
     """
     # Basic identification
     class_level: LevelingClass
@@ -88,6 +106,30 @@ class ClassParameters:
     requires_calibration_monthly: bool = False  # Monthly calibration requirement
     requires_orthometric_correction: bool = False  # Gravity-based orthometric correction
 
+    # Derived: (geometric, trigonometric) sight limits, indexed via _MTYPE_IDX
+    _max_sight: tuple = field(init=False, repr=False, compare=False)
+    # Derived: required_method == "BFFB", so validate_method skips the string compare
+    _requires_bffb: bool = field(init=False, repr=False, compare=False)
+    # Derived: display dict, built once since the instance is immutable
+    _as_dict: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_max_sight', (
+            self.max_sight_distance_geometric_m,
+            self.max_sight_distance_trigonometric_m,
+        ))
+        object.__setattr__(self, '_requires_bffb', self.required_method == "BFFB")
+        object.__setattr__(self, '_as_dict', {
+            'class': self.class_name,
+            'tolerance_coeff_mm_per_sqrt_km': self.tolerance_coefficient,
+            'max_line_length_km': self.max_line_length_km,
+            'max_sight_geometric_m': self.max_sight_distance_geometric_m,
+            'max_sight_trigonometric_m': self.max_sight_distance_trigonometric_m,
+            'required_method': self.required_method,
+            'requires_double_run': self.requires_double_run,
+            'max_fb_diff_mm': self.max_fb_difference_mm,
+        })
+
     def get_tolerance_mm(self, distance_km: float) -> float:
         """
         Calculate allowable misclosure tolerance.
@@ -101,45 +143,71 @@ class ClassParameters:
         Formula (נספח ב', 4.1):
             Tolerance = coefficient × √(Distance_km)
         """
-        import math
-        return self.tolerance_coefficient * math.sqrt(distance_km)
+        return self.tolerance_coefficient * sqrt(distance_km)
+
+    def get_tolerance_mm_array(self, distances_km) -> np.ndarray:
+        """
+        Calculate allowable misclosure tolerances for many distances at once.
+
+        Args:
+            distances_km: Array-like of distances in kilometers
+
+        Returns:
+            Array of tolerances in millimeters
+        """
+        return self.tolerance_coefficient * np.sqrt(np.asarray(distances_km, dtype=np.float64))
 
     def validate_line_length(self, distance_km: float) -> tuple[bool, Optional[str]]:
         """Check if line length is within limits."""
         if self.max_line_length_km is None:
-            return True, None
+            return _OK
 
         if distance_km > self.max_line_length_km:
             return False, f"Line length {distance_km:.2f} km exceeds maximum {self.max_line_length_km} km for {self.class_name}"
-        return True, None
+        return _OK
 
     def validate_sight_distance(self, distance_m: float, measurement_type: MeasurementType) -> tuple[bool, Optional[str]]:
         """Check if sight distance is within limits."""
-        max_dist = (self.max_sight_distance_geometric_m if measurement_type == MeasurementType.GEOMETRIC
-                   else self.max_sight_distance_trigonometric_m)
+        max_dist = self._max_sight[_MTYPE_IDX.get(measurement_type, 1)]
 
         if distance_m > max_dist:
             return False, f"Sight distance {distance_m:.1f} m exceeds maximum {max_dist} m for {self.class_name} ({measurement_type.value})"
-        return True, None
+        return _OK
+
+    def validate_sight_distance_batch(self, distances_m: np.ndarray, mtype_idx: np.ndarray) -> np.ndarray:
+        """
+        Check many sight distances at once.
+
+        Args:
+            distances_m: Array of sight distances in meters
+            mtype_idx: Array of measurement type indices (0 = geometric, 1 = trigonometric)
+
+        Returns:
+            Boolean mask, True where the distance is within its limit
+        """
+        limits = np.where(np.asarray(mtype_idx) == 0, *self._max_sight)
+        return np.asarray(distances_m, dtype=np.float64) <= limits
 
     def validate_method(self, method: str) -> tuple[bool, Optional[str]]:
         """Check if measurement method meets requirements."""
-        if self.required_method == "BFFB" and method != "BFFB":
+        if self._requires_bffb and method != "BFFB":
             return False, f"{self.class_name} requires BFFB measurement method (got {method})"
-        return True, None
+        return _OK
+
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """Cached display dictionary (shared; do not modify)."""
+        return self._as_dict
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for export/display."""
-        return {
-            'class': self.class_name,
-            'tolerance_coeff_mm_per_sqrt_km': self.tolerance_coefficient,
-            'max_line_length_km': self.max_line_length_km,
-            'max_sight_geometric_m': self.max_sight_distance_geometric_m,
-            'max_sight_trigonometric_m': self.max_sight_distance_trigonometric_m,
-            'required_method': self.required_method,
-            'requires_double_run': self.requires_double_run,
-            'max_fb_diff_mm': self.max_fb_difference_mm,
-        }
+        return dict(self._as_dict)
+
+
+# Fields written to the user settings file (the Enum is not JSON-serializable)
+_SERIALIZABLE_FIELDS = tuple(
+    f.name for f in fields(ClassParameters) if f.init and f.name != 'class_level'
+)
 
 
 # ============================================================================
@@ -256,24 +324,243 @@ H6_PARAMETERS = ClassParameters(
 )
 
 
-# Registry of all classes
-CLASS_REGISTRY: Dict[int, ClassParameters] = {
-    1: H1_PARAMETERS,
-    2: H2_PARAMETERS,
-    3: H3_PARAMETERS,
-    4: H4_PARAMETERS,
-    5: H5_PARAMETERS,
-    6: H6_PARAMETERS,
-}
+# Registry of all classes, both keyed views built from one tuple
+_ALL = (H1_PARAMETERS, H2_PARAMETERS, H3_PARAMETERS, H4_PARAMETERS, H5_PARAMETERS, H6_PARAMETERS)
+
+CLASS_REGISTRY: Dict[int, ClassParameters] = {p.class_level.value: p for p in _ALL}
+
+CLASS_REGISTRY_BY_NAME: Dict[str, ClassParameters] = {p.class_name: p for p in _ALL}
+
+# Current parameters indexed by (class number - 1); kept in step with the
+# registries by _register_class_parameters
+_CLASSES = _ALL
+
+
+# ============================================================================
+# VECTORIZED LOOKUP TABLES
+# Per-class parameters laid out as arrays indexed by (class number - 1), so
+# whole batches of lines can be checked with a few NumPy operations.
+# Rebuilt whenever user settings change the registry.
+# ============================================================================
+
+_TOL_COEFF: np.ndarray = np.empty(0)
+_COEF2: np.ndarray = np.empty(0)
+_MAX_LINE_KM: np.ndarray = np.empty(0)
+_MAX_SIGHT_GEOM: np.ndarray = np.empty(0)
+_MAX_SIGHT_TRIG: np.ndarray = np.empty(0)
+
+
+def _rebuild_lookup_tables():
+    """Rebuild the per-class lookup arrays from CLASS_REGISTRY."""
+    global _TOL_COEFF, _COEF2, _MAX_LINE_KM, _MAX_SIGHT_GEOM, _MAX_SIGHT_TRIG
+
+    params = [CLASS_REGISTRY[i] for i in range(1, 7)]
+    _TOL_COEFF = np.array([p.tolerance_coefficient for p in params], dtype=np.float64)
+    # Squared coefficients let the tolerance check skip the sqrt:
+    # |m| <= c * sqrt(d)  <=>  m**2 <= c**2 * d
+    _COEF2 = _TOL_COEFF ** 2
+    # Unlimited line length (None) is stored as +inf
+    _MAX_LINE_KM = np.array(
+        [np.inf if p.max_line_length_km is None else p.max_line_length_km for p in params],
+        dtype=np.float64
+    )
+    _MAX_SIGHT_GEOM = np.array([p.max_sight_distance_geometric_m for p in params], dtype=np.float64)
+    _MAX_SIGHT_TRIG = np.array([p.max_sight_distance_trigonometric_m for p in params], dtype=np.float64)
+
+
+# Batches at least this large use the compiled tolerance kernel (if numba is
+# installed); smaller ones stay on NumPy to avoid the JIT compile penalty.
+_NUMBA_MIN_BATCH = 10_000
+
+# Compiled tolerance kernel: None until first needed, False without numba
+_tol_kernel = None
+
+
+def _get_tol_kernel():
+    """
+    Return the compiled tolerance kernel, or None if numba is not installed.
+
+    numba is imported and the kernel defined on the first large batch, so
+    importing this module never pays numba's import cost.
+    """
+    global _tol_kernel
+    if _tol_kernel is None:
+        try:
+            import numba
+        except ImportError:  # optional JIT for very large batches
+            _tol_kernel = False
+        else:
+            @numba.njit(parallel=True, fastmath=True, cache=True)
+            def kernel(coef, d_km):
+                out = np.empty_like(d_km)
+                for i in numba.prange(d_km.size):
+                    out[i] = coef[i] * sqrt(d_km[i])
+                return out
+            _tol_kernel = kernel
+    return _tol_kernel or None
+
+
+def _class_indices(class_idx: np.ndarray) -> np.ndarray:
+    """
+    0-based lookup-table indices for an array of class numbers.
+
+    Raises:
+        ValueError: If any class number is not 1-6, like get_class_parameters
+    """
+    classes = np.asarray(class_idx)
+    with np.errstate(invalid='ignore'):  # NaN casts are caught below
+        idx = classes.astype(np.intp, copy=False) - 1
+    # Out of range, non-integral and NaN class numbers all fail this test
+    bad = ~((idx >= 0) & (idx <= 5) & (idx + 1 == classes))
+    if bad.any():
+        raise ValueError(
+            f"Invalid leveling class: {classes[bad].flat[0]}. Must be 1-6."
+        )
+    return idx
+
+
+def batch_tolerances_mm(class_idx: np.ndarray, distances_km: np.ndarray) -> np.ndarray:
+    """
+    Compute the allowed misclosure for many lines at once.
+
+    batch_validate never needs this (it compares squares); use it to report
+    the actual tolerance for the lines that failed.
+
+    Args:
+        class_idx: Array of class numbers (1-6), one per line
+        distances_km: Array of line lengths in kilometers
+
+    Returns:
+        Array of tolerances in millimeters
+
+    Raises:
+        ValueError: If a class number is not 1-6
+    """
+    _ensure_loaded()
+    idx = _class_indices(class_idx)
+    distances_km = np.asarray(distances_km, dtype=np.float64)
+    coef = _TOL_COEFF[idx]
+    if distances_km.size >= _NUMBA_MIN_BATCH:
+        kernel = _get_tol_kernel()
+        if kernel is not None:
+            return kernel(coef, distances_km)
+    return coef * np.sqrt(distances_km)
+
+
+def batch_validate(
+    class_idx: np.ndarray,
+    distances_km: np.ndarray,
+    misclosures_mm: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Validate many lines against their class limits at once.
+
+    Args:
+        class_idx: Array of class numbers (1-6), one per line
+        distances_km: Array of line lengths in kilometers
+        misclosures_mm: Optional array of misclosures in millimeters
+            (NaN where the misclosure is unknown)
+
+    Returns:
+        Boolean mask, True where the line is within its class line-length
+        limit (and within tolerance, if misclosures are given)
+
+    Raises:
+        ValueError: If a class number is not 1-6
+    """
+    _ensure_loaded()
+    idx = _class_indices(class_idx)
+    distances_km = np.asarray(distances_km, dtype=np.float64)
+
+    mask = distances_km <= _MAX_LINE_KM[idx]
+    if misclosures_mm is not None:
+        misclosures_mm = np.asarray(misclosures_mm, dtype=np.float64)
+        # NaN compares False, so unknown misclosures never fail
+        mask &= ~(misclosures_mm * misclosures_mm > _COEF2[idx] * distances_km)
+    return mask
+
+
+def misclosure_valid_batch(
+    class_ids: np.ndarray,
+    distances_km: np.ndarray,
+    misclosures_mm: np.ndarray
+) -> np.ndarray:
+    """
+    Check many misclosures against their class tolerance at once.
+
+    Takes its arguments in the same order as batch_validate and treats
+    unknown misclosures the same way: NaN is not judged, so it passes.
+
+    Args:
+        class_ids: Array of class numbers (1-6), one per line
+        distances_km: Array of line lengths in kilometers
+        misclosures_mm: Array of misclosures in millimeters (NaN where
+            the misclosure is unknown)
+
+    Returns:
+        Boolean mask, True where |misclosure| <= tolerance or the
+        misclosure is unknown
+
+    Raises:
+        ValueError: If a class number is not 1-6
+    """
+    _ensure_loaded()
+    idx = _class_indices(class_ids)
+    misclosures_mm = np.asarray(misclosures_mm, dtype=np.float64)
+    # NaN compares False, so unknown misclosures never fail
+    return ~(misclosures_mm * misclosures_mm
+             > _COEF2[idx] * np.asarray(distances_km, dtype=np.float64))
+
+
+# Fields that may be overridden by user settings
+EDITABLE_FIELDS = (
+    'tolerance_coefficient',
+    'max_line_length_km',
+    'max_sight_distance_geometric_m',
+    'max_sight_distance_trigonometric_m',
+    'required_method',
+    'max_single_distance_imbalance_m',
+    'max_cumulative_distance_imbalance_m',
+    'max_fb_difference_mm',
+    'max_instrument_error_mm_per_km',
+    'max_days_for_double_run',
+)
+
+
+def _register_class_parameters(params: ClassParameters):
+    """Store a ClassParameters instance in both registries."""
+    global _CLASSES
+    CLASS_REGISTRY[params.class_level.value] = params
+    CLASS_REGISTRY_BY_NAME[params.class_name] = params
+    _CLASSES = tuple(CLASS_REGISTRY[i] for i in range(1, 7))
+    get_class_parameters_by_name.cache_clear()
+
+
+def update_class_parameters(leveling_class: int, **changes) -> ClassParameters:
+    """
+    Override editable parameters of a leveling class.
+
+    ClassParameters is immutable, so a modified copy is built and
+    registered in place of the current instance.
 
-CLASS_REGISTRY_BY_NAME: Dict[str, ClassParameters] = {
-    "H1": H1_PARAMETERS,
-    "H2": H2_PARAMETERS,
-    "H3": H3_PARAMETERS,
-    "H4": H4_PARAMETERS,
-    "H5": H5_PARAMETERS,
-    "H6": H6_PARAMETERS,
-}
+    Args:
+        leveling_class: Class number (1-6)
+        **changes: Field values to override (see EDITABLE_FIELDS)
+
+    Returns:
+        The newly registered ClassParameters object
+
+    Raises:
+        ValueError: If class is invalid or a field is not editable
+    """
+    invalid = set(changes) - set(EDITABLE_FIELDS)
+    if invalid:
+        raise ValueError(f"Non-editable class parameters: {', '.join(sorted(invalid))}")
+
+    params = replace(get_class_parameters(leveling_class), **changes)
+    _register_class_parameters(params)
+    _rebuild_lookup_tables()
+    return params
 
 
 def get_class_parameters(leveling_class: int) -> ClassParameters:
@@ -289,42 +576,87 @@ def get_class_parameters(leveling_class: int) -> ClassParameters:
     Raises:
         ValueError: If class not in valid range
     """
-    if leveling_class not in CLASS_REGISTRY:
-        raise ValueError(f"Invalid leveling class: {leveling_class}. Must be 1-6.")
-    return CLASS_REGISTRY[leveling_class]
+    _ensure_loaded()
+    return _CLASSES[_class_index(leveling_class)]
 
 
+def _class_index(leveling_class: int) -> int:
+    """
+    0-based index of a class number (1-6) into _CLASSES and the lookup tables.
+
+    Integral floats such as 3.0 or np.float64(3) are accepted, as with the
+    registry lookup this replaced.
+
+    Raises:
+        ValueError: If class not in valid range
+    """
+    try:
+        idx = int(leveling_class)
+        if idx == leveling_class and 1 <= idx <= 6:
+            return idx - 1
+    except (TypeError, ValueError, OverflowError):
+        pass
+    raise ValueError(f"Invalid leveling class: {leveling_class}. Must be 1-6.")
+
+
+@lru_cache(maxsize=None)
 def get_class_parameters_by_name(class_name: str) -> ClassParameters:
-    """Get parameters by class name (H1-H6)."""
+    """
+    Get parameters by class name (H1-H6).
+
+    Lookups are cached; the cache is cleared whenever the registry changes.
+    """
+    _ensure_loaded()
     class_name = class_name.upper()
-    if class_name not in CLASS_REGISTRY_BY_NAME:
+    if len(class_name) != 2 or class_name[0] != 'H' or class_name[1] not in '123456':
         raise ValueError(f"Invalid class name: {class_name}. Must be H1-H6.")
-    return CLASS_REGISTRY_BY_NAME[class_name]
+    return _CLASSES[int(class_name[1]) - 1]
 
 
-def calculate_new_tolerance(distance_m: float, leveling_class: Optional[int] = None) -> float:
+def calculate_new_tolerance(
+    distance_m: Union[float, np.ndarray],
+    leveling_class: Optional[int] = None
+) -> Union[float, np.ndarray]:
     """
     Calculate tolerance using new Survey of Israel regulations.
 
     Args:
-        distance_m: Distance in meters
+        distance_m: Distance in meters, or an array of distances
         leveling_class: Class (1-6), if None uses user's default class setting
 
     Returns:
-        Tolerance in millimeters
+        Tolerance in millimeters (array if distance_m is an array)
     """
+    _ensure_loaded()
     if leveling_class is None:
         # Use user's default class setting
         default_class_name = get_default_class()
         leveling_class = int(default_class_name[1])  # Extract number from "H3" -> 3
 
-    params = get_class_parameters(leveling_class)
-    distance_km = distance_m / 1000.0
-    return params.get_tolerance_mm(distance_km)
+    # Read the coefficient straight from the lookup table
+    coef = _TOL_COEFF.item(_class_index(leveling_class))
+    if np.ndim(distance_m) > 0:
+        return coef * np.sqrt(np.asarray(distance_m, dtype=np.float64) / 1000.0)
+    return coef * sqrt(distance_m / 1000.0)
+
+
+def calculate_new_tolerance_batch(distances_m: np.ndarray, classes: np.ndarray) -> np.ndarray:
+    """
+    Calculate tolerances for many lines, each with its own class.
+
+    Args:
+        distances_m: Array of distances in meters
+        classes: Array of class numbers (1-6), one per distance
+
+    Returns:
+        Array of tolerances in millimeters
+    """
+    return batch_tolerances_mm(classes, np.asarray(distances_m, dtype=np.float64) / 1000.0)
 
 
 def get_all_classes_summary() -> Dict[str, Dict[str, Any]]:
     """Get summary of all class parameters for display/export."""
+    _ensure_loaded()
     return {
         name: params.to_dict()
         for name, params in CLASS_REGISTRY_BY_NAME.items()
@@ -379,6 +711,17 @@ def get_default_class_parameters() -> ClassParameters:
 # SETTINGS PERSISTENCE (Item 5)
 # ============================================================================
 
+# User settings are read on first use rather than at import, so callers that
+# never look up class parameters skip the settings file entirely
+_user_settings_loaded = False
+
+
+def _ensure_loaded():
+    """Apply user settings to the registry on first access."""
+    if not _user_settings_loaded:
+        load_user_settings()
+
+
 def load_user_settings() -> bool:
     """
     Load user-customized class parameters from settings file if available.
@@ -386,6 +729,9 @@ def load_user_settings() -> bool:
     Returns:
         True if settings were loaded and applied, False if using defaults
     """
+    global _user_settings_loaded
+    _user_settings_loaded = True
+
     try:
         from .settings_manager import get_settings_manager
 
@@ -398,24 +744,15 @@ def load_user_settings() -> bool:
                 if class_name in CLASS_REGISTRY_BY_NAME:
                     param_obj = CLASS_REGISTRY_BY_NAME[class_name]
 
-                    # Update mutable fields (excluding Enum and immutable fields)
-                    editable_fields = [
-                        'tolerance_coefficient',
-                        'max_line_length_km',
-                        'max_sight_distance_geometric_m',
-                        'max_sight_distance_trigonometric_m',
-                        'required_method',
-                        'max_single_distance_imbalance_m',
-                        'max_cumulative_distance_imbalance_m',
-                        'max_fb_difference_mm',
-                        'max_instrument_error_mm_per_km',
-                        'max_days_for_double_run'
-                    ]
-
-                    for key, value in params_dict.items():
-                        if key in editable_fields and hasattr(param_obj, key):
-                            setattr(param_obj, key, value)
+                    # Only editable fields (excluding Enum and identity fields)
+                    overrides = {
+                        key: value for key, value in params_dict.items()
+                        if key in EDITABLE_FIELDS
+                    }
+                    if overrides:
+                        _register_class_parameters(replace(param_obj, **overrides))
 
+            _rebuild_lookup_tables()
             return True
         return False
 
@@ -434,19 +771,15 @@ def save_user_settings() -> bool:
     """
     try:
         from .settings_manager import get_settings_manager
-        from dataclasses import asdict
 
+        _ensure_loaded()
         manager = get_settings_manager()
 
-        # Convert to dict - filter out Enum objects and non-serializable fields
-        params_dict = {}
-        for name, params in CLASS_REGISTRY_BY_NAME.items():
-            param_dict = asdict(params)
-
-            # Remove non-serializable fields
-            param_dict.pop('class_level', None)  # Enum
-
-            params_dict[name] = param_dict
+        # Convert to dict - only the serializable fields (no Enum)
+        params_dict = {
+            name: {key: getattr(params, key) for key in _SERIALIZABLE_FIELDS}
+            for name, params in CLASS_REGISTRY_BY_NAME.items()
+        }
 
         return manager.save_class_parameters(params_dict)
 
@@ -482,5 +815,6 @@ def reset_to_defaults() -> bool:
         return False
 
 
-# Load user settings on module import
-load_user_settings()
+# Lookup tables start from the official defaults; user settings are
+# applied lazily by _ensure_loaded()
+_rebuild_lookup_tables()
@@ -3,11 +3,19 @@ Data Models for Geodetic Measurements
 
 Core data structures used throughout the geodetic tool.
 """
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+import sys
+from dataclasses import MISSING, dataclass, field, fields, replace
+from itertools import chain, compress
+from operator import attrgetter, is_
+from typing import TYPE_CHECKING, Iterable, List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
-import pandas as pd
+import numpy as np
+
+# pandas is slow to import and only needed for the DataFrame exports, so it
+# is imported inside those methods
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class MeasurementDirection(Enum):
@@ -28,9 +36,64 @@ class LineStatus(Enum):
     EXCLUDED = "excluded"  # General exclusion (manual or point-based)
 
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+
+def _slots_setstate(self, state):
+    """
+    Restore a pickled model instance.
+
+    Accepts every state layout pickle produces for these classes: a
+    (dict, slots) pair or a list of field values from slotted instances,
+    and the plain __dict__ of pickles written before the models had
+    __slots__, so older project files still load. Fields added since a
+    file was written take their defaults.
+    """
+    if isinstance(state, tuple) and len(state) == 2:
+        dict_state, slot_state = state
+        state = {**(dict_state or {}), **(slot_state or {})}
+    if not isinstance(state, dict):
+        state = dict(zip((f.name for f in fields(self)), state))
+    # object.__setattr__ also works on the frozen classes
+    for f in fields(self):
+        if f.name in state:
+            value = state[f.name]
+        elif f.default is not MISSING:
+            value = f.default
+        elif f.default_factory is not MISSING:
+            value = f.default_factory()
+        else:
+            continue
+        object.__setattr__(self, f.name, value)
+
+
+_IS_USED = attrgetter('is_used')
+_LINE_ENDPOINTS = attrgetter('start_point', 'end_point')
+_SETUP_POINTS = attrgetter('from_point', 'to_point')
+_SETUPS = attrgetter('setups')
+
+# StationSetup fields by column type, for LevelingLine.to_columnar()
+_SETUP_POINT_FIELDS = ('from_point', 'to_point')
+_SETUP_FLOAT_FIELDS = (
+    'backsight_reading', 'foresight_reading', 'distance_back', 'distance_fore',
+    'temperature', 'height_diff', 'cumulative_height'
+)
+
+# Method after reversing a line's direction
+_TOGGLED_METHOD = {"BF": "FB", "FB": "BF"}
+
+# Small-int code for each LineStatus, keyed by value rather than member:
+# parsers load this module under a second name, so their members differ
+STATUS_CODES: Dict[str, int] = {status.value: i for i, status in enumerate(LineStatus)}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class StationSetup:
     """Single station setup in a leveling measurement."""
+    __setstate__ = _slots_setstate  # also loads pre-slots pickles
+
     setup_number: int
     from_point: str
     to_point: str
@@ -44,14 +107,22 @@ class StationSetup:
     is_used: bool = True  # NEW: Flag to include/exclude in exports
 
     def __post_init__(self):
-        """Calculate height difference if not provided."""
+        """Intern point IDs and calculate height difference if not provided."""
+        # Point IDs repeat across many setups; interning shares one string
+        # object per ID so set/dict lookups hit on identity
+        if type(self.from_point) is str:
+            self.from_point = sys.intern(self.from_point)
+        if type(self.to_point) is str:
+            self.to_point = sys.intern(self.to_point)
         if self.height_diff is None and self.backsight_reading and self.foresight_reading:
             self.height_diff = self.backsight_reading - self.foresight_reading
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LevelingLine:
     """Complete leveling line from one benchmark to another."""
+    __setstate__ = _slots_setstate  # also loads pre-slots pickles
+
     filename: str
     start_point: str
     end_point: str
@@ -65,12 +136,28 @@ class LevelingLine:
     total_height_diff: float = 0.0   # Total height difference in meters
     misclosure: Optional[float] = None  # Misclosure if endpoints are known
     status: LineStatus = LineStatus.VALID
-    validation_errors: List[str] = field(default_factory=list)
+    # None until the first error is recorded (most lines have none);
+    # use add_validation_error() to append
+    validation_errors: Optional[List[str]] = None
 
     # NEW: Export control and direction management
     is_used: bool = True  # Flag to include/exclude entire line in exports
     original_direction: str = "BF"  # Track original direction for reversal
+
+    def __post_init__(self):
+        """Intern endpoint IDs (shared with the setups' point IDs)."""
+        if type(self.start_point) is str:
+            self.start_point = sys.intern(self.start_point)
+        if type(self.end_point) is str:
+            self.end_point = sys.intern(self.end_point)
     
+    # num_setups and distance_km are derived on access rather than cached:
+    # parsers append to setups and assign total_distance directly, so a
+    # cached copy would go stale, and len()/one division cost less than a
+    # staleness check would. total_distance and total_height_diff are plain
+    # stored fields, set once by the parser or calculate_totals() and kept
+    # current by apply_corrections(), so reading them never walks the setups.
+
     @property
     def num_setups(self) -> int:
         """Number of station setups."""
@@ -83,12 +170,15 @@ class LevelingLine:
     
     def calculate_totals(self):
         """Calculate total distance and height difference from setups."""
-        self.total_distance = sum(
-            (s.distance_back + s.distance_fore) / 2 for s in self.setups
-        )
-        self.total_height_diff = sum(
-            s.height_diff for s in self.setups if s.height_diff is not None
-        )
+        # One pass over the setups for both totals
+        total_distance = 0.0
+        total_height_diff = 0.0
+        for s in self.setups:
+            total_distance += (s.distance_back + s.distance_fore) / 2
+            if s.height_diff is not None:
+                total_height_diff += s.height_diff
+        self.total_distance = total_distance
+        self.total_height_diff = total_height_diff
 
     def toggle_direction(self):
         """
@@ -98,53 +188,103 @@ class LevelingLine:
         # Swap start and end points
         self.start_point, self.end_point = self.end_point, self.start_point
 
-        # Toggle method
-        if self.method == "BF":
-            self.method = "FB"
-        elif self.method == "FB":
-            self.method = "BF"
+        # Toggle method (BFFB and other methods are direction-neutral)
+        self.method = _TOGGLED_METHOD.get(self.method, self.method)
 
-        # Invert height differences
+        # Invert height differences and swap from/to points in one pass.
+        # Setups own their values (parsers and the GUI edit them in place),
+        # so there is no shared array to negate in bulk.
         for setup in self.setups:
-            if setup.height_diff is not None:
-                setup.height_diff *= -1
-            # Swap from/to points in setups
+            height_diff = setup.height_diff
+            if height_diff is not None:
+                setup.height_diff = -height_diff
             setup.from_point, setup.to_point = setup.to_point, setup.from_point
 
-        # Recalculate totals
-        self.total_height_diff *= -1
+        # The total is just the negated sum, no need to recalculate it
+        self.total_height_diff = -self.total_height_diff
+
+    def add_validation_error(self, message: str):
+        """Record a validation error, creating the list on first use."""
+        if self.validation_errors is None:
+            self.validation_errors = [message]
+        else:
+            self.validation_errors.append(message)
 
     def get_used_setups(self) -> List['StationSetup']:
         """Return only setups marked as used."""
-        return [s for s in self.setups if s.is_used]
+        # is_used is set directly on setups, so filter on demand rather than
+        # caching a mask; compress/map keep the whole scan in C
+        return list(compress(self.setups, map(_IS_USED, self.setups)))
+
+    def to_columnar(self, fields: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Return the setups as parallel arrays, one per StationSetup field.
+
+        Numeric columns are float64 with NaN for missing values, point IDs
+        are object arrays, setup_number is int64 and is_used is bool.
+
+        Args:
+            fields: StationSetup field names to extract (default: all)
+        """
+        setups = self.setups
+        n = len(setups)
+        wanted = None if fields is None else frozenset(fields)
+        columns: Dict[str, np.ndarray] = {}
+        if wanted is None or 'setup_number' in wanted:
+            columns['setup_number'] = np.fromiter(
+                (s.setup_number for s in setups), dtype=np.int64, count=n
+            )
+        for name in _SETUP_POINT_FIELDS:
+            if wanted is None or name in wanted:
+                points = np.empty(n, dtype=object)
+                points[:] = list(map(attrgetter(name), setups))
+                columns[name] = points
+        for name in _SETUP_FLOAT_FIELDS:
+            if wanted is None or name in wanted:
+                columns[name] = np.fromiter(
+                    (np.nan if v is None else v for v in map(attrgetter(name), setups)),
+                    dtype=np.float64, count=n
+                )
+        if wanted is None or 'is_used' in wanted:
+            columns['is_used'] = np.fromiter(map(_IS_USED, setups), dtype=bool, count=n)
+        return columns
 
     def copy(self) -> 'LevelingLine':
         """Create a deep copy of this line for joint projects."""
-        import copy
-        return copy.deepcopy(self)
+        # Explicit structural copy; the other fields are immutable values
+        return replace(
+            self,
+            setups=[replace(s) for s in self.setups],
+            validation_errors=(
+                None if self.validation_errors is None else list(self.validation_errors)
+            )
+        )
     
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> 'pd.DataFrame':
         """Convert setups to a pandas DataFrame."""
-        data = []
-        for setup in self.setups:
-            data.append({
-                'SetupNum': setup.setup_number,
-                'FromPoint': setup.from_point,
-                'ToPoint': setup.to_point,
-                'BacksightReading': setup.backsight_reading,
-                'ForesightReading': setup.foresight_reading,
-                'DistanceBack': setup.distance_back,
-                'DistanceFore': setup.distance_fore,
-                'HeightDiff': setup.height_diff,
-                'CumulativeHeight': setup.cumulative_height,
-                'Temperature': setup.temperature
-            })
-        return pd.DataFrame(data)
-
-
-@dataclass
+        import pandas as pd
+
+        setups = self.setups
+        # Build column by column; a list of row dicts is the slowest constructor
+        return pd.DataFrame({
+            'SetupNum': [s.setup_number for s in setups],
+            'FromPoint': [s.from_point for s in setups],
+            'ToPoint': [s.to_point for s in setups],
+            'BacksightReading': [s.backsight_reading for s in setups],
+            'ForesightReading': [s.foresight_reading for s in setups],
+            'DistanceBack': [s.distance_back for s in setups],
+            'DistanceFore': [s.distance_fore for s in setups],
+            'HeightDiff': [s.height_diff for s in setups],
+            'CumulativeHeight': [s.cumulative_height for s in setups],
+            'Temperature': [s.temperature for s in setups]
+        })
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Benchmark:
     """Known control point (benchmark) with fixed height."""
+    __setstate__ = _slots_setstate  # also loads pre-slots pickles
+
     point_id: str
     height: float              # Height in meters
     order: int = 3             # Control order (1=highest precision)
@@ -153,9 +293,11 @@ class Benchmark:
     northing: Optional[float] = None  # Y coordinate
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class MeasurementSummary:
     """Summary of a measurement line for export."""
+    __setstate__ = _slots_setstate  # also loads pre-slots pickles
+
     from_point: str
     to_point: str
     height_diff: float        # DH in meters
@@ -173,9 +315,11 @@ class MeasurementSummary:
     is_used: bool = True  # Flag to include/exclude in exports
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AdjustmentResult:
     """Results from a leveling adjustment."""
+    __setstate__ = _slots_setstate  # also loads pre-slots pickles
+
     iteration: int
     mse_unit_weight: float  # M.S.E. of unit weight
     adjusted_heights: Dict[str, float]  # Point ID -> adjusted height
@@ -185,21 +329,24 @@ class AdjustmentResult:
     total_diff_mm: float
     k_coefficient: float                # Classification coefficient
     
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> 'pd.DataFrame':
         """Convert adjusted heights to DataFrame."""
-        data = []
-        for point_id, height in self.adjusted_heights.items():
-            data.append({
-                'PointID': point_id,
-                'AdjustedHeight': height,
-                'MSE': self.mse_heights.get(point_id, None)
-            })
-        return pd.DataFrame(data)
+        import pandas as pd
 
+        point_ids = list(self.adjusted_heights)
+        mse_get = self.mse_heights.get
+        return pd.DataFrame({
+            'PointID': point_ids,
+            'AdjustedHeight': list(self.adjusted_heights.values()),
+            'MSE': [mse_get(point_id) for point_id in point_ids]
+        })
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Result of validating a leveling line."""
+    __setstate__ = _slots_setstate  # also loads pre-slots pickles
+
     is_valid: bool
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
@@ -220,9 +367,11 @@ class ValidationResult:
         self.warnings.append(message)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProjectData:
     """Container for a complete geodetic project."""
+    __setstate__ = _slots_setstate  # also loads pre-slots pickles
+
     name: str
     lines: List[LevelingLine] = field(default_factory=list)
     benchmarks: Dict[str, Benchmark] = field(default_factory=dict)
@@ -233,6 +382,10 @@ class ProjectData:
     source_projects: List[str] = field(default_factory=list)  # Track source project names
     project_path: Optional[str] = None  # File path for persistence
 
+    # (benchmarks dict, Benchmark objects, (ids, heights, eastings, northings)),
+    # built on first use and rebuilt when the dict or its values change
+    _bm_arrays: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def add_line(self, line: LevelingLine):
         """Add a leveling line to the project."""
         self.lines.append(line)
@@ -241,58 +394,134 @@ class ProjectData:
         """Add a known benchmark to the project."""
         self.benchmarks[benchmark.point_id] = benchmark
 
+    def _benchmark_arrays(self) -> tuple:
+        """
+        Build (or return the cached) structure-of-arrays view of benchmarks.
+
+        The cache is reused only while self.benchmarks is the same dict
+        holding the same Benchmark objects, so direct writes to the dict,
+        deletions and reassigning benchmarks are all picked up (Benchmark
+        is frozen, so its fields cannot change behind the cache).
+        """
+        bms = tuple(self.benchmarks.values())
+        cached = self._bm_arrays
+        if (cached is None or cached[0] is not self.benchmarks
+                or len(cached[1]) != len(bms) or not all(map(is_, cached[1], bms))):
+            n = len(bms)
+            ids = np.empty(n, dtype=object)
+            ids[:] = [bm.point_id for bm in bms]
+            arrays = (
+                ids,
+                np.fromiter((bm.height for bm in bms), dtype=np.float64, count=n),
+                np.fromiter(
+                    (np.nan if bm.easting is None else bm.easting for bm in bms),
+                    dtype=np.float64, count=n
+                ),
+                np.fromiter(
+                    (np.nan if bm.northing is None else bm.northing for bm in bms),
+                    dtype=np.float64, count=n
+                ),
+            )
+            cached = self._bm_arrays = (self.benchmarks, bms, arrays)
+        return cached[2]
+
+    @property
+    def bm_ids(self) -> np.ndarray:
+        """Benchmark point IDs, in the same order as the other bm_* arrays."""
+        return self._benchmark_arrays()[0]
+
+    @property
+    def bm_heights(self) -> np.ndarray:
+        """Benchmark heights in meters."""
+        return self._benchmark_arrays()[1]
+
+    @property
+    def bm_eastings(self) -> np.ndarray:
+        """Benchmark eastings (NaN where unknown)."""
+        return self._benchmark_arrays()[2]
+
+    @property
+    def bm_northings(self) -> np.ndarray:
+        """Benchmark northings (NaN where unknown)."""
+        return self._benchmark_arrays()[3]
+
     def get_all_points(self) -> set:
         """Get all unique point IDs from all lines."""
-        points = set()
-        for line in self.lines:
-            points.add(line.start_point)
-            points.add(line.end_point)
-            for setup in line.setups:
-                points.add(setup.from_point)
-                points.add(setup.to_point)
-        return points
+        lines = self.lines
+        all_setups = chain.from_iterable(map(_SETUPS, lines))
+        # One set build over a flat C-level iterator instead of per-item add()
+        return set(chain(
+            chain.from_iterable(map(_LINE_ENDPOINTS, lines)),
+            chain.from_iterable(map(_SETUP_POINTS, all_setups))
+        ))
 
     def get_used_lines(self) -> List[LevelingLine]:
         """Return only lines marked as used for export."""
-        return [line for line in self.lines if line.is_used]
+        return list(compress(self.lines, map(_IS_USED, self.lines)))
+
+    def status_codes(self) -> np.ndarray:
+        """
+        Line statuses as small-int codes (see STATUS_CODES), one per line.
+
+        Lets status filters run as a single array comparison, e.g.
+        ``project.status_codes() == STATUS_CODES[LineStatus.VALID.value]``.
+        """
+        return np.fromiter(
+            (STATUS_CODES[line.status.value] for line in self.lines),
+            dtype=np.int8, count=len(self.lines)
+        )
 
     def copy(self) -> 'ProjectData':
         """Create a deep copy of this project (for joint projects)."""
-        import copy
-        return copy.deepcopy(self)
+        results = self.adjustment_results
+        if results is not None:
+            results = replace(
+                results,
+                adjusted_heights=dict(results.adjusted_heights),
+                residuals=dict(results.residuals),
+                mse_heights=dict(results.mse_heights)
+            )
+        # Benchmarks are frozen, so they can be shared between projects
+        return replace(
+            self,
+            lines=[line.copy() for line in self.lines],
+            benchmarks=dict(self.benchmarks),
+            adjustment_results=results,
+            source_projects=list(self.source_projects)
+        )
 
     def merge_from(self, other_project: 'ProjectData'):
         """
         Merge another project into this one (for joint projects).
-        Creates deep copies to avoid modifying source projects.
+        Copies lines to avoid modifying source projects; benchmarks are
+        frozen and shared.
         """
         # Copy lines
         for line in other_project.lines:
             self.lines.append(line.copy())
 
-        # Copy benchmarks
+        # Add benchmarks not already present
         for point_id, bm in other_project.benchmarks.items():
             if point_id not in self.benchmarks:
-                import copy
-                self.benchmarks[point_id] = copy.deepcopy(bm)
+                self.benchmarks[point_id] = bm
 
         # Track source
         if other_project.name not in self.source_projects:
             self.source_projects.append(other_project.name)
 
-    def lines_to_dataframe(self) -> pd.DataFrame:
+    def lines_to_dataframe(self) -> 'pd.DataFrame':
         """Convert all lines to summary DataFrame."""
-        data = []
-        for line in self.lines:
-            data.append({
-                'Filename': line.filename,
-                'StartPoint': line.start_point,
-                'EndPoint': line.end_point,
-                'NumSetups': line.num_setups,
-                'TotalDistance': line.total_distance,
-                'HeightDiff': line.total_height_diff,
-                'Method': line.method,
-                'Status': line.status.value,
-                'IsUsed': line.is_used  # NEW
-            })
-        return pd.DataFrame(data)
+        import pandas as pd
+
+        lines = self.lines
+        return pd.DataFrame({
+            'Filename': [line.filename for line in lines],
+            'StartPoint': [line.start_point for line in lines],
+            'EndPoint': [line.end_point for line in lines],
+            'NumSetups': [len(line.setups) for line in lines],
+            'TotalDistance': [line.total_distance for line in lines],
+            'HeightDiff': [line.total_height_diff for line in lines],
+            'Method': [line.method for line in lines],
+            'Status': [line.status.value for line in lines],
+            'IsUsed': [line.is_used for line in lines]  # NEW
+        })
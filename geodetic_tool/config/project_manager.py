@@ -4,17 +4,123 @@ Project Management Module
 Handles saving, loading, and managing geodetic leveling projects.
 Supports single projects and joint (merged) projects with copy-on-write semantics.
 """
-import json
-import pickle
+import mmap
+import os
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Union
 from datetime import datetime
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON
+    orjson = None
+
 from .models import ProjectData, LevelingLine, Benchmark, AdjustmentResult
 
+# json (only needed without orjson), pickle and concurrent.futures are
+# imported where they are used, so constructing a ProjectManager or saving
+# JSON does not pay for them. datetime stays: models imports it anyway.
+
 logger = logging.getLogger(__name__)
 
+# Large write buffer for project files: the pickler and the streaming JSON
+# writer issue many small writes
+_PICKLE_BUFFER_SIZE = 1 << 20
+
+# Sidecar in base_path holding list_projects metadata, updated on save
+INDEX_FILENAME = ".index.json"
+
+# Upper bound on threads loading source projects for a joint project
+_MAX_LOAD_WORKERS = 8
+
+# Project JSON layout. Version 1 (files without the key) stores each line's
+# setups as a list of row objects, version 2 as one list per column, and
+# version 3 packs the line and setup booleans into "flags" integers.
+SCHEMA_VERSION = 3
+
+# Bits of the "flags" integers
+FLAG_USED = 1          # is_used (lines and setups)
+FLAG_DIRECTION_FB = 2  # original_direction == "FB" (lines)
+
+# StationSetup fields written to project JSON as columns, in order; the
+# setups' "flags" column follows them
+_SETUP_JSON_FIELDS = (
+    'setup_number', 'from_point', 'to_point', 'backsight_reading',
+    'foresight_reading', 'distance_back', 'distance_fore', 'temperature',
+    'height_diff'
+)
+
+
+def _json_dumps(data: Any, indent: bool = True) -> bytes:
+    """Encode project data as UTF-8 JSON, with orjson if installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    import json
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _column_to_list(column: np.ndarray) -> list:
+    """Convert a to_columnar() array to a JSON-ready list (NaN -> None)."""
+    if column.dtype.kind == 'f':
+        missing = np.isnan(column)
+        if missing.any():
+            return np.where(missing, None, column).tolist()
+    return column.tolist()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode project JSON, with orjson if installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+    # json.loads detects UTF-8 itself, no need to decode to str first
+    return json.loads(raw)
+
+
+def _load_mapped(filepath: Union[str, Path], loads: Callable[[Any], Any]) -> Any:
+    """
+    Decode a file with loads() straight from a read-only memory map.
+
+    Avoids copying the whole file into a bytes object before parsing.
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return loads(b'')
+        with mapped:
+            view = memoryview(mapped)
+            try:
+                return loads(view)
+            finally:
+                # The map cannot be closed while a view of it is alive
+                view.release()
+
+
+def _load_json_file(filepath: Union[str, Path]) -> Any:
+    """Decode a project JSON file (memory-mapped when orjson is installed)."""
+    if orjson is not None:
+        return _load_mapped(filepath, orjson.loads)
+    # json.loads needs a bytes/str object, so there is nothing to save
+    return _json_loads(Path(filepath).read_bytes())
+
+
+def _load_pickle_file(filepath: Union[str, Path]) -> Any:
+    """Unpickle a project file from a memory map."""
+    import pickle
+    return _load_mapped(filepath, pickle.loads)
+
+
+def pretty_print_project(filepath: str) -> None:
+    """Rewrite a JSON project file indented by two spaces, for inspection."""
+    filepath = Path(filepath)
+    filepath.write_bytes(_json_dumps(_load_json_file(filepath)) + b'\n')
+
 
 class ProjectManager:
     """
@@ -37,13 +143,20 @@ class ProjectManager:
         self.base_path = Path(base_path) if base_path else Path.cwd() / "projects"
         self.base_path.mkdir(parents=True, exist_ok=True)
 
-    def save_project(self, project: ProjectData, format: str = "json") -> str:
+    @property
+    def index_path(self) -> Path:
+        """Path of the project metadata index."""
+        return self.base_path / INDEX_FILENAME
+
+    def save_project(self, project: ProjectData, format: str = "json",
+                     human_readable: bool = False) -> str:
         """
         Save a project to disk.
 
         Args:
             project: ProjectData to save
             format: "json" or "pickle"
+            human_readable: Indent JSON output (compact by default)
 
         Returns:
             Path to saved file
@@ -57,13 +170,23 @@ class ProjectManager:
         filepath = Path(project.project_path)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        created = datetime.now().isoformat()
         if format == "json":
-            self._save_json(project, filepath)
+            self._save_json(project, filepath, created, human_readable)
         elif format == "pickle":
             self._save_pickle(project, filepath)
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+        if filepath.parent.resolve() == self.base_path.resolve():
+            self._update_index({
+                'name': project.name,
+                'path': str(filepath),
+                'is_joint': project.is_joint_project,
+                'created': created,
+                'num_lines': len(project.lines)
+            })
+
         logger.info(f"Project '{project.name}' saved to {filepath}")
         return str(filepath)
 
@@ -110,9 +233,20 @@ class ProjectManager:
             is_joint_project=True
         )
 
-        for source_path in source_project_paths:
+        # Loads are independent and spend their time in file I/O and
+        # (orjson) parsing, which release the GIL; merging stays serial and
+        # in the given order
+        from concurrent.futures import ThreadPoolExecutor
+
+        source_project_paths = list(source_project_paths)
+        with ThreadPoolExecutor(
+                max_workers=max(1, min(_MAX_LOAD_WORKERS, len(source_project_paths)))
+        ) as executor:
+            futures = [executor.submit(self.load_project, path) for path in source_project_paths]
+
+        for source_path, future in zip(source_project_paths, futures):
             try:
-                source_project = self.load_project(source_path)
+                source_project = future.result()
                 joint_project.merge_from(source_project)
                 logger.info(f"Merged project '{source_project.name}' into joint project")
             except Exception as e:
@@ -122,68 +256,107 @@ class ProjectManager:
 
         return joint_project
 
-    def _save_json(self, project: ProjectData, filepath: Path):
-        """Save project to JSON format (human-readable)."""
-        data = {
+    def _save_json(self, project: ProjectData, filepath: Path,
+                   created: Optional[str] = None, human_readable: bool = False):
+        """
+        Save project to JSON format.
+
+        The document is streamed one line/benchmark at a time so the whole
+        project never exists as a second, dict-shaped copy in memory. It is
+        compact unless human_readable is set, which indents it by two spaces.
+        """
+        header = {
+            'schema_version': SCHEMA_VERSION,
             'name': project.name,
             'is_joint_project': project.is_joint_project,
             'source_projects': project.source_projects,
-            'created': datetime.now().isoformat(),
-            'lines': [],
-            'benchmarks': {}
+            'created': created or datetime.now().isoformat(),
         }
 
-        # Serialize lines
-        for line in project.lines:
-            line_data = {
-                'filename': line.filename,
-                'start_point': line.start_point,
-                'end_point': line.end_point,
-                'method': line.method,
-                'date': line.date.isoformat() if line.date else None,
-                'instrument_id': line.instrument_id,
-                'total_distance': line.total_distance,
-                'total_height_diff': line.total_height_diff,
-                'is_used': line.is_used,
-                'original_direction': line.original_direction,
-                'setups': []
-            }
-
-            for setup in line.setups:
-                setup_data = {
-                    'setup_number': setup.setup_number,
-                    'from_point': setup.from_point,
-                    'to_point': setup.to_point,
-                    'backsight_reading': setup.backsight_reading,
-                    'foresight_reading': setup.foresight_reading,
-                    'distance_back': setup.distance_back,
-                    'distance_fore': setup.distance_fore,
-                    'temperature': setup.temperature,
-                    'height_diff': setup.height_diff,
-                    'is_used': setup.is_used
-                }
-                line_data['setups'].append(setup_data)
-
-            data['lines'].append(line_data)
-
-        # Serialize benchmarks
-        for point_id, bm in project.benchmarks.items():
-            data['benchmarks'][point_id] = {
-                'point_id': bm.point_id,
-                'height': bm.height,
-                'order': bm.order,
-                'description': bm.description,
-                'easting': bm.easting,
-                'northing': bm.northing
-            }
+        if human_readable:
+            newline, indent, colon = b'\n', b'  ', b': '
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            def encode(value: Any, depth: int) -> bytes:
+                # Indented record, shifted right to its depth in the document
+                # (JSON strings cannot contain a raw newline)
+                return _json_dumps(value).replace(b'\n', b'\n' + indent * depth)
+        else:
+            newline, indent, colon = b'', b'', b':'
+
+            def encode(value: Any, depth: int) -> bytes:
+                return _json_dumps(value, indent=False)
+
+        item_start = newline + indent * 2
+
+        with open(filepath, 'wb', buffering=_PICKLE_BUFFER_SIZE) as f:
+            f.write(b'{')
+            for key, value in header.items():
+                f.write(newline + indent + encode(key, 1) + colon + encode(value, 1) + b',')
+
+            # Serialize lines
+            f.write(newline + indent + b'"lines"' + colon + b'[')
+            for i, line in enumerate(project.lines):
+                if i:
+                    f.write(b',')
+                f.write(item_start + encode(self._line_to_dict(line), 2))
+            f.write((newline + indent if project.lines else b'') + b'],')
+
+            # Serialize benchmarks
+            f.write(newline + indent + b'"benchmarks"' + colon + b'{')
+            for i, (point_id, bm) in enumerate(project.benchmarks.items()):
+                if i:
+                    f.write(b',')
+                f.write(item_start + encode(point_id, 2) + colon
+                        + encode(self._benchmark_to_dict(bm), 2))
+            f.write((newline + indent if project.benchmarks else b'') + b'}')
+            f.write(newline + b'}' + newline)
+
+    @staticmethod
+    def _line_to_dict(line: LevelingLine) -> Dict[str, Any]:
+        """JSON-ready dict for one leveling line, with its setups as columns."""
+        columns = line.to_columnar()
+        date = line.date
+        if date is not None and orjson is None:
+            # orjson writes datetimes itself, as the same ISO 8601 text
+            date = date.isoformat()
+        setups = {name: _column_to_list(columns[name]) for name in _SETUP_JSON_FIELDS}
+        setups['flags'] = np.where(columns['is_used'], FLAG_USED, 0).tolist()
+
+        flags = FLAG_USED if line.is_used else 0
+        if line.original_direction == 'FB':
+            flags |= FLAG_DIRECTION_FB
+        line_data = {
+            'filename': line.filename,
+            'start_point': line.start_point,
+            'end_point': line.end_point,
+            'method': line.method,
+            'date': date,
+            'instrument_id': line.instrument_id,
+            'total_distance': line.total_distance,
+            'total_height_diff': line.total_height_diff,
+            'flags': flags,
+            'setups': setups
+        }
+        if line.original_direction not in ('BF', 'FB'):
+            # Not representable in flags, keep it verbatim
+            line_data['original_direction'] = line.original_direction
+        return line_data
+
+    @staticmethod
+    def _benchmark_to_dict(bm: Benchmark) -> Dict[str, Any]:
+        """JSON-ready dict for one benchmark."""
+        return {
+            'point_id': bm.point_id,
+            'height': bm.height,
+            'order': bm.order,
+            'description': bm.description,
+            'easting': bm.easting,
+            'northing': bm.northing
+        }
 
     def _load_json(self, filepath: Path) -> ProjectData:
         """Load project from JSON format."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json_file(filepath)
 
         project = ProjectData(
             name=data['name'],
@@ -195,22 +368,55 @@ class ProjectManager:
         # Deserialize lines
         from .models import StationSetup, LineStatus
 
+        columnar = data.get('schema_version', 1) >= 2
+
         for line_data in data.get('lines', []):
-            setups = []
-            for setup_data in line_data.get('setups', []):
-                setup = StationSetup(
-                    setup_number=setup_data['setup_number'],
-                    from_point=setup_data['from_point'],
-                    to_point=setup_data['to_point'],
-                    backsight_reading=setup_data['backsight_reading'],
-                    foresight_reading=setup_data['foresight_reading'],
-                    distance_back=setup_data['distance_back'],
-                    distance_fore=setup_data['distance_fore'],
-                    temperature=setup_data.get('temperature'),
-                    height_diff=setup_data.get('height_diff'),
-                    is_used=setup_data.get('is_used', True)
+            if columnar:
+                # Zip the columns back into rows
+                columns = line_data.get('setups') or {}
+                setups = []
+                if columns:
+                    used = columns.get('is_used')  # version 2
+                    if used is None:
+                        used = [bool(flags & FLAG_USED) for flags in columns['flags']]
+                    setups = [
+                        StationSetup(
+                            number, from_point, to_point, backsight, foresight,
+                            dist_back, dist_fore,
+                            temperature=temperature,
+                            height_diff=height_diff,
+                            is_used=is_used
+                        )
+                        for (number, from_point, to_point, backsight, foresight,
+                             dist_back, dist_fore, temperature, height_diff, is_used)
+                        in zip(*(columns[name] for name in _SETUP_JSON_FIELDS), used)
+                    ]
+            else:
+                setups = []
+                for setup_data in line_data.get('setups', []):
+                    setup = StationSetup(
+                        setup_number=setup_data['setup_number'],
+                        from_point=setup_data['from_point'],
+                        to_point=setup_data['to_point'],
+                        backsight_reading=setup_data['backsight_reading'],
+                        foresight_reading=setup_data['foresight_reading'],
+                        distance_back=setup_data['distance_back'],
+                        distance_fore=setup_data['distance_fore'],
+                        temperature=setup_data.get('temperature'),
+                        height_diff=setup_data.get('height_diff'),
+                        is_used=setup_data.get('is_used', True)
+                    )
+                    setups.append(setup)
+
+            flags = line_data.get('flags')
+            if flags is None:  # versions 1 and 2
+                is_used = line_data.get('is_used', True)
+                original_direction = line_data.get('original_direction', 'BF')
+            else:
+                is_used = bool(flags & FLAG_USED)
+                original_direction = line_data.get(
+                    'original_direction', 'FB' if flags & FLAG_DIRECTION_FB else 'BF'
                 )
-                setups.append(setup)
 
             line = LevelingLine(
                 filename=line_data['filename'],
@@ -222,8 +428,8 @@ class ProjectManager:
                 instrument_id=line_data.get('instrument_id'),
                 total_distance=line_data.get('total_distance', 0.0),
                 total_height_diff=line_data.get('total_height_diff', 0.0),
-                is_used=line_data.get('is_used', True),
-                original_direction=line_data.get('original_direction', 'BF')
+                is_used=is_used,
+                original_direction=original_direction
             )
             project.add_line(line)
 
@@ -243,13 +449,13 @@ class ProjectManager:
 
     def _save_pickle(self, project: ProjectData, filepath: Path):
         """Save project to pickle format (faster, binary)."""
-        with open(filepath, 'wb') as f:
-            pickle.dump(project, f)
+        import pickle
+        with open(filepath, 'wb', buffering=_PICKLE_BUFFER_SIZE) as f:
+            pickle.dump(project, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _load_pickle(self, filepath: Path) -> ProjectData:
         """Load project from pickle format."""
-        with open(filepath, 'rb') as f:
-            project = pickle.load(f)
+        project = _load_pickle_file(filepath)
         project.project_path = str(filepath)
         return project
 
@@ -257,37 +463,109 @@ class ProjectManager:
         """
         List all projects in the base directory.
 
+        Metadata comes from the index sidecar. A cheap directory listing
+        (names and modification times) is checked against it, and only
+        project files the index does not know or holds stale metadata for
+        are read, so files copied into the directory still show up.
+
         Returns:
             List of dictionaries with project metadata
         """
+        indexed = {
+            Path(p['path']).name: p for p in (self._read_index() or [])
+            if isinstance(p, dict) and 'path' in p
+        }
         projects = []
-
-        for file in self.base_path.glob("*.json"):
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                projects.append({
-                    'name': data.get('name', file.stem),
-                    'path': str(file),
+        changed = False
+        for entry in self._project_entries():
+            mtime = entry.stat().st_mtime_ns
+            record = indexed.pop(entry.name, None)
+            if record is None or record.get('mtime') != mtime:
+                was_indexed = record is not None
+                record = self._read_project_record(entry)
+                if record is None:
+                    # Unreadable: drop it from the index if it was there
+                    changed |= was_indexed
+                    continue
+                changed = True
+            projects.append(record)
+        # Whatever is left was deleted from the directory
+        if changed or indexed:
+            self._write_index(projects)
+        return [{k: v for k, v in p.items() if k != 'mtime'} for p in projects]
+
+    def _read_index(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the index records, or None if there is no usable index."""
+        try:
+            projects = _json_loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read project index {self.index_path}: {e}")
+            return None
+        return projects if isinstance(projects, list) else None
+
+    def _write_index(self, projects: List[Dict[str, Any]]):
+        """Atomically replace the index file."""
+        tmp_path = self.index_path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(_json_dumps(projects))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to write project index {self.index_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _update_index(self, record: Dict[str, Any]):
+        """Insert or replace the index record for record['path']."""
+        projects = self._read_index()
+        if projects is None:
+            projects = self._scan_projects()
+        record['mtime'] = Path(record['path']).stat().st_mtime_ns
+        name = Path(record['path']).name
+        projects = [p for p in projects if Path(p.get('path', '')).name != name]
+        projects.append(record)
+        self._write_index(projects)
+
+    def _scan_projects(self) -> List[Dict[str, Any]]:
+        """Read metadata by loading every project file in the base directory."""
+        records = (self._read_project_record(entry) for entry in self._project_entries())
+        return [record for record in records if record is not None]
+
+    def _project_entries(self) -> List[os.DirEntry]:
+        """Project files (.json/.pickle) in the base directory, in one pass."""
+        with os.scandir(self.base_path) as entries:
+            return [
+                entry for entry in entries
+                if entry.name != INDEX_FILENAME
+                and entry.name.endswith((".json", ".pickle"))
+                and entry.is_file()
+            ]
+
+    @staticmethod
+    def _read_project_record(entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """Index record for one project file, or None if it cannot be read."""
+        name = entry.name
+        try:
+            mtime = entry.stat().st_mtime_ns
+            if name.endswith(".json"):
+                data = _load_json_file(entry.path)
+                return {
+                    'name': data.get('name', name[:-len(".json")]),
+                    'path': entry.path,
                     'is_joint': data.get('is_joint_project', False),
                     'created': data.get('created', ''),
-                    'num_lines': len(data.get('lines', []))
-                })
-            except Exception as e:
-                logger.warning(f"Failed to read project {file}: {e}")
-
-        for file in self.base_path.glob("*.pickle"):
-            try:
-                with open(file, 'rb') as f:
-                    project = pickle.load(f)
-                projects.append({
-                    'name': project.name,
-                    'path': str(file),
-                    'is_joint': project.is_joint_project,
-                    'created': '',
-                    'num_lines': len(project.lines)
-                })
-            except Exception as e:
-                logger.warning(f"Failed to read project {file}: {e}")
-
-        return projects
+                    'num_lines': len(data.get('lines', [])),
+                    'mtime': mtime
+                }
+            project = _load_pickle_file(entry.path)
+            return {
+                'name': project.name,
+                'path': entry.path,
+                'is_joint': project.is_joint_project,
+                'created': '',
+                'num_lines': len(project.lines),
+                'mtime': mtime
+            }
+        except Exception as e:
+            logger.warning(f"Failed to read project {entry.path}: {e}")
+            return None
@@ -2,10 +2,14 @@
 Geodetic Tool Configuration Settings
 """
 import re
+import string
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Pattern, List, Optional
 from enum import Enum
 
+import numpy as np
+
 
 class MeasurementMethod(Enum):
     """Leveling measurement method."""
@@ -40,14 +44,24 @@ class EncodingConfig:
     output_encoding: str = 'cp1255'
 
 
+# Default point-ID patterns, compiled once and shared by every ValidationConfig
+_DEFAULT_BENCHMARK_PATTERN: Pattern = re.compile(r'.*[A-Za-z]+.*')
+_DEFAULT_TURNING_POINT_PATTERN: Pattern = re.compile(r'^\d+$')
+
+# While the default patterns are in effect the checks use str/set methods
+# instead of the regex engine: "contains an ASCII letter" and "all (Unicode)
+# decimal digits", which is exactly what the two patterns match
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
 @dataclass
 class ValidationConfig:
     """Validation rules configuration."""
     # Pattern for valid benchmark names (contains letters)
-    benchmark_pattern: Pattern = field(default_factory=lambda: re.compile(r'.*[A-Za-z]+.*'))
+    benchmark_pattern: Pattern = field(default_factory=lambda: _DEFAULT_BENCHMARK_PATTERN)
     
     # Pattern for turning points (numeric only)
-    turning_point_pattern: Pattern = field(default_factory=lambda: re.compile(r'^\d+$'))
+    turning_point_pattern: Pattern = field(default_factory=lambda: _DEFAULT_TURNING_POINT_PATTERN)
     
     # Maximum allowed misclosure per km (in mm)
     max_misclosure_per_km: float = 3.0
@@ -110,21 +124,59 @@ def get_settings() -> Settings:
     return settings
 
 
+# Point IDs repeat heavily (the same benchmarks appear in many setups), so
+# the checks are memoized. The pattern is part of the key, so replacing a
+# pattern in the settings never returns a stale answer.
+@lru_cache(maxsize=4096)
+def _is_benchmark(point_id: str, pattern: Pattern) -> bool:
+    point_id = point_id.strip()
+    # Benchmark contains letters, turning point is purely numeric
+    if pattern is _DEFAULT_BENCHMARK_PATTERN:
+        return not _ASCII_LETTERS.isdisjoint(point_id)
+    return bool(pattern.match(point_id))
+
+
+@lru_cache(maxsize=4096)
+def _is_turning_point(point_id: str, pattern: Pattern) -> bool:
+    point_id = point_id.strip()
+    if pattern is _DEFAULT_TURNING_POINT_PATTERN:
+        return point_id.isdecimal()
+    return bool(pattern.match(point_id))
+
+
 def is_benchmark(point_id: str) -> bool:
     """Check if a point ID represents a benchmark (vs turning point)."""
     if not point_id:
         return False
-    point_id = point_id.strip()
-    # Benchmark contains letters, turning point is purely numeric
-    return bool(settings.validation.benchmark_pattern.match(point_id))
+    return _is_benchmark(point_id, settings.validation.benchmark_pattern)
 
 
 def is_turning_point(point_id: str) -> bool:
     """Check if a point ID represents a turning point."""
     if not point_id:
         return False
-    point_id = point_id.strip()
-    return bool(settings.validation.turning_point_pattern.match(point_id))
+    return _is_turning_point(point_id, settings.validation.turning_point_pattern)
+
+
+def clear_point_id_caches():
+    """Clear the memoized is_benchmark/is_turning_point results."""
+    _is_benchmark.cache_clear()
+    _is_turning_point.cache_clear()
+
+
+def _tolerance_factor(leveling_class: Optional[int]) -> float:
+    """Tolerance coefficient (mm/sqrt(km)) for a class, default if None."""
+    if leveling_class is None:
+        leveling_class = settings.tolerance.default_class
+
+    class_factors = {
+        1: settings.tolerance.class_1,
+        2: settings.tolerance.class_2,
+        3: settings.tolerance.class_3,
+        4: settings.tolerance.class_4,
+    }
+
+    return class_factors.get(leveling_class, settings.tolerance.class_3)
 
 
 def calculate_tolerance(distance_m: float, leveling_class: int = None) -> float:
@@ -138,19 +190,24 @@ def calculate_tolerance(distance_m: float, leveling_class: int = None) -> float:
     Returns:
         Allowable tolerance in millimeters
     """
-    if leveling_class is None:
-        leveling_class = settings.tolerance.default_class
-    
-    distance_km = distance_m / 1000.0
-    
-    class_factors = {
-        1: settings.tolerance.class_1,
-        2: settings.tolerance.class_2,
-        3: settings.tolerance.class_3,
-        4: settings.tolerance.class_4,
-    }
-    
-    factor = class_factors.get(leveling_class, settings.tolerance.class_3)
+    factor = _tolerance_factor(leveling_class)
     
     # Tolerance = k * sqrt(D) where D is in km
-    return factor * (distance_km ** 0.5)
+    return factor * ((distance_m / 1000.0) ** 0.5)
+
+
+def calculate_tolerances(distances_m, leveling_class: int = None) -> np.ndarray:
+    """
+    Calculate allowable tolerances for many distances at once.
+
+    Array version of calculate_tolerance: one class for all distances.
+
+    Args:
+        distances_m: Array-like of distances in meters
+        leveling_class: Leveling class (1-4), uses default if None
+
+    Returns:
+        Array of allowable tolerances in millimeters
+    """
+    factor = _tolerance_factor(leveling_class)
+    return factor * np.sqrt(np.asarray(distances_m, dtype=np.float64) * 1e-3)
@@ -11,16 +11,46 @@ Features:
 """
 
 import json
+import os
+import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional, faster JSON
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Default settings location
 DEFAULT_SETTINGS_DIR = Path.home() / ".geodetic_tool"
 SETTINGS_FILE = DEFAULT_SETTINGS_DIR / "settings.json"
 
+# Accepted values for default_class
+_VALID_CLASSES: FrozenSet[str] = frozenset({"H1", "H2", "H3", "H4", "H5", "H6"})
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize settings to indented UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse settings JSON (orjson when available).
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the latter either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    # json.loads detects UTF-8 itself, no need to decode to str first
+    return json.loads(data)
+
 
 class SettingsManager:
     """
@@ -38,6 +68,9 @@ class SettingsManager:
         """
         self.settings_file = settings_file or SETTINGS_FILE
         self.settings_dir = self.settings_file.parent
+        # ((st_mtime_ns, st_size), default_class) of the settings file when
+        # default_class was last read from it
+        self._default_class: Optional[Tuple[Tuple[int, int], str]] = None
         self._ensure_settings_dir()
 
     def _ensure_settings_dir(self):
@@ -75,14 +108,45 @@ class SettingsManager:
         }
 
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._write_settings_file(settings)
             logger.info(f"Settings saved successfully to {self.settings_file}")
             return True
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
             return False
 
+    def _write_settings_file(self, settings: Dict[str, Any]):
+        """
+        Write the settings file atomically.
+
+        The JSON goes to a temporary file that then replaces the settings
+        file, so a crash mid-write never leaves a truncated file behind.
+        """
+        tmp_file = self.settings_file.with_suffix(self.settings_file.suffix + ".tmp")
+        try:
+            tmp_file.write_bytes(_dumps(settings))
+            os.replace(tmp_file, self.settings_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def _stored_default_class(self) -> str:
+        """
+        default_class from the settings file (H3 if unset).
+
+        The value is cached against the file's modification time and size,
+        so a file edited elsewhere or restored from a backup is read again.
+        """
+        try:
+            stat = self.settings_file.stat()
+        except OSError:
+            return "H3"
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if self._default_class is None or self._default_class[0] != file_key:
+            default_class = self._load_settings_file().get("default_class", "H3")
+            self._default_class = (file_key, default_class)
+        return self._default_class[1]
+
     def _load_settings_file(self) -> Dict[str, Any]:
         """
         Internal method to load the entire settings file.
@@ -94,8 +158,7 @@ class SettingsManager:
             return {}
 
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _loads(self.settings_file.read_bytes())
         except Exception:
             return {}
 
@@ -111,8 +174,7 @@ class SettingsManager:
             return None
 
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            settings = _loads(self.settings_file.read_bytes())
 
             # Validate format
             if not isinstance(settings, dict) or "class_parameters" not in settings:
@@ -161,9 +223,8 @@ class SettingsManager:
 
         try:
             backup_file = self.settings_file.with_suffix(f".{backup_suffix}.json")
-            with open(self.settings_file, 'r', encoding='utf-8') as src:
-                with open(backup_file, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
+            # copyfile uses the kernel's copy path (sendfile) where available
+            shutil.copyfile(self.settings_file, backup_file)
             logger.info(f"Settings backed up to {backup_file}")
             return backup_file
         except Exception as e:
@@ -177,11 +238,10 @@ class SettingsManager:
         Returns:
             Default class name (H1-H6), defaults to H3 if not set
         """
-        settings = self._load_settings_file()
-        default_class = settings.get("default_class", "H3")
+        default_class = self._stored_default_class()
 
         # Validate that it's a valid class
-        if default_class not in ["H1", "H2", "H3", "H4", "H5", "H6"]:
+        if default_class not in _VALID_CLASSES:
             logger.warning(f"Invalid default class '{default_class}', using H3")
             return "H3"
 
@@ -198,13 +258,17 @@ class SettingsManager:
             True if save successful, False otherwise
         """
         # Validate class name
-        if class_name not in ["H1", "H2", "H3", "H4", "H5", "H6"]:
+        if class_name not in _VALID_CLASSES:
             logger.error(f"Invalid class name: {class_name}. Must be H1-H6.")
             return False
 
         # Load existing settings
         settings = self._load_settings_file()
 
+        # Nothing to write if the file already holds this class
+        if settings.get("default_class") == class_name:
+            return True
+
         # Update default class
         settings["default_class"] = class_name
 
@@ -218,8 +282,7 @@ class SettingsManager:
 
         # Save
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._write_settings_file(settings)
             logger.info(f"Default class set to {class_name}")
             return True
         except Exception as e:
@@ -3,6 +3,7 @@ ADJ Warnings Module
 
 Custom warnings and errors for adjustment computations.
 Provides specialized error classes for matrix operations and adjustment issues.
+All errors derive from AdjustmentError, so callers can catch them together.
 """
 
 
@@ -19,7 +20,16 @@ class IllConditionedMatrixWarning(UserWarning):
     pass
 
 
-class SingularMatrixError(Exception):
+class AdjustmentError(Exception):
+    """
+    Base class for adjustment errors.
+
+    Catch this to handle any of the errors below in one except clause.
+    """
+    pass
+
+
+class SingularMatrixError(AdjustmentError):
     """
     Error raised when a matrix is singular (non-invertible).
 
@@ -32,7 +42,7 @@ class SingularMatrixError(Exception):
     pass
 
 
-class InsufficientObservationsError(Exception):
+class InsufficientObservationsError(AdjustmentError):
     """
     Error raised when there are insufficient observations for adjustment.
 
@@ -42,7 +52,7 @@ class InsufficientObservationsError(Exception):
     pass
 
 
-class ConvergenceError(Exception):
+class ConvergenceError(AdjustmentError):
     """
     Error raised when iterative adjustment fails to converge.
 
@@ -55,7 +65,7 @@ class ConvergenceError(Exception):
     pass
 
 
-class WeightMatrixError(Exception):
+class WeightMatrixError(AdjustmentError):
     """
     Error raised when weight matrix is invalid.
 
@@ -67,7 +77,7 @@ class WeightMatrixError(Exception):
     pass
 
 
-class InvalidNetworkError(Exception):
+class InvalidNetworkError(AdjustmentError):
     """
     Error raised when network configuration is invalid.
 
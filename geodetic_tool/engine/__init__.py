@@ -2,72 +2,72 @@
 Engine Package
 
 Core geodetic calculation modules.
+
+The package exports the adjusters, the loop analyzer and the adjustment
+errors, lazily. Helper functions and lower-level classes are imported from
+their submodules, e.g.
+    from geodetic_tool.engine.height_calculator import calculate_line_totals
+    from geodetic_tool.engine.loop_detector import detect_double_runs
 """
-from .height_calculator import (
-    calculate_height_diff,
-    calculate_line_totals,
-    calculate_misclosure,
-    calculate_allowable_misclosure,
-    distribute_misclosure,
-    apply_corrections,
-    create_measurement_summary,
-    check_bf_consistency,
-    merge_bf_measurements
-)
+import importlib
+import warnings
 
-from .line_adjustment import (
-    LineAdjuster,
-    adjust_single_line
-)
+# Public name -> submodule that defines it. The submodules (and NumPy/SciPy
+# behind them) are only imported when one of their names is first used,
+# see __getattr__ below.
+_LAZY_IMPORTS = {
+    # Line adjustment
+    'LineAdjuster': '.line_adjustment',
 
-from .least_squares import (
-    LeastSquaresAdjuster,
-    ConditionalAdjuster,
-    simple_adjustment
-)
+    # Least squares
+    'LeastSquaresAdjuster': '.least_squares',
+    'ConditionalAdjuster': '.least_squares',
+    'AdjustmentComputations': '.adjustment_computations',
 
-from .adjustment_computations import AdjustmentComputations
+    # Adjustment warnings and errors
+    'IllConditionedMatrixWarning': '.ADJwarnings',
+    'AdjustmentError': '.ADJwarnings',
+    'SingularMatrixError': '.ADJwarnings',
+    'InsufficientObservationsError': '.ADJwarnings',
+    'ConvergenceError': '.ADJwarnings',
+    'WeightMatrixError': '.ADJwarnings',
+    'InvalidNetworkError': '.ADJwarnings',
 
-from .ADJwarnings import (
-    IllConditionedMatrixWarning,
-    SingularMatrixError,
-    InsufficientObservationsError,
-    ConvergenceError,
-    WeightMatrixError,
-    InvalidNetworkError
-)
+    # Loop detection
+    'LoopAnalyzer': '.loop_detector',
+}
 
-from .loop_detector import (
-    Loop,
-    NetworkGraph,
-    LoopAnalyzer,
-    detect_double_runs
-)
+# Names the package used to re-export. Still resolved, with a
+# DeprecationWarning pointing at the submodule to import them from.
+_DEPRECATED_IMPORTS = {
+    'calculate_height_diff': '.height_calculator',
+    'calculate_line_totals': '.height_calculator',
+    'calculate_misclosure': '.height_calculator',
+    'calculate_allowable_misclosure': '.height_calculator',
+    'distribute_misclosure': '.height_calculator',
+    'apply_corrections': '.height_calculator',
+    'create_measurement_summary': '.height_calculator',
+    'check_bf_consistency': '.height_calculator',
+    'merge_bf_measurements': '.height_calculator',
+    'adjust_single_line': '.line_adjustment',
+    'simple_adjustment': '.least_squares',
+    'Loop': '.loop_detector',
+    'NetworkGraph': '.loop_detector',
+    'detect_double_runs': '.loop_detector',
+}
 
 __all__ = [
-    # Height calculator
-    'calculate_height_diff',
-    'calculate_line_totals',
-    'calculate_misclosure',
-    'calculate_allowable_misclosure',
-    'distribute_misclosure',
-    'apply_corrections',
-    'create_measurement_summary',
-    'check_bf_consistency',
-    'merge_bf_measurements',
-    
     # Line adjustment
     'LineAdjuster',
-    'adjust_single_line',
-    
+
     # Least squares - Parametric (Ax+L) and Conditional (Bv+W)
     'LeastSquaresAdjuster',
     'ConditionalAdjuster',
-    'simple_adjustment',
     'AdjustmentComputations',
 
     # Adjustment warnings and errors
     'IllConditionedMatrixWarning',
+    'AdjustmentError',
     'SingularMatrixError',
     'InsufficientObservationsError',
     'ConvergenceError',
@@ -75,8 +75,28 @@ __all__ = [
     'InvalidNetworkError',
 
     # Loop detection
-    'Loop',
-    'NetworkGraph',
     'LoopAnalyzer',
-    'detect_double_runs',
 ]
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        module_name = _DEPRECATED_IMPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        warnings.warn(
+            f"importing {name} from {__name__} is deprecated, "
+            f"import it from {__name__}{module_name} instead",
+            DeprecationWarning, stacklevel=2
+        )
+        # Not cached in globals(), so every use keeps warning
+        return getattr(importlib.import_module(module_name, __name__), name)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,12 +10,11 @@ Implements both:
 """
 from typing import List, Dict, Optional, Tuple
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve, eigh, lstsq, solve_triangular
+from scipy.linalg.blas import dgemv, dsyrk, ssyrk
+from scipy.linalg.lapack import dpocon
 import logging
 import warnings
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from .ADJwarnings import (
     IllConditionedMatrixWarning,
@@ -27,6 +26,89 @@ from .ADJwarnings import (
 
 logger = logging.getLogger(__name__)
 
+# Condition number above which run_linear_adjustment refines its solution
+_REFINEMENT_COND = 1e6
+
+# Accepted values for run_linear_adjustment(precision=...)
+_PRECISIONS = ('f64', 'mixed')
+
+
+def _weight_vector(P: np.ndarray, n_obs: int) -> np.ndarray:
+    """
+    Return the weights of a diagonal weight matrix as a vector.
+
+    P may be the (n_obs, n_obs) diagonal matrix or just its (n_obs,)
+    diagonal. The adjustments only ever need the diagonal, so they work with
+    the vector and never multiply by the dense matrix.
+
+    Raises:
+        ValueError: If P has the wrong shape
+        WeightMatrixError: If a 2-D P has non-zero off-diagonal elements
+    """
+    P = np.asarray(P, dtype=np.float64)
+    if P.shape == (n_obs,):
+        return P
+    if P.shape != (n_obs, n_obs):
+        raise ValueError(
+            f"Weight matrix P must be ({n_obs}, {n_obs}) or ({n_obs},), got {P.shape}"
+        )
+    p = np.diagonal(P)
+    # All off-diagonal elements are zero iff P has no more non-zeros than
+    # its diagonal (no n x n temporary needed)
+    if np.count_nonzero(P) != np.count_nonzero(p):
+        raise WeightMatrixError(
+            "Weight matrix P must be diagonal (uncorrelated observations)"
+        )
+    return p
+
+
+def _residuals(A: np.ndarray, X: np.ndarray, L: np.ndarray) -> np.ndarray:
+    """
+    Residuals V = A X - L from a single BLAS gemv call.
+
+    gemv computes alpha*op(A)*x + beta*y directly into a copy of L, so there
+    is no A X temporary. A.T of a C-ordered A is Fortran-ordered, which gemv
+    takes without copying.
+    """
+    return dgemv(1.0, A.T, X, beta=-1.0, y=L, trans=1)
+
+
+def _lower_triangular_inverse(C: np.ndarray) -> np.ndarray:
+    """
+    Inverses of a stack of lower triangular matrices (k x n x n).
+
+    Row-by-row forward substitution against the identity, vectorized over
+    the stack. C is already triangular, so no LU factorization is needed
+    (scipy's solve_triangular only takes stacks in recent releases).
+    """
+    k, n, _ = C.shape
+    Y = np.zeros_like(C)
+    diag = np.diagonal(C, axis1=1, axis2=2)
+    for i in range(n):
+        # Row i of C Y = I: C[i, :i] Y[:i, :] + C[i, i] Y[i, :] = e_i
+        row = -np.einsum('kj,kjm->km', C[:, i, :i], Y[:, :i, :])
+        row[:, i] += 1.0
+        Y[:, i, :] = row / diag[:, i, None]
+    return Y
+
+
+def _refinement_condition(stability_info: Dict, N: np.ndarray, N_factor) -> float:
+    """
+    Condition number of N that decides on iterative refinement.
+
+    The stability check's fast path only records an upper bound. When that
+    bound is over the refinement limit, cond(N) is estimated from the
+    lower Cholesky factor instead (LAPACK pocon, O(n^2), 1-norm), so a
+    loose bound alone does not trigger refinement.
+    """
+    if 'condition_number' in stability_info:
+        return stability_info['condition_number']
+    bound = stability_info.get('condition_number_bound', 0.0)
+    if bound <= _REFINEMENT_COND:
+        return bound
+    rcond, info = dpocon(N_factor[0], float(np.abs(N).sum(axis=0).max()), uplo='L')
+    return 1.0 / rcond if info == 0 and rcond > 0 else np.inf
+
 
 class AdjustmentComputations:
     """
@@ -72,9 +154,12 @@ class AdjustmentComputations:
 
         Returns:
             Dictionary with stability metrics:
-            - condition_number: Condition number of the matrix
+            - condition_number: Condition number of the matrix (absent
+              when the fast path is taken)
+            - condition_number_bound: Gershgorin upper bound on the
+              condition number (fast path only)
             - rank: Numerical rank
-            - determinant: Determinant value
+            - determinant: Determinant value (absent on the fast path)
             - is_singular: Boolean indicating singularity
             - is_ill_conditioned: Boolean indicating ill-conditioning
 
@@ -93,62 +178,80 @@ class AdjustmentComputations:
 
         stability_info['is_square'] = True
 
-        # Calculate determinant
-        try:
-            det = np.linalg.det(matrix)
-            stability_info['determinant'] = det
-
-            # Check for singularity
-            if abs(det) < 1e-15:
-                stability_info['is_singular'] = True
-                self.logger.error(f"{matrix_name} is singular (det={det:.2e})")
-                raise SingularMatrixError(
-                    f"{matrix_name} is singular with determinant {det:.2e}. "
-                    "This indicates linearly dependent equations or insufficient constraints."
-                )
-            else:
+        # Cheap screen first: every eigenvalue of a symmetric matrix lies in
+        # a Gershgorin disk [d_i - r_i, d_i + r_i]. When all disks sit right
+        # of zero the matrix is positive definite and full rank, and its
+        # condition number is at most hi / lo, so no factorization is needed.
+        # Only that bound is known then, so it gets its own key and the
+        # exact condition number and determinant are left out.
+        if np.array_equal(matrix, matrix.T):
+            diag = np.diagonal(matrix)
+            radii = np.abs(matrix).sum(axis=1) - np.abs(diag)
+            lo = float((diag - radii).min())
+            hi = float((diag + radii).max())
+            if lo > 0 and hi <= self.condition_number_threshold * lo:
                 stability_info['is_singular'] = False
+                stability_info['condition_number_bound'] = hi / lo
+                stability_info['is_ill_conditioned'] = False
+                stability_info['rank'] = matrix.shape[0]
+                self.logger.info(
+                    f"{matrix_name} stability_check=fast_path "
+                    f"(condition number <= {hi / lo:.2e})"
+                )
+                return stability_info
+
+        # A single SVD gives all three metrics: |det| = prod(s),
+        # cond = s_max / s_min and the numerical rank
+        try:
+            singular_values = np.linalg.svd(matrix, compute_uv=False)
         except np.linalg.LinAlgError as e:
-            self.logger.error(f"Failed to compute determinant of {matrix_name}: {e}")
+            self.logger.error(f"Failed to decompose {matrix_name}: {e}")
             stability_info['is_singular'] = True
             raise SingularMatrixError(f"{matrix_name} is singular: {e}")
 
-        # Calculate condition number
-        try:
-            cond = np.linalg.cond(matrix)
-            stability_info['condition_number'] = cond
-
-            # Check for ill-conditioning
-            if cond > self.condition_number_threshold:
-                stability_info['is_ill_conditioned'] = True
-                warning_msg = (
-                    f"{matrix_name} is ill-conditioned with condition number {cond:.2e}. "
-                    f"Results may be numerically unstable. Consider:\n"
-                    f"  - Checking for nearly dependent observations\n"
-                    f"  - Improving network geometry\n"
-                    f"  - Rescaling parameters"
-                )
-                self.logger.warning(warning_msg)
-                warnings.warn(warning_msg, IllConditionedMatrixWarning)
-            else:
-                stability_info['is_ill_conditioned'] = False
+        # Determinant magnitude (the sign is not needed for the checks, and
+        # normal matrices are positive semi-definite anyway)
+        det = float(np.prod(singular_values))
+        stability_info['determinant'] = det
 
-        except np.linalg.LinAlgError as e:
-            self.logger.error(f"Failed to compute condition number of {matrix_name}: {e}")
-            stability_info['condition_number'] = np.inf
+        # Check for singularity
+        if det < 1e-15:
+            stability_info['is_singular'] = True
+            self.logger.error(f"{matrix_name} is singular (det={det:.2e})")
+            raise SingularMatrixError(
+                f"{matrix_name} is singular with determinant {det:.2e}. "
+                "This indicates linearly dependent equations or insufficient constraints."
+            )
+        stability_info['is_singular'] = False
+
+        # Condition number (2-norm, as np.linalg.cond)
+        cond = singular_values[0] / singular_values[-1]
+        stability_info['condition_number'] = cond
+
+        # Check for ill-conditioning
+        if cond > self.condition_number_threshold:
             stability_info['is_ill_conditioned'] = True
+            warning_msg = (
+                f"{matrix_name} is ill-conditioned with condition number {cond:.2e}. "
+                f"Results may be numerically unstable. Consider:\n"
+                f"  - Checking for nearly dependent observations\n"
+                f"  - Improving network geometry\n"
+                f"  - Rescaling parameters"
+            )
+            self.logger.warning(warning_msg)
+            warnings.warn(warning_msg, IllConditionedMatrixWarning)
+        else:
+            stability_info['is_ill_conditioned'] = False
 
-        # Calculate rank
-        try:
-            rank = np.linalg.matrix_rank(matrix)
-            stability_info['rank'] = rank
+        # Numerical rank, with np.linalg.matrix_rank's default tolerance
+        rank_tol = singular_values[0] * max(matrix.shape) * np.finfo(singular_values.dtype).eps
+        rank = int(np.count_nonzero(singular_values > rank_tol))
+        stability_info['rank'] = rank
 
-            if rank < matrix.shape[0]:
-                self.logger.warning(
-                    f"{matrix_name} is rank deficient: rank={rank}, size={matrix.shape[0]}"
-                )
-        except Exception as e:
-            self.logger.error(f"Failed to compute rank of {matrix_name}: {e}")
+        if rank < matrix.shape[0]:
+            self.logger.warning(
+                f"{matrix_name} is rank deficient: rank={rank}, size={matrix.shape[0]}"
+            )
 
         # Log stability summary
         self.logger.info(f"{matrix_name} Stability Check:")
@@ -164,7 +267,10 @@ class AdjustmentComputations:
         A: np.ndarray,
         L: np.ndarray,
         P: np.ndarray,
-        check_stability: bool = True
+        check_stability: bool = True,
+        need_full_qxx: bool = False,
+        allow_rank_deficient: bool = False,
+        precision: str = 'f64'
     ) -> Dict[str, np.ndarray]:
         """
         Run parametric (linear) adjustment: V = A*X - L
@@ -176,24 +282,44 @@ class AdjustmentComputations:
         Args:
             A: Design matrix (n_obs x n_unknowns)
             L: Observation vector (observed - approximate) (n_obs,)
-            P: Weight matrix (n_obs x n_obs), diagonal
+            P: Weight matrix (n_obs x n_obs), diagonal, or its diagonal as
+               a vector (n_obs,)
             check_stability: Whether to perform matrix stability checks
+            need_full_qxx: Also form the full cofactor matrix Qxx (only its
+                diagonal is needed for the standard errors)
+            allow_rank_deficient: On a singular normal matrix, return the
+                minimum-norm least-squares solution (SVD, LAPACK gelsd) with
+                the pseudoinverse as Qxx instead of raising
+            precision: 'f64' (default) or 'mixed'. 'mixed' forms and
+                factors N in float32 from a float32 weighted design matrix,
+                halving their memory and bandwidth, then refines X against
+                float64 residuals. X and V keep full accuracy; N, Qxx and
+                std_errors carry float32 precision (about 7 significant
+                digits) but are returned as float64
 
         Returns:
             Dictionary containing:
             - X: Adjusted parameters (corrections to approximate values)
             - V: Residuals vector
             - N: Normal equation matrix
-            - Qxx: Cofactor matrix of parameters
+            - Qxx: Cofactor matrix of parameters (None unless need_full_qxx)
+            - std_errors: Standard errors of the parameters
             - sigma_0: Standard error of unit weight
             - stability_info: Matrix stability information (if checked)
+            - n_refinement_iters: Iterative refinement steps taken (0 unless
+              the checked condition number exceeds 1e6)
+            - effective_rank: Rank used by the minimum-norm solution (only
+              when allow_rank_deficient took effect; also in stability_info)
 
         Raises:
             ValueError: If matrix dimensions incompatible
+            WeightMatrixError: If P is not diagonal
             InsufficientObservationsError: If not enough observations
             SingularMatrixError: If normal matrix is singular
         """
         # Validate dimensions
+        if precision not in _PRECISIONS:
+            raise ValueError(f"precision must be one of {_PRECISIONS}, got {precision!r}")
         n_obs, n_unknowns = A.shape
 
         if L.shape[0] != n_obs:
@@ -201,10 +327,7 @@ class AdjustmentComputations:
                 f"Dimension mismatch: A has {n_obs} rows but L has {L.shape[0]} elements"
             )
 
-        if P.shape != (n_obs, n_obs):
-            raise ValueError(
-                f"Weight matrix P must be ({n_obs}, {n_obs}), got {P.shape}"
-            )
+        p = _weight_vector(P, n_obs)
 
         # Check for sufficient observations
         degrees_of_freedom = n_obs - n_unknowns
@@ -216,49 +339,115 @@ class AdjustmentComputations:
 
         self.logger.info(f"Linear Adjustment: {n_obs} obs, {n_unknowns} unknowns, {degrees_of_freedom} DOF")
 
-        # Form normal equations
-        N = A.T @ P @ A
-        U = A.T @ P @ L
+        # Form normal equations. P is diagonal, so with Aw = sqrt(P) A the
+        # normal matrix is Aw^T Aw: a symmetric rank-k update (dsyrk) that
+        # computes only the lower triangle, half the flops of a GEMM
+        sqrt_p = np.sqrt(p)
+        if precision == 'mixed':
+            # Weighted design matrix straight in float32: the ufunc casts as
+            # it goes, so no float64 copy of A is made. The float64 residuals
+            # for the refinement come from A itself
+            Aw = np.multiply(A, sqrt_p[:, None], dtype=np.float32)
+            N = ssyrk(1.0, Aw, trans=1, lower=1)
+            U = A.T @ (p * L)
+        else:
+            Aw = A * sqrt_p[:, None]
+            N = dsyrk(1.0, Aw, trans=1, lower=1)
+            U = Aw.T @ (sqrt_p * L)
+        # Mirror the lower triangle; N is also returned and stability-checked
+        N += np.tril(N, -1).T
 
         # Check matrix stability if requested
         result = {}
+        stability_info = {}
+        N_factor = None
         if check_stability:
-            stability_info = self.check_matrix_stability(N, "Normal Matrix N")
+            try:
+                stability_info = self.check_matrix_stability(N, "Normal Matrix N")
+            except SingularMatrixError:
+                if not allow_rank_deficient:
+                    raise
+                stability_info = {'is_square': True, 'is_singular': True}
             result['stability_info'] = stability_info
 
-        # Solve normal equations
-        try:
-            X = np.linalg.solve(N, U)
-            result['X'] = X
-        except np.linalg.LinAlgError as e:
-            self.logger.error(f"Failed to solve normal equations: {e}")
-            raise SingularMatrixError(f"Cannot solve normal equations: {e}")
+        # Solve normal equations. N = A^T P A is symmetric positive definite,
+        # so factor it once (Cholesky) and reuse the factor for Qxx below
+        if not stability_info.get('is_singular', False):
+            try:
+                N_factor = cho_factor(N, lower=True, check_finite=False)
+            except np.linalg.LinAlgError as e:
+                self.logger.error(f"Failed to solve normal equations: {e}")
+                if not allow_rank_deficient:
+                    raise SingularMatrixError(f"Cannot solve normal equations: {e}")
+
+        if N_factor is None:
+            # Rank deficient: minimum-norm solution of the weighted system
+            # by divide-and-conquer SVD, and the pseudoinverse N^+ as Qxx
+            if precision == 'mixed':
+                Aw = A * sqrt_p[:, None]
+            return self._run_rank_deficient_adjustment(
+                A, L, p, Aw, sqrt_p, N.astype(np.float64, copy=False), result, need_full_qxx
+            )
+
+        X = cho_solve(N_factor, U, check_finite=False)
+
+        # Iterative refinement for ill-conditioned systems and for the
+        # float32 factor: each step reuses the Cholesky factor, so it costs
+        # one triangular pair plus a residual in higher precision than the
+        # factor, and recovers digits lost to cond(N) or to float32
+        n_refinement_iters = 0
+        if precision == 'mixed':
+            # U - N X = A^T P (L - A X) in float64, straight from A
+            def normal_residual(X):
+                return A.T @ (p * (L - A @ X))
+        elif _refinement_condition(stability_info, N, N_factor) > _REFINEMENT_COND:
+            N_ext = N.astype(np.longdouble)
+            U_ext = U.astype(np.longdouble)
+
+            def normal_residual(X):
+                return np.asarray(U_ext - N_ext @ X, dtype=np.float64)
+        else:
+            normal_residual = None
+        if normal_residual is not None:
+            converged = False
+            for _ in range(self.max_iterations):
+                dX = cho_solve(N_factor, normal_residual(X), check_finite=False)
+                X = X + dX
+                n_refinement_iters += 1
+                if np.linalg.norm(dX) < self.tolerance * np.linalg.norm(X):
+                    converged = True
+                    break
+            self.logger.info(f"Iterative refinement: {n_refinement_iters} iteration(s)")
+            if not converged:
+                self.logger.warning(
+                    f"Iterative refinement did not converge in {self.max_iterations} iterations"
+                )
+        result['X'] = X
+        result['n_refinement_iters'] = n_refinement_iters
 
         # Calculate residuals
-        V = A @ X - L
+        V = _residuals(A, X, L)
         result['V'] = V
 
         # Calculate variance factor (sigma_0^2)
-        VtPV = V.T @ P @ V
+        VtPV = (V * p) @ V
         sigma_0_squared = VtPV / degrees_of_freedom
         sigma_0 = np.sqrt(sigma_0_squared)
         result['sigma_0'] = sigma_0
         result['sigma_0_squared'] = sigma_0_squared
 
-        # Calculate cofactor matrix
-        try:
-            Qxx = np.linalg.inv(N)
-            result['Qxx'] = Qxx
-            result['N'] = N
+        # Cofactors Qxx = N^-1 from the same factor: with N = C C^T and
+        # Y = C^-1, Qxx = Y^T Y, so diag(Qxx) is the column sums of Y*Y and
+        # the full matrix is only formed on request
+        Y = solve_triangular(N_factor[0], np.eye(n_unknowns, dtype=N.dtype),
+                             lower=True, check_finite=False).astype(np.float64, copy=False)
+        result['Qxx'] = Y.T @ Y if need_full_qxx else None
+        # float64 in both precisions ('mixed' widens its float32 N)
+        result['N'] = N.astype(np.float64, copy=False)
 
-            # Calculate standard errors of parameters
-            std_errors = sigma_0 * np.sqrt(np.diag(Qxx))
-            result['std_errors'] = std_errors
-
-        except np.linalg.LinAlgError as e:
-            self.logger.warning(f"Failed to invert N for cofactor matrix: {e}")
-            result['Qxx'] = None
-            result['std_errors'] = None
+        # Calculate standard errors of parameters
+        std_errors = sigma_0 * np.sqrt(np.einsum('ij,ij->j', Y, Y))
+        result['std_errors'] = std_errors
 
         # Log results
         self.logger.info(f"Adjustment completed:")
@@ -268,6 +457,182 @@ class AdjustmentComputations:
 
         return result
 
+    def _run_rank_deficient_adjustment(
+        self,
+        A: np.ndarray,
+        L: np.ndarray,
+        p: np.ndarray,
+        Aw: np.ndarray,
+        sqrt_p: np.ndarray,
+        N: np.ndarray,
+        result: Dict[str, np.ndarray],
+        need_full_qxx: bool
+    ) -> Dict[str, np.ndarray]:
+        """
+        Finish run_linear_adjustment for a singular normal matrix.
+
+        Solves min ||sqrt(P)(A X - L)|| for the minimum-norm X with LAPACK
+        gelsd. Cofactors are the pseudoinverse N^+ = V S^+2 V^T, built from
+        the eigenpairs of N for the effective rank.
+        """
+        n_obs, n_unknowns = A.shape
+        X, _, rank, _ = lstsq(Aw, sqrt_p * L, lapack_driver='gelsd', check_finite=False)
+        rank = int(rank)
+        self.logger.warning(
+            f"Normal matrix is rank deficient (rank={rank}, size={n_unknowns}); "
+            f"using the minimum-norm solution"
+        )
+        result.setdefault('stability_info', {})['effective_rank'] = rank
+        result['effective_rank'] = rank
+        result['X'] = X
+        result['n_refinement_iters'] = 0
+
+        V = _residuals(A, X, L)
+        result['V'] = V
+
+        # A datum defect removes n_unknowns - rank parameters, not observations
+        degrees_of_freedom = n_obs - rank
+        sigma_0_squared = (V * p) @ V / degrees_of_freedom
+        sigma_0 = np.sqrt(sigma_0_squared)
+        result['sigma_0'] = sigma_0
+        result['sigma_0_squared'] = sigma_0_squared
+
+        # N^+ = Y^T Y with Y = diag(1/sqrt(w)) Q^T over the largest `rank`
+        # eigenpairs, the same form as the full-rank path
+        w, Q = eigh(N, check_finite=False)
+        Y = (Q[:, n_unknowns - rank:] / np.sqrt(w[n_unknowns - rank:])).T
+        result['Qxx'] = Y.T @ Y if need_full_qxx else None
+        # float64 in both precisions ('mixed' widens its float32 N)
+        result['N'] = N.astype(np.float64, copy=False)
+        result['std_errors'] = sigma_0 * np.sqrt(np.einsum('ij,ij->j', Y, Y))
+
+        self.logger.info(f"Adjustment completed (minimum-norm):")
+        self.logger.info(f"  Sigma_0: {sigma_0:.4f}")
+        self.logger.info(f"  Max residual: {np.max(np.abs(V)):.4f}")
+        return result
+
+    def run_linear_adjustment_batch(
+        self,
+        problems: List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        check_stability: bool = True
+    ) -> List[Dict[str, np.ndarray]]:
+        """
+        Run many independent linear adjustments, e.g. one per leveling line.
+
+        Problems with the same (n_obs, n_unknowns) shape are stacked and
+        solved together: one batched Cholesky and one batched triangular
+        inverse for the whole group instead of a LAPACK dispatch per line.
+        This is the block-diagonal system of all the lines, factored block
+        by block. Problems of a unique shape, ill-conditioned ones and
+        groups that fail to factor go through run_linear_adjustment.
+
+        Args:
+            problems: Sequence of (A, L, P) tuples, as for run_linear_adjustment
+            check_stability: Check each normal matrix before solving
+
+        Returns:
+            One result dictionary per problem, in input order, with the same
+            keys as run_linear_adjustment
+        """
+        results: List[Optional[Dict[str, np.ndarray]]] = [None] * len(problems)
+
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for i, (A, _, _) in enumerate(problems):
+            groups.setdefault(np.shape(A), []).append(i)
+
+        for shape, indices in groups.items():
+            if len(indices) > 1 and len(shape) == 2 and shape[0] > shape[1]:
+                self._solve_linear_group(problems, indices, check_stability, results)
+            for i in indices:
+                if results[i] is None:
+                    A, L, P = problems[i]
+                    results[i] = self.run_linear_adjustment(A, L, P, check_stability)
+
+        return results
+
+    def _solve_linear_group(
+        self,
+        problems: List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        indices: List[int],
+        check_stability: bool,
+        results: List[Optional[Dict[str, np.ndarray]]]
+    ):
+        """
+        Solve same-shape linear adjustments as one stacked system.
+
+        Fills results for the problems it solves and leaves the others (ill
+        conditioned, or the whole group if a factorization fails) as None.
+        """
+        n_obs, n_unknowns = np.shape(problems[indices[0]][0])
+        A = np.stack([np.asarray(problems[i][0], dtype=np.float64) for i in indices])
+        L = np.stack([np.asarray(problems[i][1], dtype=np.float64) for i in indices])
+        if L.shape != (len(indices), n_obs):
+            return
+        p = np.stack([_weight_vector(problems[i][2], n_obs) for i in indices])
+
+        sqrt_p = np.sqrt(p)
+        Aw = A * sqrt_p[:, :, None]
+        Awt = Aw.transpose(0, 2, 1)
+        N = Awt @ Aw
+        U = (Awt @ (sqrt_p * L)[:, :, None])[:, :, 0]
+
+        stability = [None] * len(indices)
+        keep = np.ones(len(indices), dtype=bool)
+        if check_stability:
+            for j in range(len(indices)):
+                try:
+                    stability[j] = self.check_matrix_stability(N[j], "Normal Matrix N")
+                except SingularMatrixError:
+                    keep[j] = False
+                    continue
+                # Leave these to run_linear_adjustment's iterative refinement.
+                # On the fast path only the upper bound is known; blocks over
+                # the limit go the single-problem route, which estimates the
+                # actual condition number before refining
+                cond = stability[j].get(
+                    'condition_number', stability[j].get('condition_number_bound', 0.0)
+                )
+                if cond > _REFINEMENT_COND:
+                    keep[j] = False
+            if not keep.any():
+                return
+
+        # N = C C^T for every block at once; Y = C^-1 gives X = Y^T Y U and
+        # diag(Qxx) as the column sums of Y*Y, as in run_linear_adjustment
+        try:
+            C = np.linalg.cholesky(N[keep])
+        except np.linalg.LinAlgError:
+            return
+        Y = _lower_triangular_inverse(C)
+        Yt = Y.transpose(0, 2, 1)
+        X = (Yt @ (Y @ U[keep][:, :, None]))[:, :, 0]
+        V = (A[keep] @ X[:, :, None])[:, :, 0] - L[keep]
+
+        degrees_of_freedom = n_obs - n_unknowns
+        sigma_0_squared = np.einsum('ki,ki,ki->k', V, p[keep], V) / degrees_of_freedom
+        sigma_0 = np.sqrt(sigma_0_squared)
+        std_errors = sigma_0[:, None] * np.sqrt(np.einsum('kij,kij->kj', Y, Y))
+
+        for b, j in enumerate(np.flatnonzero(keep)):
+            result = {
+                'X': X[b],
+                'n_refinement_iters': 0,
+                'V': V[b],
+                'sigma_0': sigma_0[b],
+                'sigma_0_squared': sigma_0_squared[b],
+                'Qxx': None,
+                'N': N[j],
+                'std_errors': std_errors[b],
+            }
+            if check_stability:
+                result['stability_info'] = stability[j]
+            results[indices[j]] = result
+
+        self.logger.info(
+            f"Batched linear adjustment: {int(keep.sum())} problems of "
+            f"{n_obs} obs x {n_unknowns} unknowns"
+        )
+
     def run_conditional_adjustment(
         self,
         B: np.ndarray,
@@ -287,7 +652,8 @@ class AdjustmentComputations:
         Args:
             B: Condition matrix (n_conditions x n_obs)
             w: Misclosure vector (n_conditions,)
-            P: Weight matrix (n_obs x n_obs), diagonal
+            P: Weight matrix (n_obs x n_obs), diagonal, or its diagonal as
+               a vector (n_obs,)
             check_stability: Whether to perform matrix stability checks
 
         Returns:
@@ -300,6 +666,7 @@ class AdjustmentComputations:
 
         Raises:
             ValueError: If matrix dimensions incompatible
+            WeightMatrixError: If P is not diagonal
             InsufficientObservationsError: If system is under-determined
             SingularMatrixError: If normal matrix is singular
         """
@@ -311,10 +678,7 @@ class AdjustmentComputations:
                 f"Dimension mismatch: B has {n_conditions} rows but w has {w.shape[0]} elements"
             )
 
-        if P.shape != (n_obs, n_obs):
-            raise ValueError(
-                f"Weight matrix P must be ({n_obs}, {n_obs}), got {P.shape}"
-            )
+        p = _weight_vector(P, n_obs)
 
         # Check for sufficient redundancy
         degrees_of_freedom = n_obs - n_conditions
@@ -327,17 +691,9 @@ class AdjustmentComputations:
         self.logger.info(f"Conditional Adjustment: {n_obs} obs, {n_conditions} conditions, {degrees_of_freedom} DOF")
 
         # Form normal equations: N*k = u
-        # N = B * P^-1 * B^T
-        try:
-            P_inv = np.linalg.inv(P)
-        except np.linalg.LinAlgError:
-            # If P is diagonal, just invert diagonal elements
-            if np.count_nonzero(P - np.diag(np.diagonal(P))) == 0:
-                P_inv = np.diag(1.0 / np.diagonal(P))
-            else:
-                raise WeightMatrixError("Weight matrix P is singular and non-diagonal")
-
-        N = B @ P_inv @ B.T
+        # N = B * P^-1 * B^T, with P^-1 the reciprocal weights (cofactors)
+        q = 1.0 / p
+        N = (B * q) @ B.T
         u = -w
 
         # Check matrix stability if requested
@@ -355,11 +711,14 @@ class AdjustmentComputations:
             raise SingularMatrixError(f"Cannot solve conditional normal equations: {e}")
 
         # Calculate residuals
-        v = -P_inv @ B.T @ k
+        # -B^T k straight from gemv (B.T is Fortran-ordered, so no copy),
+        # then scaled by P^-1 in place
+        v = dgemv(-1.0, B.T, k)
+        v *= q
         result['v'] = v
 
         # Calculate variance factor
-        vtPv = v.T @ P @ v
+        vtPv = (v * p) @ v
         sigma_0_squared = vtPv / degrees_of_freedom
         sigma_0 = np.sqrt(sigma_0_squared)
         result['sigma_0'] = sigma_0
@@ -396,7 +755,10 @@ class AdjustmentComputations:
             output_path: Optional path to save the plot
         """
         try:
-            import matplotlib.pyplot as plt
+            if output_path:
+                from matplotlib.figure import Figure
+            else:
+                import matplotlib.pyplot as plt
         except ImportError:
             self.logger.warning("matplotlib not available - cannot plot residuals")
             return
@@ -405,35 +767,50 @@ class AdjustmentComputations:
         if observation_ids is None:
             observation_ids = [f"Obs {i+1}" for i in range(n_obs)]
 
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-
-        # Bar plot of residuals
-        colors = ['red' if abs(v) > 2*np.std(residuals) else 'blue' for v in residuals]
-        ax1.bar(range(n_obs), residuals * 1000, color=colors, alpha=0.7)
-        ax1.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
-        ax1.axhline(y=2*np.std(residuals)*1000, color='red', linestyle='--', linewidth=0.8, label='±2σ')
-        ax1.axhline(y=-2*np.std(residuals)*1000, color='red', linestyle='--', linewidth=0.8)
-        ax1.set_xlabel('Observation')
-        ax1.set_ylabel('Residual (mm)')
-        ax1.set_title(f'{title} - Residual Distribution')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-
-        # Histogram
-        ax2.hist(residuals * 1000, bins=20, alpha=0.7, color='blue', edgecolor='black')
-        ax2.axvline(x=0, color='red', linestyle='--', linewidth=1.5, label='Zero')
-        ax2.set_xlabel('Residual (mm)')
-        ax2.set_ylabel('Frequency')
-        ax2.set_title('Residual Histogram')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-
-        plt.tight_layout()
-
         if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-            self.logger.info(f"Residuals plot saved to {output_path}")
+            # A bare Figure renders with Agg on savefig and is never
+            # registered with pyplot, so nothing is retained afterwards and
+            # no display is needed
+            fig = Figure(figsize=(12, 8))
+            ax1, ax2 = fig.subplots(2, 1)
         else:
-            plt.show()
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
 
-        plt.close()
+        try:
+            residuals = np.asarray(residuals, dtype=np.float64)
+            residuals_mm = residuals * 1000
+            sigma = float(np.std(residuals))
+
+            # Bar plot of residuals, outliers beyond 2 sigma in red
+            colors = np.where(np.abs(residuals) > 2 * sigma, 'red', 'blue')
+            ax1.bar(range(n_obs), residuals_mm, color=colors.tolist(), alpha=0.7)
+            ax1.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
+            ax1.axhline(y=2*sigma*1000, color='red', linestyle='--', linewidth=0.8, label='±2σ')
+            ax1.axhline(y=-2*sigma*1000, color='red', linestyle='--', linewidth=0.8)
+            ax1.set_xlabel('Observation')
+            ax1.set_ylabel('Residual (mm)')
+            ax1.set_title(f'{title} - Residual Distribution')
+            ax1.legend()
+            ax1.grid(True, alpha=0.3)
+
+            # Histogram, binned once with NumPy and drawn as bars
+            counts, edges = np.histogram(residuals_mm, bins=20)
+            ax2.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                    alpha=0.7, color='blue', edgecolor='black')
+            ax2.axvline(x=0, color='red', linestyle='--', linewidth=1.5, label='Zero')
+            ax2.set_xlabel('Residual (mm)')
+            ax2.set_ylabel('Frequency')
+            ax2.set_title('Residual Histogram')
+            ax2.legend()
+            ax2.grid(True, alpha=0.3)
+
+            fig.tight_layout()
+
+            if output_path:
+                fig.savefig(output_path, dpi=300, bbox_inches='tight')
+                self.logger.info(f"Residuals plot saved to {output_path}")
+            else:
+                plt.show()
+        finally:
+            if not output_path:
+                plt.close(fig)
@@ -4,13 +4,9 @@ Height Calculator Module
 Core height difference calculations for leveling.
 """
 from typing import List, Dict, Optional, Tuple
-from pathlib import Path
 import numpy as np
 import logging
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from ..config.models import LevelingLine, StationSetup, MeasurementSummary
 from ..config.settings import calculate_tolerance
 
@@ -163,12 +159,10 @@ def apply_corrections(line: LevelingLine, corrections: List[float]) -> LevelingL
     cumulative_height = 0.0
     
     for setup, correction in zip(line.setups, corrections):
-        # Apply correction to height difference
+        # Apply the correction and carry the running height in one pass;
+        # setups without a height difference take no correction
         if setup.height_diff is not None:
             setup.height_diff += correction
-        
-        # Update cumulative height
-        if setup.height_diff is not None:
             cumulative_height += setup.height_diff
         setup.cumulative_height = cumulative_height
     
@@ -36,9 +36,13 @@ Conditional Method (Bv+W):
               u = -w
               k = correlates (Lagrange multipliers)
 """
-from typing import List, Dict, Optional, Tuple
+from itertools import chain
+from typing import List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import lsmr
 import logging
 
 import sys
@@ -49,6 +53,7 @@ from ..config.models import (
 )
 from ..config.settings import calculate_tolerance
 from .adjustment_computations import AdjustmentComputations
+from .._fast import apply_height_corrections, height_misclosures
 from .ADJwarnings import (
     SingularMatrixError,
     InsufficientObservationsError,
@@ -58,6 +63,99 @@ from .ADJwarnings import (
 
 logger = logging.getLogger(__name__)
 
+# Accepted values for LeastSquaresAdjuster(solver=...)
+_SOLVERS = ("cholesky", "lsmr")
+
+# LSMR stopping tolerances (relative); the outer iterations refine further
+_LSMR_TOL = 1e-12
+
+
+def _distance_weights(dist_km: np.ndarray) -> np.ndarray:
+    """
+    Observation weights 1/distance (km), the diagonal of P.
+
+    Observations without a positive distance get weight 1.
+    """
+    weights = np.ones(dist_km.shape)
+    np.divide(1.0, dist_km, out=weights, where=dist_km > 0)
+    return weights
+
+
+def _design_matrix(
+    to_idx: np.ndarray,
+    from_idx: np.ndarray,
+    n_unknowns: int
+) -> Tuple[csr_matrix, np.ndarray, np.ndarray]:
+    """
+    Sparse design matrix A (n_obs x n_unknowns) of the leveling network.
+
+    dH = H_to - H_from: the partial derivative w.r.t. H_to is +1 and w.r.t.
+    H_from is -1, for the ends that are unknowns (index < n_unknowns). Each
+    row has at most these two entries. The from entry wins if both ends are
+    the same point.
+
+    Returns:
+        Tuple of (A, mask of rows whose to end is an unknown, mask of rows
+        whose from end is an unknown)
+    """
+    n_obs = to_idx.size
+    rows = np.arange(n_obs)
+    to_unknown = (to_idx < n_unknowns) & (to_idx != from_idx)
+    from_unknown = from_idx < n_unknowns
+    A = csr_matrix(
+        (
+            np.concatenate((np.ones(np.count_nonzero(to_unknown)),
+                            np.full(np.count_nonzero(from_unknown), -1.0))),
+            (np.concatenate((rows[to_unknown], rows[from_unknown])),
+             np.concatenate((to_idx[to_unknown], from_idx[from_unknown])))
+        ),
+        shape=(n_obs, n_unknowns)
+    )
+    return A, to_unknown, from_unknown
+
+
+def _normal_matrix(
+    to_idx: np.ndarray,
+    from_idx: np.ndarray,
+    to_unknown: np.ndarray,
+    from_unknown: np.ndarray,
+    weights: np.ndarray,
+    n_unknowns: int
+) -> np.ndarray:
+    """
+    Normal matrix N = A^T P A, assembled without a matrix product.
+
+    N is the weighted graph Laplacian of the unknowns: observation i adds
+    w_i to N[t,t] and N[f,f] and -w_i to N[t,f] and N[f,t], for the ends t, f
+    that are unknowns. Scatter-adding those entries with bincount is O(n_obs).
+    """
+    both = to_unknown & from_unknown
+    return np.bincount(
+        np.concatenate((
+            to_idx[to_unknown] * (n_unknowns + 1),
+            from_idx[from_unknown] * (n_unknowns + 1),
+            to_idx[both] * n_unknowns + from_idx[both],
+            from_idx[both] * n_unknowns + to_idx[both],
+        )),
+        weights=np.concatenate((
+            weights[to_unknown], weights[from_unknown],
+            -weights[both], -weights[both],
+        )),
+        minlength=n_unknowns * n_unknowns
+    ).reshape(n_unknowns, n_unknowns)
+
+
+def _cofactor_diagonal(N_factor) -> np.ndarray:
+    """
+    diag(Qxx), Qxx = N^-1, from the lower Cholesky factor of N.
+
+    With N = C C^T and Y = C^-1, diag(Qxx) is the column sums of Y*Y: one
+    triangular solve, and the full inverse is never formed.
+    """
+    C = N_factor[0]
+    Y = solve_triangular(C, np.eye(C.shape[0]), lower=True, check_finite=False)
+    return np.einsum('ij,ij->j', Y, Y)
+
 
 class LeastSquaresAdjuster:
     """
@@ -71,7 +169,8 @@ class LeastSquaresAdjuster:
         self,
         max_iterations: int = 10,
         tolerance: float = 1e-6,
-        check_stability: bool = True
+        check_stability: bool = True,
+        solver: str = "cholesky"
     ):
         """
         Initialize the adjuster.
@@ -80,7 +179,17 @@ class LeastSquaresAdjuster:
             max_iterations: Maximum number of iterations
             tolerance: Convergence tolerance (meters)
             check_stability: Whether to perform matrix stability checks
+            solver: "cholesky" (default) factors the normal matrix once;
+                "lsmr" solves the weighted rectangular system sqrt(P) A dX =
+                sqrt(P) L iteratively without forming N, avoiding its squared
+                condition number (for very large or poorly conditioned
+                networks). N is then only formed once, for the height MSEs,
+                without the stability check; if it cannot be factored the
+                MSEs are left out (empty mse_heights).
         """
+        if solver not in _SOLVERS:
+            raise ValueError(f"solver must be one of {_SOLVERS}, got {solver!r}")
+        self.solver = solver
         self.max_iterations = max_iterations
         self.tolerance = tolerance
         self.check_stability = check_stability
@@ -107,140 +216,315 @@ class LeastSquaresAdjuster:
         Returns:
             AdjustmentResult with adjusted heights and statistics
         """
-        if not observations:
+        n_obs = len(observations)
+        return self._adjust_arrays(
+            [obs.from_point for obs in observations],
+            [obs.to_point for obs in observations],
+            np.fromiter((obs.height_diff for obs in observations),
+                        dtype=np.float64, count=n_obs),
+            np.fromiter((obs.distance for obs in observations),
+                        dtype=np.float64, count=n_obs),
+            fixed_points,
+            approximate_heights
+        )
+    
+    def adjust_batch(
+        self,
+        observations_list: List[List[MeasurementSummary]],
+        fixed_points: Dict[str, float],
+        approximate_heights: Optional[Dict[str, float]] = None
+    ) -> List[AdjustmentResult]:
+        """
+        Adjust several observation sets of the same network together.
+        
+        Repeated epochs (or datasets) measured over the same lines differ
+        only in their observed height differences, so A, P and N are shared.
+        N is factored once and each iteration solves all sets at once, with
+        their right-hand sides as the columns of one matrix. This always uses
+        the Cholesky factor, whatever the solver setting.
+        
+        Args:
+            observations_list: Observation sets, each listing the same
+                (from_point, to_point, distance) observations in the same order
+            fixed_points: Dictionary of fixed benchmark heights {point_id: height}
+            approximate_heights: Initial approximate heights for unknown points
+            
+        Returns:
+            One AdjustmentResult per observation set, in order
+            
+        Raises:
+            ValueError: If the sets do not share the same observations
+        """
+        if not observations_list:
+            raise ValueError("No observation sets provided")
+        
+        first = observations_list[0]
+        n_obs = len(first)
+        from_points = [obs.from_point for obs in first]
+        to_points = [obs.to_point for obs in first]
+        distances = np.fromiter(
+            (obs.distance for obs in first), dtype=np.float64, count=n_obs
+        )
+        for k, observations in enumerate(observations_list[1:], 1):
+            if len(observations) != n_obs or any(
+                obs.from_point != from_pt or obs.to_point != to_pt or obs.distance != dist
+                for obs, from_pt, to_pt, dist
+                in zip(observations, from_points, to_points, distances.tolist())
+            ):
+                raise ValueError(
+                    f"Observation set {k} does not match the observations of set 0"
+                )
+        
+        unknown_list, heights, from_idx, to_idx = self._index_network(
+            from_points, to_points, fixed_points, approximate_heights
+        )
+        n_unknowns = len(unknown_list)
+        n_sets = len(observations_list)
+        
+        # Observed height differences, one column per set, and the heights
+        # of every set starting from the same values
+        observed_dh = np.array(
+            [[obs.height_diff for obs in observations] for observations in observations_list],
+            dtype=np.float64
+        ).T.reshape(n_obs, n_sets)
+        heights = np.repeat(heights[:, None], n_sets, axis=1)
+        
+        dist_km = distances / 1000.0
+        A, to_unknown, from_unknown = _design_matrix(to_idx, from_idx, n_unknowns)
+        weights = _distance_weights(dist_km)
+        N_factor = self._factor_normal_matrix(
+            _normal_matrix(to_idx, from_idx, to_unknown, from_unknown, weights, n_unknowns)
+        )
+        
+        # Iterate all sets together until every set has converged
+        for iteration in range(1, self.max_iterations + 1):
+            L = observed_dh - (heights[to_idx] - heights[from_idx])
+            # One multi-column solve N dX = A^T P L against the cached factor
+            dX = cho_solve(N_factor, A.T @ (weights[:, None] * L), check_finite=False)
+            heights[:n_unknowns] += dX
+            
+            if np.abs(dX).max() < self.tolerance:
+                logger.info(f"Converged after {iteration} iterations")
+                break
+        
+        V = A @ dX - L
+        qxx_diag = _cofactor_diagonal(N_factor)
+        return [
+            self._build_result(
+                iteration, unknown_list, heights[:n_unknowns, j], fixed_points,
+                from_points, to_points, V[:, j], weights, dist_km, qxx_diag
+            )
+            for j in range(n_sets)
+        ]
+    
+    def _adjust_arrays(
+        self,
+        from_points: Sequence[str],
+        to_points: Sequence[str],
+        observed_dh: np.ndarray,
+        distances: np.ndarray,
+        fixed_points: Dict[str, float],
+        approximate_heights: Optional[Dict[str, float]] = None
+    ) -> AdjustmentResult:
+        """
+        Least squares adjustment core on plain arrays.
+        
+        The public entry points only unpack their inputs into these arrays,
+        so no per-observation objects are built on the way in.
+        
+        Args:
+            from_points, to_points: Point ids of each observation's ends
+            observed_dh: Observed height differences in meters
+            distances: Observation lengths in meters
+            fixed_points: Dictionary of fixed benchmark heights {point_id: height}
+            approximate_heights: Initial approximate heights for unknown points
+            
+        Returns:
+            AdjustmentResult with adjusted heights and statistics
+        """
+        unknown_list, heights, from_idx, to_idx = self._index_network(
+            from_points, to_points, fixed_points, approximate_heights
+        )
+        n_unknowns = len(unknown_list)
+        observed_dh = np.asarray(observed_dh, dtype=np.float64)
+        dist_km = np.asarray(distances, dtype=np.float64) / 1000.0
+        
+        A, to_unknown, from_unknown = _design_matrix(to_idx, from_idx, n_unknowns)
+        
+        # Weights (diagonal of P, weight = 1/distance in km, 1 if no
+        # distance), kept as a vector: the dense n_obs x n_obs P is never built
+        weights = _distance_weights(dist_km)
+        
+        if self.solver == "lsmr":
+            # Row-scaled system sqrt(P) A dX = sqrt(P) L, solved by LSMR
+            sqrt_w = np.sqrt(weights)
+            Aw = csr_matrix(A.multiply(sqrt_w[:, None]))
+            N_factor = None
+        else:
+            # A and P do not change between iterations, so neither does
+            # N = A^T P A: check and factor it once, then each iteration is a
+            # single pair of triangular solves against the new right-hand side
+            N_factor = self._factor_normal_matrix(
+                _normal_matrix(to_idx, from_idx, to_unknown, from_unknown, weights, n_unknowns)
+            )
+            to_cols = to_idx[to_unknown]
+            from_cols = from_idx[from_unknown]
+        
+        # Iterative adjustment
+        for iteration in range(1, self.max_iterations + 1):
+            # Observation vector L (observed - computed)
+            L = height_misclosures(observed_dh, heights, to_idx, from_idx)
+            
+            if N_factor is None:
+                dX = lsmr(Aw, sqrt_w * L, atol=_LSMR_TOL, btol=_LSMR_TOL)[0]
+            else:
+                # U = A^T P L by the same scatter-add as N, then solve
+                # N dX = U with the cached factor
+                wL = weights * L
+                U = (np.bincount(to_cols, wL[to_unknown], minlength=n_unknowns)
+                     - np.bincount(from_cols, wL[from_unknown], minlength=n_unknowns))
+                dX = cho_solve(N_factor, U, check_finite=False)
+            
+            # Apply corrections
+            max_correction = apply_height_corrections(heights, dX)
+            
+            # Check convergence
+            if max_correction < self.tolerance:
+                logger.info(f"Converged after {iteration} iterations")
+                break
+        
+        # Calculate residuals
+        V = A @ dX - L
+        
+        if N_factor is None:
+            # LSMR never formed N, but the height M.S.E.s need a factor of it.
+            # Skip the stability check (LSMR is meant for exactly the networks
+            # it would reject) and only go without the M.S.E.s if the
+            # factorization itself fails
+            try:
+                N_factor = cho_factor(
+                    _normal_matrix(to_idx, from_idx, to_unknown, from_unknown,
+                                   weights, n_unknowns),
+                    lower=True, check_finite=False
+                )
+            except np.linalg.LinAlgError as e:
+                logger.warning(f"Height M.S.E.s unavailable, cannot factor N: {e}")
+        
+        return self._build_result(
+            iteration, unknown_list, heights[:n_unknowns], fixed_points,
+            from_points, to_points, V, weights, dist_km,
+            None if N_factor is None else _cofactor_diagonal(N_factor)
+        )
+    
+    def _index_network(
+        self,
+        from_points: Sequence[str],
+        to_points: Sequence[str],
+        fixed_points: Dict[str, float],
+        approximate_heights: Optional[Dict[str, float]]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Index the observed points and check the network can be adjusted.
+        
+        Unknowns take indices 0..n_unknowns-1 (the columns of A), fixed
+        points follow and only enter L.
+        
+        Returns:
+            Tuple of (unknown point ids, heights of all indexed points,
+            from index, to index of each observation)
+        """
+        if len(from_points) == 0:
             raise ValueError("No observations provided")
         
         if not fixed_points:
             raise ValueError("At least one fixed point required")
         
         # Get all unique points
-        all_points = set()
-        for obs in observations:
-            all_points.add(obs.from_point)
-            all_points.add(obs.to_point)
+        all_points = set(from_points)
+        all_points.update(to_points)
         
         # Separate fixed and unknown points
         fixed_ids = set(fixed_points.keys())
         unknown_ids = all_points - fixed_ids
         unknown_list = sorted(unknown_ids)
         
-        n_obs = len(observations)
+        n_obs = len(from_points)
         n_unknowns = len(unknown_list)
         
         if n_unknowns == 0:
             raise ValueError("All points are fixed - nothing to adjust")
         
-        # Create point index mapping
-        point_index = {pid: i for i, pid in enumerate(unknown_list)}
+        if n_obs - n_unknowns <= 0:
+            raise InsufficientObservationsError(
+                f"Insufficient observations: {n_obs} observations for {n_unknowns} unknowns. "
+                f"Need at least {n_unknowns + 1} observations."
+            )
         
         # Initialize approximate heights
         if approximate_heights is None:
             approximate_heights = {}
         
-        # Estimate approximate heights for unknowns
-        current_heights = dict(fixed_points)
-        for pid in unknown_list:
-            if pid in approximate_heights:
-                current_heights[pid] = approximate_heights[pid]
-            else:
-                current_heights[pid] = 0.0  # Will be updated iteratively
+        fixed_list = sorted(all_points & fixed_ids)
+        height_ids = unknown_list + fixed_list
+        height_index = {pid: i for i, pid in enumerate(height_ids)}
         
-        # Iterative adjustment
-        for iteration in range(1, self.max_iterations + 1):
-            # Build design matrix A (n_obs x n_unknowns)
-            A = np.zeros((n_obs, n_unknowns))
-            
-            # Build observation vector L (observed - computed)
-            L = np.zeros(n_obs)
-            
-            # Build weight matrix P (diagonal, weight = 1/distance in km)
-            P = np.zeros((n_obs, n_obs))
-            
-            for i, obs in enumerate(observations):
-                from_pt = obs.from_point
-                to_pt = obs.to_point
-                
-                # Observed height difference
-                observed_dh = obs.height_diff
-                
-                # Computed height difference
-                computed_dh = current_heights.get(to_pt, 0) - current_heights.get(from_pt, 0)
-                
-                # Misclosure
-                L[i] = observed_dh - computed_dh
-                
-                # Design matrix coefficients
-                # dH = H_to - H_from
-                # Partial derivative w.r.t. H_to = +1
-                # Partial derivative w.r.t. H_from = -1
-                
-                if to_pt in point_index:
-                    A[i, point_index[to_pt]] = 1.0
-                
-                if from_pt in point_index:
-                    A[i, point_index[from_pt]] = -1.0
-                
-                # Weight (inverse of distance in km)
-                dist_km = obs.distance / 1000.0
-                if dist_km > 0:
-                    P[i, i] = 1.0 / dist_km
-                else:
-                    P[i, i] = 1.0
-            
-            # Use AdjustmentComputations for solving with stability checking
-            try:
-                adj_result = self.adj_comp.run_linear_adjustment(
-                    A, L, P, check_stability=self.check_stability
-                )
-                dX = adj_result['X']
-
-                # Store additional info for final iteration
-                if iteration == self.max_iterations or True:  # Always store for last
-                    sigma_0_final = adj_result.get('sigma_0', None)
-                    stability_info = adj_result.get('stability_info', None)
-
-            except SingularMatrixError as e:
-                logger.error(f"Singular matrix in iteration {iteration}: {e}")
-                raise ValueError(f"Singular normal equation matrix: {e}")
-            except Exception as e:
-                logger.error(f"Error solving normal equations: {e}")
-                raise
-            
-            # Apply corrections
-            max_correction = 0.0
-            for j, pid in enumerate(unknown_list):
-                correction = dX[j]
-                current_heights[pid] += correction
-                max_correction = max(max_correction, abs(correction))
-            
-            # Check convergence
-            if max_correction < self.tolerance:
-                logger.info(f"Converged after {iteration} iterations")
-                break
+        # Heights of all observed points as one array in that order. Unknowns
+        # start from their approximate height, or 0 (updated iteratively)
+        heights = np.fromiter(
+            chain(
+                (approximate_heights.get(pid, 0.0) for pid in unknown_list),
+                (fixed_points[pid] for pid in fixed_list)
+            ),
+            dtype=np.float64, count=len(height_ids)
+        )
         
-        # Calculate residuals
-        V = A @ dX - L
+        from_idx = np.fromiter(
+            map(height_index.__getitem__, from_points), dtype=np.intp, count=n_obs
+        )
+        to_idx = np.fromiter(
+            map(height_index.__getitem__, to_points), dtype=np.intp, count=n_obs
+        )
+        return unknown_list, heights, from_idx, to_idx
+    
+    def _build_result(
+        self,
+        iteration: int,
+        unknown_list: List[str],
+        unknown_heights: np.ndarray,
+        fixed_points: Dict[str, float],
+        from_points: Sequence[str],
+        to_points: Sequence[str],
+        V: np.ndarray,
+        weights: np.ndarray,
+        dist_km: np.ndarray,
+        qxx_diag: Optional[np.ndarray]
+    ) -> AdjustmentResult:
+        """
+        Assemble the AdjustmentResult from the adjusted heights and residuals.
+
+        mse_heights is left empty when qxx_diag is None.
+        """
+        adjusted_heights = dict(fixed_points)
+        adjusted_heights.update(zip(unknown_list, unknown_heights.tolist()))
         
         # Calculate M.S.E. of unit weight
-        degrees_of_freedom = n_obs - n_unknowns
+        degrees_of_freedom = V.size - len(unknown_list)
         if degrees_of_freedom > 0:
-            vtpv = V.T @ P @ V
+            vtpv = (V * weights) @ V
             mse_unit_weight = np.sqrt(vtpv / degrees_of_freedom)
         else:
             mse_unit_weight = 0.0
         
-        # Calculate M.S.E. of adjusted heights
-        try:
-            Qxx = np.linalg.inv(N)
+        # Calculate M.S.E. of adjusted heights from diag(Qxx)
+        if qxx_diag is None:
             mse_heights = {}
-            for j, pid in enumerate(unknown_list):
-                mse_heights[pid] = mse_unit_weight * np.sqrt(Qxx[j, j])
-        except:
-            mse_heights = {pid: 0.0 for pid in unknown_list}
+        else:
+            mse_heights = dict(zip(unknown_list,
+                                   (mse_unit_weight * np.sqrt(qxx_diag)).tolist()))
         
         # Calculate classification coefficient K
-        total_dist_km = sum(obs.distance for obs in observations) / 1000.0
-        total_diff_mm = sum(abs(V[i]) * 1000 for i in range(n_obs))
+        total_dist_km = float(dist_km.sum())
+        total_diff_mm = float(np.abs(V).sum()) * 1000
         
         if total_dist_km > 0:
             k_coefficient = total_diff_mm / np.sqrt(total_dist_km)
@@ -248,16 +532,17 @@ class LeastSquaresAdjuster:
             k_coefficient = 0.0
         
         # Build residuals dictionary
-        residuals = {}
-        for i, obs in enumerate(observations):
-            key = f"{obs.from_point}-{obs.to_point}"
-            residuals[key] = V[i] * 1000  # Convert to mm
+        V_mm = V * 1000  # Convert to mm
+        residuals = {
+            f"{from_pt}-{to_pt}": v_mm
+            for from_pt, to_pt, v_mm in zip(from_points, to_points, V_mm)
+        }
         
         # Build result
         result = AdjustmentResult(
             iteration=iteration,
             mse_unit_weight=mse_unit_weight,
-            adjusted_heights=current_heights,
+            adjusted_heights=adjusted_heights,
             residuals=residuals,
             mse_heights=mse_heights,
             total_distance_km=total_dist_km,
@@ -267,6 +552,21 @@ class LeastSquaresAdjuster:
         
         return result
     
+    def _factor_normal_matrix(self, N: np.ndarray):
+        """
+        Stability-check (if enabled) and Cholesky-factor the normal matrix.
+
+        Raises:
+            ValueError: If N is singular
+        """
+        try:
+            if self.check_stability:
+                self.adj_comp.check_matrix_stability(N, "Normal Matrix N")
+            return cho_factor(N, lower=True, check_finite=False)
+        except (SingularMatrixError, np.linalg.LinAlgError) as e:
+            logger.error(f"Singular normal equation matrix: {e}")
+            raise ValueError(f"Singular normal equation matrix: {e}")
+
     def adjust_from_lines(
         self,
         lines: List[LevelingLine],
@@ -282,22 +582,15 @@ class LeastSquaresAdjuster:
         Returns:
             AdjustmentResult
         """
-        # Convert lines to observations
-        observations = []
-        for line in lines:
-            obs = MeasurementSummary(
-                from_point=line.start_point,
-                to_point=line.end_point,
-                height_diff=line.total_height_diff,
-                distance=line.total_distance,
-                num_setups=line.num_setups,
-                bf_diff=0.0,
-                year_month="",
-                source_file=line.filename
-            )
-            observations.append(obs)
-        
-        return self.adjust(observations, fixed_points)
+        return self._adjust_arrays(
+            [line.start_point for line in lines],
+            [line.end_point for line in lines],
+            np.fromiter((line.total_height_diff for line in lines),
+                        dtype=np.float64, count=len(lines)),
+            np.fromiter((line.total_distance for line in lines),
+                        dtype=np.float64, count=len(lines)),
+            fixed_points
+        )
 
 
 class ConditionalAdjuster:
@@ -349,32 +642,21 @@ class ConditionalAdjuster:
         Returns:
             AdjustmentResult with adjusted heights and statistics
         """
-        # Convert lines to observations
-        observations = []
-        for line in lines:
-            obs = MeasurementSummary(
-                from_point=line.start_point,
-                to_point=line.end_point,
-                height_diff=line.total_height_diff,
-                distance=line.total_distance,
-                num_setups=line.num_setups,
-                bf_diff=0.0,
-                year_month="",
-                source_file=line.filename
-            )
-            observations.append(obs)
-
-        n_obs = len(observations)
+        # Line ends, observed height differences and lengths as arrays
+        n_obs = len(lines)
         n_conditions = len(loops)
+        from_points = [line.start_point for line in lines]
+        to_points = [line.end_point for line in lines]
+        observed_dh = np.fromiter(
+            (line.total_height_diff for line in lines), dtype=np.float64, count=n_obs
+        )
+        distances = np.fromiter(
+            (line.total_distance for line in lines), dtype=np.float64, count=n_obs
+        )
 
-        # Build weight matrix P (diagonal, weight = 1/distance in km)
-        P = np.zeros((n_obs, n_obs))
-        for i, obs in enumerate(observations):
-            dist_km = obs.distance / 1000.0
-            if dist_km > 0:
-                P[i, i] = 1.0 / dist_km
-            else:
-                P[i, i] = 1.0
+        # Weights (diagonal of P, weight = 1/distance in km) as a vector
+        dist_km = distances / 1000.0
+        weights = _distance_weights(dist_km)
 
         # Build condition matrix B and misclosure vector w
         B = np.zeros((n_conditions, n_obs))
@@ -387,14 +669,14 @@ class ConditionalAdjuster:
                     # Coefficient is +1 or -1 depending on direction
                     # For now, assume all positive (can be enhanced)
                     B[loop_idx, line_idx] = 1.0
-                    loop_misclosure += observations[line_idx].height_diff
+                    loop_misclosure += observed_dh[line_idx]
 
             w[loop_idx] = loop_misclosure
 
         # Perform conditional adjustment
         try:
             adj_result = self.adj_comp.run_conditional_adjustment(
-                B, w, P, check_stability=self.check_stability
+                B, w, weights, check_stability=self.check_stability
             )
 
             v = adj_result['v']  # Residuals
@@ -408,36 +690,25 @@ class ConditionalAdjuster:
             logger.error(f"Insufficient observations: {e}")
             raise ValueError(f"Insufficient observations for adjustment: {e}")
 
-        # Calculate adjusted observations
-        adjusted_obs = []
-        for i, obs in enumerate(observations):
-            adjusted_dh = obs.height_diff + v[i]
-            adjusted_obs.append({
-                'from_point': obs.from_point,
-                'to_point': obs.to_point,
-                'observed_dh': obs.height_diff,
-                'adjusted_dh': adjusted_dh,
-                'residual': v[i],
-                'distance': obs.distance
-            })
-
-        # Calculate heights if fixed points provided
+        # Calculate heights from the adjusted observations if fixed
+        # points are provided
         if fixed_points:
             heights = self._calculate_heights_from_adjusted(
-                adjusted_obs, fixed_points
+                from_points, to_points, observed_dh + v, distances, fixed_points
             )
         else:
             heights = {}
 
         # Build residuals dictionary
-        residuals = {}
-        for i, obs in enumerate(observations):
-            key = f"{obs.from_point}-{obs.to_point}"
-            residuals[key] = v[i] * 1000  # Convert to mm
+        v_mm = v * 1000  # Convert to mm
+        residuals = {
+            f"{from_pt}-{to_pt}": r_mm
+            for from_pt, to_pt, r_mm in zip(from_points, to_points, v_mm)
+        }
 
         # Calculate statistics
-        total_dist_km = sum(obs.distance for obs in observations) / 1000.0
-        total_diff_mm = sum(abs(v[i]) * 1000 for i in range(n_obs))
+        total_dist_km = float(dist_km.sum())
+        total_diff_mm = float(np.abs(v).sum()) * 1000
 
         if total_dist_km > 0:
             k_coefficient = total_diff_mm / np.sqrt(total_dist_km)
@@ -460,7 +731,10 @@ class ConditionalAdjuster:
 
     def _calculate_heights_from_adjusted(
         self,
-        adjusted_obs: List[Dict],
+        from_points: Sequence[str],
+        to_points: Sequence[str],
+        adjusted_dh: np.ndarray,
+        distances: np.ndarray,
         fixed_points: Dict[str, float]
     ) -> Dict[str, float]:
         """
@@ -469,23 +743,13 @@ class ConditionalAdjuster:
         After conditional adjustment adjusts the observations,
         we can calculate heights using the adjusted observations.
         """
-        # Use parametric adjuster with adjusted observations
-        summaries = []
-        for obs in adjusted_obs:
-            summary = MeasurementSummary(
-                from_point=obs['from_point'],
-                to_point=obs['to_point'],
-                height_diff=obs['adjusted_dh'],
-                distance=obs['distance'],
-                num_setups=1,
-                bf_diff=0.0,
-                year_month="",
-                source_file=""
-            )
-            summaries.append(summary)
-
-        adjuster = LeastSquaresAdjuster(check_stability=False)
-        result = adjuster.adjust(summaries, fixed_points)
+        # The leveling model is linear in the heights, so a single solve
+        # from zero approximate heights is already the least squares
+        # solution; further iterations would only confirm dX ~ 0
+        adjuster = LeastSquaresAdjuster(max_iterations=1, check_stability=False)
+        result = adjuster._adjust_arrays(
+            from_points, to_points, adjusted_dh, distances, fixed_points
+        )
 
         return result.adjusted_heights
 
@@ -504,22 +768,16 @@ def simple_adjustment(
     Returns:
         Dictionary of adjusted heights
     """
-    # Convert to MeasurementSummary
-    summaries = []
-    for obs in observations:
-        summary = MeasurementSummary(
-            from_point=obs['from_point'],
-            to_point=obs['to_point'],
-            height_diff=obs['height_diff'],
-            distance=obs['distance'],
-            num_setups=obs.get('num_setups', 1),
-            bf_diff=0.0,
-            year_month="",
-            source_file=""
-        )
-        summaries.append(summary)
-
+    n_obs = len(observations)
     adjuster = LeastSquaresAdjuster()
-    result = adjuster.adjust(summaries, fixed_points)
+    result = adjuster._adjust_arrays(
+        [obs['from_point'] for obs in observations],
+        [obs['to_point'] for obs in observations],
+        np.fromiter((obs['height_diff'] for obs in observations),
+                    dtype=np.float64, count=n_obs),
+        np.fromiter((obs['distance'] for obs in observations),
+                    dtype=np.float64, count=n_obs),
+        fixed_points
+    )
 
     return result.adjusted_heights
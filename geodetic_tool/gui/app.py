@@ -668,9 +668,10 @@ class ClassSettingsDialog(tk.Toplevel):
 
     def _load_parameters(self):
         """Load and display parameters for all classes."""
-        from ..config.israel_survey_regulations import CLASS_REGISTRY
+        from ..config.israel_survey_regulations import CLASS_REGISTRY, get_class_parameters
 
-        for class_num, params in CLASS_REGISTRY.items():
+        for class_num in sorted(CLASS_REGISTRY):
+            params = get_class_parameters(class_num)
             frame = self.class_frames[class_num].scrollable_frame
 
             # Class header
@@ -793,7 +794,6 @@ class ClassSettingsDialog(tk.Toplevel):
     def _save_changes(self):
         """Save modified parameters to settings file (Item 5)."""
         from ..config import israel_survey_regulations
-        from ..config.israel_survey_regulations import CLASS_REGISTRY
 
         if not self.modified:
             messagebox.showinfo("No Changes", "No changes to save.")
@@ -815,7 +815,7 @@ class ClassSettingsDialog(tk.Toplevel):
                     value = None
 
                 # Update CLASS_REGISTRY
-                setattr(CLASS_REGISTRY[class_num], attr_name, value)
+                israel_survey_regulations.update_class_parameters(class_num, **{attr_name: value})
 
             # Save current parameters to settings file
             success = israel_survey_regulations.save_user_settings()
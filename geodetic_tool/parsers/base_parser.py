@@ -5,10 +5,12 @@ Abstract base class for all file format parsers.
 """
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, List, Tuple
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, List, Tuple, Union
 import logging
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -35,7 +37,7 @@ class BaseParser(ABC):
         self.warnings: List[str] = []
     
     @abstractmethod
-    def parse(self, filepath: str) -> LevelingLine:
+    def parse(self, filepath: Union[str, Path]) -> LevelingLine:
         """
         Parse a file and return a LevelingLine object.
         
@@ -48,7 +50,7 @@ class BaseParser(ABC):
         pass
     
     @abstractmethod
-    def detect_format(self, filepath: str) -> bool:
+    def detect_format(self, filepath: Union[str, Path]) -> bool:
         """
         Check if this parser can handle the given file format.
         
@@ -60,7 +62,7 @@ class BaseParser(ABC):
         """
         pass
     
-    def read_file(self, filepath: str) -> List[str]:
+    def read_file(self, filepath: Union[str, Path]) -> List[str]:
         """
         Read file with automatic encoding detection.
         
@@ -87,11 +89,11 @@ class BaseParser(ABC):
         self.warnings.append(f"Could not detect encoding, used latin-1 with replacements")
         return lines
     
-    def extract_filename(self, filepath: str) -> str:
+    def extract_filename(self, filepath: Union[str, Path]) -> str:
         """Extract just the filename without path or extension."""
         return Path(filepath).stem
     
-    def parse_to_dataframe(self, filepath: str) -> pd.DataFrame:
+    def parse_to_dataframe(self, filepath: Union[str, Path]) -> 'pd.DataFrame':
         """
         Parse file and return as DataFrame.
         
@@ -120,7 +122,7 @@ class BaseParser(ABC):
         self.warnings = []
 
 
-def detect_file_format(filepath: str) -> FileFormat:
+def detect_file_format(filepath: Union[str, Path]) -> FileFormat:
     """
     Detect the format of a geodetic data file.
     
@@ -175,7 +177,7 @@ def detect_file_format(filepath: str) -> FileFormat:
     return FileFormat.UNKNOWN
 
 
-def create_parser(filepath: str) -> Optional[BaseParser]:
+def create_parser(filepath: Union[str, Path]) -> Optional[BaseParser]:
     """
     Factory function to create appropriate parser for a file.
     
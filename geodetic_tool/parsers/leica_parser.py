@@ -26,7 +26,7 @@ Word Indices:
 """
 import re
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple, Any
+from typing import List, Optional, Dict, Tuple, Any, Union
 from datetime import datetime
 import logging
 
@@ -69,7 +69,7 @@ class LeicaParser(BaseParser):
             r'(\d{2,3})\.{0,2}(\d{0,2})([+-])(\d{16})'
         )
         
-    def detect_format(self, filepath: str) -> bool:
+    def detect_format(self, filepath: Union[str, Path]) -> bool:
         """Check if file is Leica GSI format."""
         try:
             lines = self.read_file(filepath)[:10]
@@ -167,7 +167,7 @@ class LeicaParser(BaseParser):
         
         return result
     
-    def parse(self, filepath: str) -> LevelingLine:
+    def parse(self, filepath: Union[str, Path]) -> LevelingLine:
         """
         Parse a Leica GSI file.
         
@@ -314,7 +314,7 @@ class LeicaParser(BaseParser):
         # Validate
         if not is_benchmark(leveling_line.end_point):
             leveling_line.status = LineStatus.INVALID_ENDPOINT
-            leveling_line.validation_errors.append(
+            leveling_line.add_validation_error(
                 f"End point '{leveling_line.end_point}' is a turning point, not a benchmark"
             )
         
@@ -364,7 +364,7 @@ class LeicaParser(BaseParser):
 
 
 # Convenience function
-def parse_leica_gsi(filepath: str) -> LevelingLine:
+def parse_leica_gsi(filepath: Union[str, Path]) -> LevelingLine:
     """
     Parse a Leica GSI file.
     
@@ -11,7 +11,7 @@ File Format:
 """
 import re
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from datetime import datetime
 import logging
 
@@ -44,7 +44,7 @@ class TrimbleParser(BaseParser):
         self.df_pattern = re.compile(r'Df\s+([\d.-]+)\s*m')  # Distance forward
         self.temp_pattern = re.compile(r'([\d.]+)\s*C')      # Temperature
         
-    def detect_format(self, filepath: str) -> bool:
+    def detect_format(self, filepath: Union[str, Path]) -> bool:
         """Check if file is Trimble DAT format."""
         try:
             lines = self.read_file(filepath)[:10]
@@ -55,7 +55,7 @@ class TrimbleParser(BaseParser):
             pass
         return False
     
-    def parse(self, filepath: str) -> LevelingLine:
+    def parse(self, filepath: Union[str, Path]) -> LevelingLine:
         """
         Parse a Trimble DAT file.
         
@@ -211,7 +211,7 @@ class TrimbleParser(BaseParser):
         # Validate end point
         if not is_benchmark(leveling_line.end_point):
             leveling_line.status = LineStatus.INVALID_ENDPOINT
-            leveling_line.validation_errors.append(
+            leveling_line.add_validation_error(
                 f"End point '{leveling_line.end_point}' is a turning point, not a benchmark"
             )
         
@@ -263,7 +263,7 @@ class TrimbleParser(BaseParser):
 
 
 # Convenience function
-def parse_trimble_dat(filepath: str) -> LevelingLine:
+def parse_trimble_dat(filepath: Union[str, Path]) -> LevelingLine:
     """
     Parse a Trimble DAT file.
     
@@ -0,0 +1,156 @@
+"""
+Tests for the least squares solvers.
+"""
+import numpy as np
+import pytest
+
+from geodetic_tool.config.models import MeasurementSummary
+from geodetic_tool.engine.ADJwarnings import SingularMatrixError
+from geodetic_tool.engine.adjustment_computations import AdjustmentComputations
+from geodetic_tool.engine.least_squares import LeastSquaresAdjuster
+
+FIXED = {"BM1": 100.0, "BM2": 101.5}
+
+# (from, to, distance in m) - a small network with two loops
+NETWORK = [
+    ("BM1", "A", 850.0),
+    ("A", "B", 1200.0),
+    ("B", "BM2", 930.0),
+    ("BM1", "C", 1100.0),
+    ("C", "B", 760.0),
+    ("A", "C", 640.0),
+    ("C", "BM2", 1500.0),
+]
+TRUE_HEIGHTS = {"BM1": 100.0, "BM2": 101.5, "A": 100.42, "B": 101.17, "C": 99.86}
+
+
+def make_observations(seed: int):
+    """Observations of NETWORK with millimetre-level noise."""
+    rng = np.random.default_rng(seed)
+    return [
+        MeasurementSummary(
+            from_pt, to_pt,
+            TRUE_HEIGHTS[to_pt] - TRUE_HEIGHTS[from_pt] + rng.normal(0.0, 0.002),
+            dist, 10, 0.0, "0124", "test.dat"
+        )
+        for from_pt, to_pt, dist in NETWORK
+    ]
+
+
+def make_linear_problem(rng, n_obs: int, n_unknowns: int):
+    A = rng.normal(size=(n_obs, n_unknowns))
+    L = A @ rng.normal(size=n_unknowns) + rng.normal(0.0, 0.01, size=n_obs)
+    P = rng.uniform(0.5, 2.0, size=n_obs)
+    return A, L, P
+
+
+def test_rank_deficient_minimum_norm_solution():
+    rng = np.random.default_rng(3)
+    A, L, P = make_linear_problem(rng, 10, 3)
+    # The last column duplicates the first, so N is singular
+    A = np.column_stack([A, A[:, 0]])
+
+    computations = AdjustmentComputations()
+    result = computations.run_linear_adjustment(
+        A, L, P, check_stability=False, allow_rank_deficient=True
+    )
+
+    sqrt_p = np.sqrt(P)
+    expected = np.linalg.pinv(A * sqrt_p[:, None]) @ (L * sqrt_p)
+    np.testing.assert_allclose(result['X'], expected, rtol=1e-9, atol=1e-12)
+    assert result['effective_rank'] == 3
+    # The minimum-norm solution splits the shared parameter evenly
+    assert result['X'][0] == pytest.approx(result['X'][3])
+
+
+@pytest.mark.parametrize("check_stability", [False, True])
+def test_singular_normal_matrix_raises_by_default(check_stability):
+    rng = np.random.default_rng(3)
+    A, L, P = make_linear_problem(rng, 10, 3)
+    A = np.column_stack([A, A[:, 0]])
+
+    with pytest.raises(SingularMatrixError):
+        AdjustmentComputations().run_linear_adjustment(A, L, P, check_stability=check_stability)
+
+
+def test_linear_batch_matches_single_problem_loop():
+    rng = np.random.default_rng(7)
+    # Two stacked groups plus one problem of a unique shape
+    problems = [make_linear_problem(rng, 12, 4) for _ in range(5)]
+    problems += [make_linear_problem(rng, 8, 3) for _ in range(3)]
+    problems.append(make_linear_problem(rng, 9, 5))
+
+    computations = AdjustmentComputations()
+    batch = computations.run_linear_adjustment_batch(problems)
+    assert len(batch) == len(problems)
+    for (A, L, P), result in zip(problems, batch):
+        single = computations.run_linear_adjustment(A, L, P)
+        np.testing.assert_allclose(result['X'], single['X'], rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(result['V'], single['V'], rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(result['std_errors'], single['std_errors'], rtol=1e-10)
+        assert result['sigma_0'] == pytest.approx(single['sigma_0'], rel=1e-10)
+
+
+def test_mixed_precision_matches_f64():
+    rng = np.random.default_rng(11)
+    A, L, P = make_linear_problem(rng, 200, 20)
+
+    computations = AdjustmentComputations()
+    f64 = computations.run_linear_adjustment(A, L, P, precision='f64')
+    mixed = computations.run_linear_adjustment(A, L, P, precision='mixed')
+
+    # Refinement against float64 residuals restores X and V to full accuracy
+    np.testing.assert_allclose(mixed['X'], f64['X'], rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(mixed['V'], f64['V'], rtol=0, atol=1e-10)
+    # N and the standard errors carry float32 precision
+    np.testing.assert_allclose(mixed['std_errors'], f64['std_errors'], rtol=1e-5)
+    assert mixed['N'].dtype == np.float64
+    np.testing.assert_allclose(mixed['N'], f64['N'], rtol=1e-5, atol=1e-4)
+
+
+def test_unknown_precision_is_rejected():
+    A, L, P = make_linear_problem(np.random.default_rng(0), 6, 2)
+    with pytest.raises(ValueError, match="precision"):
+        AdjustmentComputations().run_linear_adjustment(A, L, P, precision='f16')
+
+
+def test_lsmr_heights_match_cholesky():
+    observations = make_observations(1)
+    cholesky = LeastSquaresAdjuster(solver="cholesky").adjust(observations, FIXED)
+    lsmr = LeastSquaresAdjuster(solver="lsmr").adjust(observations, FIXED)
+
+    assert lsmr.adjusted_heights.keys() == cholesky.adjusted_heights.keys()
+    for point_id, height in cholesky.adjusted_heights.items():
+        assert lsmr.adjusted_heights[point_id] == pytest.approx(height, abs=1e-8)
+    assert lsmr.mse_unit_weight == pytest.approx(cholesky.mse_unit_weight, rel=1e-6)
+    assert lsmr.mse_heights == pytest.approx(cholesky.mse_heights, rel=1e-6)
+
+
+def test_unknown_solver_is_rejected():
+    with pytest.raises(ValueError):
+        LeastSquaresAdjuster(solver="qr")
+
+
+@pytest.mark.parametrize("solver", ["cholesky", "lsmr"])
+def test_adjust_batch_matches_adjust(solver):
+    adjuster = LeastSquaresAdjuster(solver=solver)
+    observation_sets = [make_observations(seed) for seed in range(4)]
+
+    batch = adjuster.adjust_batch(observation_sets, FIXED)
+    assert len(batch) == len(observation_sets)
+    for observations, result in zip(observation_sets, batch):
+        single = adjuster.adjust(observations, FIXED)
+        assert result.adjusted_heights.keys() == single.adjusted_heights.keys()
+        for point_id, height in single.adjusted_heights.items():
+            assert result.adjusted_heights[point_id] == pytest.approx(height, abs=1e-8)
+        assert result.mse_heights == pytest.approx(single.mse_heights, rel=1e-6)
+        assert result.mse_unit_weight == pytest.approx(single.mse_unit_weight, rel=1e-6)
+
+
+def test_adjust_batch_rejects_different_networks():
+    observations = make_observations(0)
+    adjuster = LeastSquaresAdjuster()
+    with pytest.raises(ValueError):
+        adjuster.adjust_batch([observations, observations[:-1]], FIXED)
+    with pytest.raises(ValueError):
+        adjuster.adjust_batch([], FIXED)
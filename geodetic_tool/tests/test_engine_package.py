@@ -0,0 +1,51 @@
+"""
+Tests for the lazy geodetic_tool.engine package surface.
+"""
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import geodetic_tool.engine as engine
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_package_import_does_not_load_submodules():
+    code = (
+        "import sys, geodetic_tool.engine as engine\n"
+        "subs = [m for m in sys.modules if m.startswith('geodetic_tool.engine.')]\n"
+        "print(sorted(subs), 'scipy' in sys.modules)\n"
+        "engine.LeastSquaresAdjuster\n"
+        "print('geodetic_tool.engine.least_squares' in sys.modules,\n"
+        "      'geodetic_tool.engine.loop_detector' in sys.modules,\n"
+        "      'LeastSquaresAdjuster' in vars(engine))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.splitlines() == ["[] False", "True False True"]
+
+
+@pytest.mark.parametrize("name", engine.__all__)
+def test_public_names_resolve_without_warning(name, recwarn):
+    module = importlib.import_module(engine._LAZY_IMPORTS[name], engine.__name__)
+    assert getattr(engine, name) is getattr(module, name)
+    assert not [w for w in recwarn if issubclass(w.category, DeprecationWarning)]
+    assert name in dir(engine)
+
+
+@pytest.mark.parametrize("name", sorted(engine._DEPRECATED_IMPORTS))
+def test_former_re_exports_warn(name):
+    module_name = engine._DEPRECATED_IMPORTS[name]
+    module = importlib.import_module(module_name, engine.__name__)
+    with pytest.warns(DeprecationWarning, match=f"geodetic_tool.engine{module_name}"):
+        value = getattr(engine, name)
+    assert value is getattr(module, name)
+    assert name not in engine.__all__
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        engine.no_such_name
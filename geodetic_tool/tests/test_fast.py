@@ -0,0 +1,43 @@
+"""
+Tests for the optional numba kernels in geodetic_tool._fast.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from geodetic_tool import _fast
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_engine_import_does_not_import_numba():
+    code = (
+        "import sys, geodetic_tool.engine.least_squares, geodetic_tool.engine.loop_detector; "
+        "print('numba' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_kernels_match_numpy_fallbacks():
+    rng = np.random.default_rng(0)
+    heights = rng.normal(100.0, 5.0, size=8)
+    to_idx = rng.integers(0, 8, size=20).astype(np.intp)
+    from_idx = rng.integers(0, 8, size=20).astype(np.intp)
+    observed_dh = rng.normal(size=20)
+
+    np.testing.assert_allclose(
+        _fast.height_misclosures(observed_dh, heights, to_idx, from_idx),
+        _fast._height_misclosures_numpy(observed_dh, heights, to_idx, from_idx),
+        rtol=0, atol=1e-12
+    )
+
+    corrections = rng.normal(0.0, 0.01, size=5)
+    compiled, fallback = heights.copy(), heights.copy()
+    assert _fast.apply_height_corrections(compiled, corrections) == \
+        _fast._apply_height_corrections_numpy(fallback, corrections)
+    np.testing.assert_array_equal(compiled, fallback)
+    assert _fast.apply_height_corrections(heights.copy(), np.empty(0)) == 0.0
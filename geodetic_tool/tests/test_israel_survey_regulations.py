@@ -0,0 +1,165 @@
+"""
+Tests for the vectorized class-parameter lookups in israel_survey_regulations.
+
+Every batch helper must agree with the per-class scalar lookups it replaces.
+"""
+import math
+from dataclasses import FrozenInstanceError
+
+import numpy as np
+import pytest
+
+from geodetic_tool.config import israel_survey_regulations as regs
+
+
+@pytest.fixture(autouse=True)
+def builtin_parameters(monkeypatch):
+    """Use the built-in class parameters, not the user's settings file."""
+    monkeypatch.setattr(regs, "_user_settings_loaded", True)
+    saved = [regs.CLASS_REGISTRY[c] for c in range(1, 7)]
+    yield
+    for params in saved:
+        regs._register_class_parameters(params)
+    regs._rebuild_lookup_tables()
+
+
+CLASSES = np.array([1, 2, 3, 4, 5, 6, 3, 1])
+DISTANCES_KM = np.array([1.5, 0.4, 2.0, 12.0, 0.9, 3.0, 30.0, 2.5])
+MISCLOSURES_MM = np.array([3.0, -1.5, 8.0, 5.0, np.nan, -40.0, 2.0, 4.0])
+
+
+def scalar_valid(leveling_class, distance_km, misclosure_mm=None):
+    params = regs.get_class_parameters(int(leveling_class))
+    if params.max_line_length_km is not None and distance_km > params.max_line_length_km:
+        return False
+    if misclosure_mm is None or math.isnan(misclosure_mm):
+        return True
+    return abs(misclosure_mm) <= params.tolerance_coefficient * math.sqrt(distance_km)
+
+
+def test_batch_validate_matches_scalar_checks():
+    length_only = regs.batch_validate(CLASSES, DISTANCES_KM)
+    with_misclosure = regs.batch_validate(CLASSES, DISTANCES_KM, MISCLOSURES_MM)
+
+    assert length_only.tolist() == [
+        scalar_valid(c, d) for c, d in zip(CLASSES, DISTANCES_KM)
+    ]
+    assert not length_only.all()
+    assert with_misclosure.tolist() == [
+        scalar_valid(c, d, m) for c, d, m in zip(CLASSES, DISTANCES_KM, MISCLOSURES_MM)
+    ]
+    # The sample covers both outcomes
+    assert with_misclosure.any() and not with_misclosure.all()
+
+
+@pytest.mark.parametrize("bad_class", [0, 7, 2.5, np.nan])
+def test_batch_validate_rejects_invalid_classes(bad_class):
+    classes = np.array([3.0, bad_class])
+    with pytest.raises(ValueError, match="Invalid leveling class"):
+        regs.batch_validate(classes, np.array([1.0, 1.0]))
+
+
+def test_batch_validate_accepts_integral_float_classes():
+    np.testing.assert_array_equal(
+        regs.batch_validate(CLASSES.astype(np.float64), DISTANCES_KM, MISCLOSURES_MM),
+        regs.batch_validate(CLASSES, DISTANCES_KM, MISCLOSURES_MM)
+    )
+
+
+@pytest.mark.parametrize("min_batch", [regs._NUMBA_MIN_BATCH, 1])
+def test_batch_tolerances_match_scalar_tolerance(monkeypatch, min_batch):
+    # min_batch=1 sends the batch through the compiled kernel when numba is installed
+    monkeypatch.setattr(regs, "_NUMBA_MIN_BATCH", min_batch)
+    tolerances = regs.batch_tolerances_mm(CLASSES, DISTANCES_KM)
+
+    np.testing.assert_allclose(tolerances, [
+        regs.calculate_new_tolerance(d * 1000.0, int(c))
+        for c, d in zip(CLASSES, DISTANCES_KM)
+    ], rtol=1e-12)
+
+
+def test_squared_tolerance_check_agrees_with_tolerances():
+    # batch_validate compares squares; misclosures just inside and just
+    # outside each class tolerance must land on the right side
+    ones = np.ones(CLASSES.size)
+    tolerances = regs.batch_tolerances_mm(CLASSES, ones)
+    assert regs.batch_validate(CLASSES, ones, tolerances * 0.999).all()
+    assert not regs.batch_validate(CLASSES, ones, -tolerances * 1.001).any()
+
+
+def test_misclosure_valid_batch_matches_scalar_tolerance():
+    valid = regs.misclosure_valid_batch(CLASSES, DISTANCES_KM, MISCLOSURES_MM)
+
+    expected = [
+        math.isnan(m) or abs(m) <= regs.calculate_new_tolerance(d * 1000.0, int(c))
+        for c, d, m in zip(CLASSES, DISTANCES_KM, MISCLOSURES_MM)
+    ]
+    assert valid.tolist() == expected
+    # Same answer as batch_validate wherever the line length is within limits
+    in_length = regs.batch_validate(CLASSES, DISTANCES_KM)
+    np.testing.assert_array_equal(
+        valid[in_length], regs.batch_validate(CLASSES, DISTANCES_KM, MISCLOSURES_MM)[in_length]
+    )
+
+
+def test_misclosure_valid_batch_rejects_invalid_classes():
+    with pytest.raises(ValueError, match="Invalid leveling class"):
+        regs.misclosure_valid_batch(np.array([1, 8]), np.ones(2), np.zeros(2))
+
+
+def test_calculate_new_tolerance_batch_matches_scalar():
+    distances_m = DISTANCES_KM * 1000.0
+    np.testing.assert_allclose(
+        regs.calculate_new_tolerance_batch(distances_m, CLASSES),
+        [regs.calculate_new_tolerance(d, int(c)) for c, d in zip(CLASSES, distances_m)],
+        rtol=1e-12
+    )
+
+
+def test_calculate_new_tolerance_accepts_arrays():
+    distances_m = DISTANCES_KM * 1000.0
+    np.testing.assert_allclose(
+        regs.calculate_new_tolerance(distances_m, 2),
+        [regs.calculate_new_tolerance(d, 2) for d in distances_m],
+        rtol=1e-12
+    )
+    assert regs.calculate_new_tolerance(1000.0, 4) == \
+        regs.get_class_parameters(4).tolerance_coefficient
+
+
+@pytest.mark.parametrize("leveling_class", [3, 3.0, np.int64(3), np.float64(3)])
+def test_integral_class_numbers_are_accepted(leveling_class):
+    assert regs.get_class_parameters(leveling_class) is regs.get_class_parameters(3)
+    assert regs.calculate_new_tolerance(1000.0, leveling_class) == \
+        regs.calculate_new_tolerance(1000.0, 3)
+
+
+@pytest.mark.parametrize("leveling_class", [0, 7, 3.5, "3", None, np.nan])
+def test_invalid_class_numbers_are_rejected(leveling_class):
+    with pytest.raises(ValueError, match="Invalid leveling class"):
+        regs.get_class_parameters(leveling_class)
+
+
+def test_update_class_parameters_replaces_the_registered_class():
+    original = regs.get_class_parameters(3)
+    assert regs.get_class_parameters_by_name("h3") is original  # fills the name cache
+
+    updated = regs.update_class_parameters(3, tolerance_coefficient=7.5, max_line_length_km=30.0)
+
+    assert updated is not original
+    assert original.tolerance_coefficient != 7.5  # instances are immutable
+    assert regs.get_class_parameters(3) is updated
+    assert regs.CLASS_REGISTRY_BY_NAME["H3"] is updated
+    assert regs.get_class_parameters_by_name("H3") is updated
+    # The lookup tables follow the registry
+    assert regs.calculate_new_tolerance(1000.0, 3) == 7.5
+    assert regs.batch_validate(np.array([3]), np.array([28.0])).tolist() == [True]
+
+
+def test_update_class_parameters_rejects_non_editable_fields():
+    with pytest.raises(ValueError, match="class_name"):
+        regs.update_class_parameters(3, class_name="H9")
+    with pytest.raises(ValueError):
+        regs.update_class_parameters(9, tolerance_coefficient=1.0)
+    with pytest.raises(FrozenInstanceError):
+        regs.get_class_parameters(3).tolerance_coefficient = 1.0
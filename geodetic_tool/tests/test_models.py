@@ -0,0 +1,73 @@
+"""
+Tests for the project data models.
+"""
+import numpy as np
+
+from geodetic_tool.config.models import (
+    STATUS_CODES, Benchmark, LevelingLine, LineStatus, ProjectData
+)
+
+
+def make_benchmarks_project() -> ProjectData:
+    project = ProjectData(name="Benchmarks")
+    project.add_benchmark(Benchmark("BM1", 100.0, easting=200000.0, northing=600000.0))
+    project.add_benchmark(Benchmark("BM2", 101.5))
+    return project
+
+
+def test_bm_arrays_are_parallel():
+    project = make_benchmarks_project()
+
+    assert project.bm_ids.tolist() == ["BM1", "BM2"]
+    np.testing.assert_array_equal(project.bm_heights, [100.0, 101.5])
+    np.testing.assert_array_equal(project.bm_eastings, [200000.0, np.nan])
+    np.testing.assert_array_equal(project.bm_northings, [600000.0, np.nan])
+    # Cached between calls while the benchmarks are unchanged
+    assert project.bm_heights is project.bm_heights
+
+
+def test_bm_arrays_follow_direct_dict_changes():
+    project = make_benchmarks_project()
+    project.bm_heights
+
+    project.benchmarks["BM2"] = Benchmark("BM2", 102.0)
+    np.testing.assert_array_equal(project.bm_heights, [100.0, 102.0])
+
+    del project.benchmarks["BM1"]
+    assert project.bm_ids.tolist() == ["BM2"]
+
+    project.benchmarks = {"BM3": Benchmark("BM3", 99.0)}
+    assert project.bm_ids.tolist() == ["BM3"]
+    np.testing.assert_array_equal(project.bm_heights, [99.0])
+
+
+def test_bm_arrays_follow_add_and_merge():
+    project = make_benchmarks_project()
+    project.bm_ids
+
+    project.add_benchmark(Benchmark("BM3", 99.0))
+    assert project.bm_ids.tolist() == ["BM1", "BM2", "BM3"]
+
+    other = ProjectData(name="Other")
+    other.add_benchmark(Benchmark("BM4", 98.0))
+    project.merge_from(other)
+    np.testing.assert_array_equal(project.bm_heights, [100.0, 101.5, 99.0, 98.0])
+
+
+def test_status_codes_follow_line_status():
+    project = ProjectData(name="Statuses")
+    statuses = [LineStatus.VALID, LineStatus.EXCEEDED_TOLERANCE, LineStatus.VALID,
+                LineStatus.MERGED, LineStatus.INCOMPLETE]
+    for i, status in enumerate(statuses):
+        line = LevelingLine(filename=f"L{i}.DAT", start_point="A", end_point="B")
+        line.status = status
+        project.add_line(line)
+
+    codes = project.status_codes()
+    assert codes.dtype == np.int8
+    assert codes.tolist() == [STATUS_CODES[status.value] for status in statuses]
+    valid = codes == STATUS_CODES[LineStatus.VALID.value]
+    assert valid.tolist() == [status is LineStatus.VALID for status in statuses]
+    # One distinct code per status
+    assert sorted(STATUS_CODES.values()) == list(range(len(LineStatus)))
+    assert ProjectData(name="Empty").status_codes().size == 0
@@ -0,0 +1,172 @@
+"""
+Tests for project JSON persistence across schema versions.
+
+Version 1 files store setups as row objects, version 2 as columns and
+version 3 (current) packs the booleans into "flags" integers; all three
+must load into the same project.
+"""
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from geodetic_tool.config.models import (
+    Benchmark, LevelingLine, ProjectData, StationSetup
+)
+from geodetic_tool.config.project_manager import (
+    FLAG_DIRECTION_FB, FLAG_USED, SCHEMA_VERSION, ProjectManager, _SETUP_JSON_FIELDS
+)
+
+
+def make_project() -> ProjectData:
+    """Two-line project covering the optional and boolean fields."""
+    project = ProjectData(name="Schema test")
+    line1 = LevelingLine(
+        filename="KMA58_DAT.txt", start_point="5793MPI", end_point="5792MPI",
+        setups=[
+            StationSetup(1, "5793MPI", "1", 1.49087, 1.80319, 28.99, 35.774,
+                         temperature=21.5, height_diff=-0.31232),
+            StationSetup(2, "1", "5792MPI", 1.2, 1.1, 30.0, 30.5,
+                         height_diff=None, is_used=False),
+        ],
+        method="BF", date=datetime(2024, 3, 1, 8, 30),
+        instrument_id="DNA03", total_distance=62.632, total_height_diff=-0.31232
+    )
+    line2 = LevelingLine(
+        filename="KMA59_DAT.txt", start_point="5792MPI", end_point="5793MPI",
+        setups=[StationSetup(1, "5792MPI", "5793MPI", 1.7, 1.4, 40.0, 41.0,
+                             height_diff=0.3)],
+        method="FB", total_distance=40.5, total_height_diff=0.3,
+        is_used=False, original_direction="FB"
+    )
+    project.add_line(line1)
+    project.add_line(line2)
+    project.add_benchmark(Benchmark(point_id="5793MPI", height=12.345, order=2,
+                                    description="MPI", easting=1.0, northing=2.0))
+    return project
+
+
+def line_record(line: LevelingLine) -> dict:
+    """Fields of a line that survive a save/load round trip."""
+    return {
+        'filename': line.filename, 'start_point': line.start_point,
+        'end_point': line.end_point, 'method': line.method, 'date': line.date,
+        'instrument_id': line.instrument_id, 'total_distance': line.total_distance,
+        'total_height_diff': line.total_height_diff, 'is_used': line.is_used,
+        'original_direction': line.original_direction,
+        'setups': [
+            (s.setup_number, s.from_point, s.to_point, s.backsight_reading,
+             s.foresight_reading, s.distance_back, s.distance_fore,
+             s.temperature, s.height_diff, s.is_used)
+            for s in line.setups
+        ],
+    }
+
+
+def assert_same_project(loaded: ProjectData, expected: ProjectData):
+    assert loaded.name == expected.name
+    assert [line_record(l) for l in loaded.lines] == [line_record(l) for l in expected.lines]
+    assert loaded.benchmarks == expected.benchmarks
+
+
+def legacy_document(project: ProjectData, version: int) -> dict:
+    """The project as a version 1 or 2 JSON document."""
+    lines = []
+    for line in project.lines:
+        setup_rows = [
+            {name: getattr(s, name) for name in _SETUP_JSON_FIELDS + ('is_used',)}
+            for s in line.setups
+        ]
+        if version == 1:
+            setups = setup_rows
+        else:
+            setups = {name: [row[name] for row in setup_rows]
+                      for name in _SETUP_JSON_FIELDS + ('is_used',)}
+        lines.append({
+            'filename': line.filename, 'start_point': line.start_point,
+            'end_point': line.end_point, 'method': line.method,
+            'date': line.date.isoformat() if line.date else None,
+            'instrument_id': line.instrument_id,
+            'total_distance': line.total_distance,
+            'total_height_diff': line.total_height_diff,
+            'is_used': line.is_used,
+            'original_direction': line.original_direction,
+            'setups': setups,
+        })
+    document = {
+        'name': project.name,
+        'is_joint_project': project.is_joint_project,
+        'source_projects': project.source_projects,
+        'created': datetime(2024, 1, 1).isoformat(),
+        'lines': lines,
+        'benchmarks': {
+            point_id: {'point_id': bm.point_id, 'height': bm.height, 'order': bm.order,
+                       'description': bm.description, 'easting': bm.easting,
+                       'northing': bm.northing}
+            for point_id, bm in project.benchmarks.items()
+        },
+    }
+    if version > 1:
+        document['schema_version'] = version
+    return document
+
+
+@pytest.mark.parametrize("human_readable", [False, True])
+def test_json_round_trip(tmp_path, human_readable):
+    manager = ProjectManager(str(tmp_path))
+    path = manager.save_project(make_project(), format="json", human_readable=human_readable)
+
+    data = json.loads(open(path, encoding="utf-8").read())
+    assert data['schema_version'] == SCHEMA_VERSION == 3
+    assert isinstance(data['lines'][0]['setups'], dict)  # column-wise
+    # Booleans travel as flag bits
+    assert [line['flags'] for line in data['lines']] == [FLAG_USED, FLAG_DIRECTION_FB]
+    assert data['lines'][0]['setups']['flags'] == [FLAG_USED, 0]
+    assert 'is_used' not in data['lines'][0]
+    assert_same_project(manager.load_project(path), make_project())
+
+
+@pytest.mark.parametrize("version", [1, 2])
+def test_json_loads_legacy_schema(tmp_path, version):
+    path = tmp_path / f"legacy_v{version}.json"
+    path.write_text(json.dumps(legacy_document(make_project(), version)), encoding="utf-8")
+
+    loaded = ProjectManager(str(tmp_path)).load_project(str(path))
+    assert_same_project(loaded, make_project())
+
+
+def test_legacy_project_resaved_in_current_schema(tmp_path):
+    manager = ProjectManager(str(tmp_path))
+    path = tmp_path / "legacy_v1.json"
+    path.write_text(json.dumps(legacy_document(make_project(), 1)), encoding="utf-8")
+
+    project = manager.load_project(str(path))
+    project.project_path = None
+    resaved = manager.save_project(project, format="json")
+    assert_same_project(manager.load_project(resaved), make_project())
+
+
+def test_list_projects_sees_files_added_outside_save(tmp_path):
+    manager = ProjectManager(str(tmp_path))
+    saved = manager.save_project(make_project(), format="json")
+    assert [p['name'] for p in manager.list_projects()] == ["Schema test"]
+
+    # Copied in by hand
+    document = legacy_document(make_project(), 2)
+    document['name'] = "Copied in"
+    (tmp_path / "copied.json").write_text(json.dumps(document), encoding="utf-8")
+    assert sorted(p['name'] for p in manager.list_projects()) == ["Copied in", "Schema test"]
+
+    # Replaced by hand (e.g. from a backup)
+    document['name'] = "Restored"
+    copied = tmp_path / "copied.json"
+    mtime_ns = copied.stat().st_mtime_ns
+    copied.write_text(json.dumps(document), encoding="utf-8")
+    # Coarse file-system clocks can leave mtime unchanged within one tick
+    os.utime(copied, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+    assert sorted(p['name'] for p in manager.list_projects()) == ["Restored", "Schema test"]
+
+    # Deleted by hand
+    os.remove(saved)
+    assert [p['name'] for p in manager.list_projects()] == ["Restored"]
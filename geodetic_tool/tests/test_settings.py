@@ -0,0 +1,72 @@
+"""
+Tests for the point-ID checks and tolerance helpers in geodetic_tool.config.settings.
+"""
+import re
+
+import numpy as np
+import pytest
+
+from geodetic_tool.config import settings as settings_module
+from geodetic_tool.config.settings import (
+    _DEFAULT_BENCHMARK_PATTERN, _DEFAULT_TURNING_POINT_PATTERN,
+    _is_benchmark, calculate_tolerance, calculate_tolerances, clear_point_id_caches,
+    is_benchmark, is_turning_point
+)
+
+POINT_IDS = [
+    "5793MPI", "MPI", "a1", "1234", "0", "  42  ", " BM7 ", "12-3", "12.5",
+    "١٢", "אב", "Z", "", "_", "1 2",
+]
+
+
+@pytest.mark.parametrize("point_id", POINT_IDS)
+def test_default_checks_match_the_default_patterns(point_id):
+    stripped = point_id.strip()
+    assert is_benchmark(point_id) == bool(point_id and _DEFAULT_BENCHMARK_PATTERN.match(stripped))
+    assert is_turning_point(point_id) == bool(
+        point_id and _DEFAULT_TURNING_POINT_PATTERN.match(stripped))
+
+
+def test_custom_patterns_use_the_regex(monkeypatch):
+    validation = settings_module.settings.validation
+    monkeypatch.setattr(validation, "benchmark_pattern", re.compile(r"^BM\d+$"))
+    monkeypatch.setattr(validation, "turning_point_pattern", re.compile(r"^TP\d+$"))
+
+    assert is_benchmark(" BM7 ")
+    assert not is_benchmark("5793MPI")
+    assert is_turning_point("TP3")
+    assert not is_turning_point("1234")
+
+
+def test_point_id_checks_are_memoized():
+    clear_point_id_caches()
+    assert _is_benchmark.cache_info().currsize == 0
+
+    for _ in range(3):
+        assert is_benchmark("5793MPI")
+    info = _is_benchmark.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+    clear_point_id_caches()
+    assert _is_benchmark.cache_info().currsize == 0
+
+
+def test_pattern_change_is_not_served_from_the_cache(monkeypatch):
+    assert is_benchmark("5793MPI")
+    monkeypatch.setattr(settings_module.settings.validation,
+                        "benchmark_pattern", re.compile(r"^BM"))
+    assert not is_benchmark("5793MPI")
+    monkeypatch.undo()
+    assert is_benchmark("5793MPI")
+
+
+@pytest.mark.parametrize("leveling_class", [None, 1, 2, 3, 4, 6])
+def test_calculate_tolerances_matches_scalar(leveling_class):
+    distances_m = [0.0, 250.0, 1000.0, 4321.5, 25000.0]
+    tolerances = calculate_tolerances(distances_m, leveling_class)
+
+    assert isinstance(tolerances, np.ndarray)
+    np.testing.assert_allclose(
+        tolerances, [calculate_tolerance(d, leveling_class) for d in distances_m], rtol=1e-12
+    )
+    assert isinstance(calculate_tolerance(1000.0, leveling_class), float)
@@ -0,0 +1,85 @@
+"""
+Tests for the persistent settings file.
+"""
+import json
+
+import pytest
+
+from geodetic_tool.config.settings_manager import SettingsManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return SettingsManager(settings_file=tmp_path / "settings.json")
+
+
+def write_settings(manager: SettingsManager, default_class: str, pad: str = ""):
+    manager.settings_file.write_text(json.dumps({
+        "version": "1.0",
+        "format": "geodetic_tool_class_parameters",
+        "default_class": default_class,
+        "class_parameters": {},
+        "note": pad,
+    }), encoding="utf-8")
+
+
+def stored_default_class(manager: SettingsManager) -> str:
+    return json.loads(manager.settings_file.read_text(encoding="utf-8"))["default_class"]
+
+
+def test_default_class_without_file(manager):
+    assert manager.get_default_class() == "H3"
+    assert manager.set_default_class("H3")
+    assert stored_default_class(manager) == "H3"
+
+
+def test_default_class_follows_file_edited_elsewhere(manager):
+    assert manager.set_default_class("H2")
+    assert manager.get_default_class() == "H2"
+
+    # Another process (or a restored backup) changes the file
+    write_settings(manager, "H5", pad="edited elsewhere")
+    assert manager.get_default_class() == "H5"
+
+    # Setting the class cached earlier must still write it
+    assert manager.set_default_class("H2")
+    assert stored_default_class(manager) == "H2"
+
+
+def test_save_class_parameters_keeps_default_class_on_disk(manager):
+    assert manager.set_default_class("H1")
+    manager.get_default_class()
+    write_settings(manager, "H4", pad="restored from backup")
+
+    assert manager.save_class_parameters({"H1": {"tolerance_coefficient": 3.0}})
+    assert stored_default_class(manager) == "H4"
+    assert manager.load_class_parameters() == {"H1": {"tolerance_coefficient": 3.0}}
+
+
+def test_set_default_class_rejects_unknown_class(manager):
+    assert not manager.set_default_class("H7")
+    assert not manager.settings_file.exists()
+
+
+def test_set_default_class_skips_write_when_unchanged(manager):
+    assert manager.set_default_class("H2")
+    before = manager.settings_file.stat().st_mtime_ns
+    assert manager.set_default_class("H2")
+    assert manager.settings_file.stat().st_mtime_ns == before
+
+
+def test_settings_are_written_atomically(manager, monkeypatch):
+    assert manager.save_class_parameters({"H3": {"tolerance_coefficient": 8.0}})
+    assert [p.name for p in manager.settings_dir.iterdir()] == ["settings.json"]
+    original = manager.settings_file.read_bytes()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("geodetic_tool.config.settings_manager.os.replace", failing_replace)
+    assert not manager.save_class_parameters({"H3": {"tolerance_coefficient": 9.0}})
+    assert not manager.set_default_class("H5")
+
+    # The old file is untouched and the temporary file is cleaned up
+    assert manager.settings_file.read_bytes() == original
+    assert [p.name for p in manager.settings_dir.iterdir()] == ["settings.json"]
@@ -0,0 +1,63 @@
+"""
+Tests for the vectorized line pre-screen in geodetic_tool.validators.
+"""
+import math
+
+import pytest
+
+from geodetic_tool.config import israel_survey_regulations as regs
+from geodetic_tool.config.models import LevelingLine
+from geodetic_tool.validators import validate_batch_vec
+
+
+@pytest.fixture(autouse=True)
+def builtin_parameters(monkeypatch):
+    """Use the built-in class parameters and H3 as the default class."""
+    monkeypatch.setattr(regs, "_user_settings_loaded", True)
+    monkeypatch.setattr("geodetic_tool.validators.get_default_class", lambda: "H3")
+
+
+def make_line(number: int, distance_m: float, misclosure_mm=None) -> LevelingLine:
+    line = LevelingLine(filename=f"line{number}.DAT", start_point="A", end_point="B",
+                        total_distance=distance_m)
+    line.misclosure = misclosure_mm
+    return line
+
+
+def expected_pass(line: LevelingLine, leveling_class: int) -> bool:
+    params = regs.get_class_parameters(leveling_class)
+    dist_km = line.total_distance / 1000.0
+    if params.max_line_length_km is not None and dist_km > params.max_line_length_km:
+        return False
+    if line.misclosure is None:
+        return True
+    return line.misclosure <= params.tolerance_coefficient * math.sqrt(dist_km)
+
+
+LINES = [
+    make_line(1, 2500.0, 4.0),
+    make_line(2, 2500.0, 20.0),   # over the H3 tolerance
+    make_line(3, 30000.0),        # over the H3 line length, misclosure unknown
+    make_line(4, 800.0),
+    make_line(5, 6000.0, 3.0),    # over the H5/H6 line length
+]
+
+
+@pytest.mark.parametrize("leveling_class", [1, 3, 5])
+def test_validate_batch_vec_matches_per_line_rules(leveling_class):
+    pass_mask, failing = validate_batch_vec(LINES, leveling_class)
+
+    expected = [expected_pass(line, leveling_class) for line in LINES]
+    assert pass_mask.tolist() == expected
+    assert failing.tolist() == [i for i, ok in enumerate(expected) if not ok]
+
+
+def test_validate_batch_vec_uses_default_class():
+    pass_mask, failing = validate_batch_vec(LINES)
+    assert pass_mask.tolist() == validate_batch_vec(LINES, 3)[0].tolist()
+    assert failing.tolist() == [1, 2]
+
+
+def test_validate_batch_vec_empty():
+    pass_mask, failing = validate_batch_vec([], 3)
+    assert pass_mask.size == 0 and failing.size == 0
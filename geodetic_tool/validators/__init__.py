@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import List, Optional, Tuple
 import logging
 
+import numpy as np
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -20,7 +22,7 @@ from ..config.settings import (
 )
 from ..config.israel_survey_regulations import (
     get_class_parameters, calculate_new_tolerance, MeasurementType,
-    get_default_class, get_class_parameters_by_name
+    get_default_class, get_class_parameters_by_name, batch_validate
 )
 
 
@@ -441,6 +443,40 @@ class BatchValidator:
         }
 
 
+def validate_batch_vec(
+    lines: List[LevelingLine],
+    leveling_class: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized numeric pre-screen of many leveling lines.
+
+    Checks line length and (where known) misclosure tolerance for all lines
+    with NumPy array operations instead of a Python call per line. Unlike
+    LevelingValidator, every line is checked against the same class; there
+    is no method-based auto-classification.
+
+    Args:
+        lines: List of LevelingLine objects
+        leveling_class: Accuracy class (1-6), if None uses user's default class setting
+
+    Returns:
+        Tuple of (pass_mask, failing_indices)
+    """
+    if leveling_class is None:
+        leveling_class = int(get_default_class()[1])  # "H3" -> 3
+
+    n = len(lines)
+    dist_km = np.fromiter((l.total_distance for l in lines), dtype=np.float64, count=n) / 1000.0
+    misclosure_mm = np.fromiter(
+        (np.nan if l.misclosure is None else l.misclosure for l in lines),
+        dtype=np.float64, count=n
+    )
+    class_idx = np.full(n, leveling_class, dtype=np.intp)
+
+    pass_mask = batch_validate(class_idx, dist_km, misclosure_mm)
+    return pass_mask, np.flatnonzero(~pass_mask)
+
+
 def validate_line(line: LevelingLine) -> ValidationResult:
     """
     Convenience function to validate a single leveling line.
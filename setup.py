@@ -7,6 +7,7 @@ setup(
     install_requires=[
         "pandas>=1.3.0",
         "numpy>=1.20.0",
+        "scipy>=1.9.0",
     ],
     entry_points={
         "console_scripts": [